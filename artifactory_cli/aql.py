@@ -0,0 +1,169 @@
+import csv
+import json
+import queue
+import threading
+
+from artifactory_cli import controls
+
+
+DOMAINS = ("items", "builds", "entries", "artifacts", "dependencies", "modules", "properties", "releases")
+
+# Rows handed from the fetching thread to the writer in batches of this size
+BATCH_SIZE = 500
+
+# Batches buffered between the two threads; bounds memory regardless of result size
+MAX_BATCHES = 8
+
+# Sort used for stable paging of items when no sort is given
+DEFAULT_SORT = ("repo", "path", "name")
+
+_DONE = object()
+
+
+def build_query(criteria, domain="items", include=None, sort=None, descending=False, offset=None, limit=None):
+    """
+    Builds AQL text, e.g. items.find({...}).include("name").sort({"$asc": ["name"]}).offset(0).limit(10).
+
+    Args:
+        criteria (dict): The find() criteria.
+        domain (str): Primary domain, e.g. "items" or "builds".
+        include (list): Fields to return, to shrink the payload.
+        sort (list): Fields to sort by.
+        descending (bool): Sort descending instead of ascending.
+        offset (int): Rows to skip.
+        limit (int): Maximum rows to return.
+
+    Returns:
+        str: The AQL query.
+    """
+    if domain not in DOMAINS:
+        raise ValueError(f"Unknown AQL domain '{domain}'. Use one of: {', '.join(DOMAINS)}")
+
+    query = f"{domain}.find({json.dumps(criteria or {})})"
+    if include:
+        query += f".include({', '.join(json.dumps(field) for field in include)})"
+    if sort:
+        query += f".sort({json.dumps({'$desc' if descending else '$asc': list(sort)})})"
+    if offset:
+        query += f".offset({int(offset)})"
+    if limit is not None:
+        query += f".limit({int(limit)})"
+    return query
+
+
+def iter_results(criteria, domain="items", include=None, sort=None, descending=False, page_size=10000, limit=None):
+    """
+    Streams every row matching criteria, paging with offset()/limit().
+
+    Pages are fetched and parsed on a background thread that starts on the
+    next page as soon as the current one is parsed, while the caller is
+    still consuming rows. Rows pass through a small bounded buffer, so
+    memory use does not grow with the size of the result set.
+
+    Args:
+        criteria (dict): The find() criteria.
+        domain (str): Primary domain.
+        include (list): Fields to return.
+        sort (list): Fields to sort by. Paging over items defaults to
+            repo/path/name so pages are stable; those fields are added to
+            include for the query and left out of the rows again.
+        descending (bool): Sort descending.
+        page_size (int): Rows per request.
+        limit (int): Stop after this many rows.
+
+    Yields:
+        dict: Result rows in order.
+
+    Raises:
+        Exception: If a page request fails.
+    """
+    hidden = ()
+    if sort is None and domain == "items":
+        # Without an order, offset/limit pages can repeat or skip rows; AQL only sorts on included fields
+        sort = list(DEFAULT_SORT)
+        if include:
+            hidden = [field for field in DEFAULT_SORT if field not in include]
+            include = list(include) + hidden
+
+    batches = queue.Queue(maxsize=MAX_BATCHES)
+    stop = threading.Event()
+
+    def put(item):
+        # Give up once the consumer has gone away instead of blocking forever
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            fetched = 0
+            while limit is None or fetched < limit:
+                size = page_size if limit is None else min(page_size, limit - fetched)
+                count = 0
+                batch = []
+                query = build_query(criteria, domain, include, sort, descending, fetched, size)
+                for row in controls.iter_aql_control(query):
+                    for field in hidden:
+                        row.pop(field, None)
+                    batch.append(row)
+                    count += 1
+                    if len(batch) == BATCH_SIZE:
+                        if not put(batch):
+                            return
+                        batch = []
+                if batch and not put(batch):
+                    return
+                fetched += count
+                if count < size:
+                    break
+        except Exception as e:
+            put(e)
+        finally:
+            put(_DONE)
+
+    thread = threading.Thread(target=produce, name="artifactory-cli-aql", daemon=True)
+    thread.start()
+    try:
+        while True:
+            batch = batches.get()
+            if batch is _DONE:
+                return
+            if isinstance(batch, Exception):
+                raise batch
+            yield from batch
+    finally:
+        stop.set()
+
+
+def write_jsonl(rows, handle):
+    """
+    Writes rows as JSON lines. Returns the number of rows written.
+    """
+    count = 0
+    for row in rows:
+        handle.write(json.dumps(row))
+        handle.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(rows, handle, fields=None):
+    """
+    Writes rows as CSV. Columns are fields, or the keys of the first row.
+    Nested values (e.g. properties) are written as JSON. Returns the number
+    of rows written.
+    """
+    writer = None
+    count = 0
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(handle, fieldnames=list(fields or row), extrasaction="ignore")
+            writer.writeheader()
+        writer.writerow({name: json.dumps(value) if isinstance(value, (dict, list)) else value
+                         for name, value in row.items()})
+        count += 1
+    return count
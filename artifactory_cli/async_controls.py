@@ -0,0 +1,215 @@
+import asyncio
+import contextvars
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from artifactory_cli import client, controls
+
+
+# Maximum number of requests in flight at once across all async calls
+concurrency = 50
+
+_executor = None
+_executor_lock = threading.Lock()
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def set_concurrency(limit):
+    """
+    Sets the maximum number of in-flight requests and grows the HTTP
+    connection pool so every worker can keep its own connection alive.
+
+    Args:
+        limit (int): Maximum concurrent requests.
+    """
+    global concurrency, _executor
+
+    if limit < 1:
+        raise ValueError("Concurrency must be at least 1.")
+
+    with _executor_lock:
+        concurrency = limit
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+    _semaphores.clear()
+    if client.pool_size < limit:
+        client.configure_session(pool_size=limit)
+
+
+def _get_executor():
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                if client.pool_size < concurrency:
+                    client.configure_session(pool_size=concurrency)
+                _executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="artifactory-cli")
+    return _executor
+
+
+def _get_semaphore():
+    # asyncio primitives are bound to one event loop, so keep one per loop
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(concurrency)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+async def run_control(func, *args, **kwargs):
+    """
+    Runs a blocking control function on the worker pool without blocking
+    the event loop, limited by the shared concurrency semaphore.
+
+    Args:
+        func (callable): A control function, e.g. controls.delete_user_control.
+        *args, **kwargs: Arguments for func.
+
+    Returns:
+        Whatever func returns. Exceptions raised by func propagate.
+    """
+    async with _get_semaphore():
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        return await loop.run_in_executor(_get_executor(), call)
+
+
+def run_concurrently(calls, return_exceptions=True):
+    """
+    Runs many control calls concurrently from synchronous code.
+
+    Args:
+        calls (iterable): (func, args) or (func, args, kwargs) tuples.
+        return_exceptions (bool): Return raised exceptions in place of results.
+
+    Returns:
+        list: Results in the same order as calls.
+    """
+    async def _gather():
+        tasks = []
+        for call in calls:
+            func, args, kwargs = (tuple(call) + ({},))[:3]
+            tasks.append(run_control(func, *args, **kwargs))
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+    return asyncio.run(_gather())
+
+
+def run_each(func, items, workers=None, on_result=None):
+    """
+    Calls func(*item) for every item of a possibly lazy iterable, keeping at
+    most `workers` calls in flight. Items are pulled only as workers free
+    up, so a long input is never materialized.
+
+    Args:
+        func (callable): Blocking function, e.g. a control function.
+        items (iterable): Argument tuples for func.
+        workers (int): Number of parallel workers (defaults to the concurrency setting).
+        on_result (callable): Called as on_result(item, result) in completion
+            order; result is the exception instance if func raised.
+
+    Raises:
+        Exception: Whatever on_result or the items iterable raised. The
+            remaining workers are cancelled first, so a failing callback
+            (e.g. a journal write on a full disk) stops the run instead of
+            leaving the feeder waiting on workers that are gone.
+    """
+    workers = workers or concurrency
+    if workers > concurrency:
+        set_concurrency(workers)
+
+    async def _run():
+        queue = asyncio.Queue(maxsize=workers * 2)
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                try:
+                    result = await run_control(func, *item)
+                except Exception as e:
+                    result = e
+                if on_result:
+                    on_result(item, result)
+
+        async def feed():
+            for item in items:
+                await queue.put(tuple(item))
+            for _ in range(workers):
+                await queue.put(None)
+
+        tasks = [asyncio.create_task(feed())] + [asyncio.create_task(worker()) for _ in range(workers)]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            if not task.cancelled() and task.exception():
+                raise task.exception()
+
+    asyncio.run(_run())
+
+
+async def ping_system_control_async():
+    return await run_control(controls.ping_system_control)
+
+
+async def get_system_version_control_async():
+    return await run_control(controls.get_system_version_control)
+
+
+async def get_storage_info_control_async():
+    return await run_control(controls.get_storage_info_control)
+
+
+async def list_users_control_async():
+    return await run_control(controls.list_users_control)
+
+
+async def list_repositories_control_async(repo_type=None, package_type=None):
+    return await run_control(controls.list_repositories_control, repo_type, package_type)
+
+
+async def create_user_control_async(username, email, password, admin=False):
+    return await run_control(controls.create_user_control, username, email, password, admin)
+
+
+async def delete_user_control_async(username):
+    return await run_control(controls.delete_user_control, username)
+
+
+async def create_repository_control_async(repo_key, repo_type, package_type, remote_url=None, settings=None):
+    return await run_control(controls.create_repository_control, repo_key, repo_type, package_type, remote_url, settings)
+
+
+async def update_repository_control_async(repo_key, updates):
+    return await run_control(controls.update_repository_control, repo_key, updates)
+
+
+async def get_repository_config_control_async(repo_key):
+    return await run_control(controls.get_repository_config_control, repo_key)
+
+
+async def upload_artifact_control_async(repo_key, local_path, target_path, checksum_deploy=True, checksums=None):
+    return await run_control(controls.upload_artifact_control, repo_key, local_path, target_path, checksum_deploy, checksums)
+
+
+async def get_artifact_info_control_async(repo_key, path):
+    return await run_control(controls.get_artifact_info_control, repo_key, path)
+
+
+async def delete_artifact_control_async(repo_key, path, missing_ok=False):
+    return await run_control(controls.delete_artifact_control, repo_key, path, missing_ok)
+
+
+async def login_control_async(username, password, use_cache=True):
+    return await run_control(controls.login_control, username, password, use_cache)
@@ -0,0 +1,298 @@
+import asyncio
+import csv
+import json
+import os
+import re
+import time
+
+from artifactory_cli import async_controls, controls, scheduler
+
+
+USER_FIELDS = ("username", "email", "password")
+TRUE_VALUES = {"1", "true", "yes", "y"}
+
+# Users that are never deleted. ARTIFACTORY_PROTECTED_USERS (comma-separated)
+# replaces this list; --protect adds to it.
+DEFAULT_PROTECTED_USERS = ("tyrone", "anonymous", "test-user")
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in TRUE_VALUES
+
+
+def iter_user_records(path):
+    """
+    Streams user records from a CSV or JSONL file, one row at a time.
+
+    CSV files need a header row with username, email, password and an
+    optional admin column. JSONL files hold one object per line with the
+    same keys. The format is picked from the file extension.
+
+    Args:
+        path (str): Path to a .csv, .jsonl or .ndjson file.
+
+    Yields:
+        tuple: (line_number, record dict). Rows that cannot be parsed are
+        yielded with an "error" key instead of user fields.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    with open(path, newline="", encoding="utf-8") as handle:
+        if extension == ".csv":
+            reader = csv.DictReader(handle)
+            for row in reader:
+                yield reader.line_num, {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+        elif extension in (".jsonl", ".ndjson"):
+            for line_number, line in enumerate(handle, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, {"error": f"Invalid JSON: {e}"}
+                    continue
+                if not isinstance(record, dict):
+                    yield line_number, {"error": "Expected a JSON object."}
+                    continue
+                yield line_number, record
+        else:
+            raise ValueError(f"Unsupported file type '{extension}'. Use .csv or .jsonl.")
+
+
+async def _bulk_create_users(records, concurrency, existing, on_result):
+    counts = {"created": 0, "skipped": 0, "failed": 0, "invalid": 0}
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    def report(result):
+        counts[result["status"]] += 1
+        if on_result:
+            on_result(result)
+
+    async def worker():
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            line_number, username, email, password, admin = item
+            try:
+                response = await async_controls.create_user_control_async(username, email, password, admin)
+            except Exception as e:
+                response = {"error": str(e)}
+
+            if response == 201:
+                report({"line": line_number, "username": username, "status": "created"})
+            else:
+                report({"line": line_number, "username": username, "status": "failed", "error": response["error"]})
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+
+    for line_number, record in records:
+        if "error" in record:
+            report({"line": line_number, "username": None, "status": "invalid", "error": record["error"]})
+            continue
+
+        username = str(record.get("username") or "").strip()
+        email = str(record.get("email") or "").strip()
+        password = str(record.get("password") or "")
+        missing = [field for field, value in zip(USER_FIELDS, (username, email, password)) if not value]
+        if missing:
+            report({"line": line_number, "username": username or None, "status": "invalid",
+                    "error": f"Missing fields: {', '.join(missing)}"})
+            continue
+
+        if username in existing:
+            report({"line": line_number, "username": username, "status": "skipped", "error": "User already exists"})
+            continue
+
+        # Also guards against the same username appearing twice in the file
+        existing.add(username)
+        await queue.put((line_number, username, email, password, _parse_bool(record.get("admin"))))
+
+    for _ in workers:
+        await queue.put(None)
+    await asyncio.gather(*workers)
+
+    return counts
+
+
+def bulk_create_users(records, concurrency=None, skip_existing=True, on_result=None):
+    """
+    Creates users from an iterable of records on a pool of parallel workers.
+
+    Records are consumed lazily, so a large file is never held in memory.
+
+    Args:
+        records (iterable): (line_number, record) tuples, e.g. from iter_user_records.
+        concurrency (int): Number of parallel workers. Defaults to the scheduler's
+            maximum, leaving the adaptive limit to find what the server tolerates.
+        skip_existing (bool): Fetch the user list once and skip users already present.
+        on_result (callable): Called with a result dict for every row as it completes.
+
+    Returns:
+        dict: Counts per status plus total rows, elapsed seconds and rows per second.
+    """
+    concurrency = concurrency or scheduler.max_concurrency
+    if concurrency > async_controls.concurrency:
+        async_controls.set_concurrency(concurrency)
+
+    existing = set()
+    if skip_existing:
+        existing = {user.name for user in controls.list_users_control()}
+
+    start = time.perf_counter()
+    counts = asyncio.run(_bulk_create_users(records, concurrency, existing, on_result))
+    elapsed = time.perf_counter() - start
+
+    total = sum(counts.values())
+    counts.update({
+        "total": total,
+        "elapsed": elapsed,
+        "rate": total / elapsed if elapsed else 0.0,
+    })
+    return counts
+
+
+def protected_users(extra=None):
+    """
+    Returns the usernames that must not be deleted.
+
+    Args:
+        extra (iterable): Additional usernames to protect.
+
+    Returns:
+        set: ARTIFACTORY_PROTECTED_USERS if set, else DEFAULT_PROTECTED_USERS, plus extra.
+    """
+    configured = os.environ.get("ARTIFACTORY_PROTECTED_USERS")
+    names = configured.split(",") if configured is not None else DEFAULT_PROTECTED_USERS
+    return {name.strip() for name in names if name.strip()} | {name.strip() for name in extra or () if name.strip()}
+
+
+def read_usernames(path):
+    """
+    Reads usernames from a file: a CSV with a username column, JSONL objects
+    with a "username" key, or plain text with one username per line (blank
+    lines and lines starting with # are ignored).
+
+    Returns:
+        list: Usernames in file order, without duplicates.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    names = []
+
+    if extension in (".csv", ".jsonl", ".ndjson"):
+        for line_number, record in iter_user_records(path):
+            if "error" in record:
+                raise ValueError(f"Line {line_number}: {record['error']}")
+            name = str(record.get("username") or record.get("name") or "").strip()
+            if name:
+                names.append(name)
+    else:
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                name = line.strip()
+                if name and not name.startswith("#"):
+                    names.append(name)
+
+    return list(dict.fromkeys(names))
+
+
+def select_users(users, pattern=None, email_domain=None, names=None, protected=()):
+    """
+    Picks the users to delete. Every given criterion must match.
+
+    Args:
+        users (list): User records from list_users_control.
+        pattern (str): Regular expression searched in the username.
+        email_domain (str): Email domain, e.g. "contractor.example.com".
+        names (list): Exact usernames, e.g. from read_usernames.
+        protected (set): Usernames that are never selected.
+
+    Returns:
+        dict: "selected" (User records), "protected" (matching usernames left
+        out) and "missing" (names not found on the server).
+
+    Raises:
+        ValueError: If no criterion is given (blank ones count as not given),
+            or if pattern is not a valid regular expression.
+    """
+    pattern = pattern.strip() if pattern else None
+    domain = email_domain.strip().lstrip("@").lower() if email_domain else None
+    if not pattern and not domain and names is None:
+        # An empty criterion would otherwise match every user
+        raise ValueError("No selection criteria: give a username pattern, an email domain or usernames.")
+    try:
+        regex = re.compile(pattern) if pattern else None
+    except re.error as e:
+        raise ValueError(f"Invalid pattern '{pattern}': {e}")
+    wanted = set(names) if names is not None else None
+
+    selected = []
+    skipped = []
+    for user in users:
+        name = user.name or ""
+        if regex and not regex.search(name):
+            continue
+        if domain and user.email_domain != domain:
+            continue
+        if wanted is not None and name not in wanted:
+            continue
+        if name in protected:
+            skipped.append(name)
+        else:
+            selected.append(user)
+
+    found = {user.name for user in users}
+    missing = [name for name in names if name not in found] if names is not None else []
+    return {"selected": selected, "protected": skipped, "missing": missing}
+
+
+def bulk_delete_users(usernames, concurrency=None, protected=None, on_result=None):
+    """
+    Deletes users on a pool of parallel workers through delete_user_control.
+
+    Args:
+        usernames (iterable): Usernames to delete.
+        concurrency (int): Number of parallel workers. Defaults to the scheduler's maximum.
+        protected (set): Usernames to refuse even if passed in; defaults to protected_users().
+        on_result (callable): Called with {"username", "status", "message"/"error"}
+            for every user as it completes; status is "deleted", "skipped" or "failed".
+
+    Returns:
+        dict: Counts per status plus total users, elapsed seconds and users per second.
+    """
+    protected = protected_users() if protected is None else protected
+    counts = {"deleted": 0, "skipped": 0, "failed": 0}
+
+    def report(result):
+        counts[result["status"]] += 1
+        if on_result:
+            on_result(result)
+
+    def allowed():
+        for username in usernames:
+            if username in protected:
+                report({"username": username, "status": "skipped", "error": "Protected user"})
+            else:
+                yield (username,)
+
+    def store(item, response):
+        if isinstance(response, Exception):
+            response = {"error": str(response)}
+        if "error" in response:
+            report({"username": item[0], "status": "failed", "error": response["error"]})
+        else:
+            report({"username": item[0], "status": "deleted", "message": response["message"]})
+
+    start = time.perf_counter()
+    async_controls.run_each(controls.delete_user_control, allowed(), concurrency or scheduler.max_concurrency, store)
+    elapsed = time.perf_counter() - start
+
+    total = sum(counts.values())
+    counts.update({
+        "total": total,
+        "elapsed": elapsed,
+        "rate": total / elapsed if elapsed else 0.0,
+    })
+    return counts
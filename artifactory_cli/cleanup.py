@@ -0,0 +1,283 @@
+import fnmatch
+import json
+import time
+from datetime import datetime, timezone
+
+from artifactory_cli import async_controls, controls, scheduler
+from artifactory_cli.aql import iter_results
+
+
+# Fields fetched per item; stat.downloaded comes back as "stats": [{"downloaded": ...}]
+FIELDS = ("repo", "path", "name", "size", "created", "stat.downloaded")
+
+# Deletions recorded in the journal per flush
+JOURNAL_BATCH = 500
+
+
+def _iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _timestamp(value):
+    # Artifactory dates look like 2024-05-01T10:20:30.123Z or 2024-05-01T10:20:30.123+02:00
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def build_rules(older_than=None, not_downloaded_since=None, min_size=None, include=None, exclude=None, now=None):
+    """
+    Turns the cleanup criteria into rules with absolute cutoffs, so planning
+    and review see the same dates however long the plan takes.
+
+    Args:
+        older_than (int): Only artifacts created more than this many days ago.
+        not_downloaded_since (int): Only artifacts not downloaded in this many
+            days, including those never downloaded.
+        min_size (int): Only artifacts of at least this many bytes.
+        include (list): Glob patterns; the artifact path must match one of them.
+        exclude (list): Glob patterns of artifact paths to keep.
+        now (float): Reference time, defaults to now.
+
+    Returns:
+        dict: Rules for aql_criteria and matches.
+
+    Raises:
+        ValueError: If no criterion is given, to avoid planning a whole repository.
+    """
+    if not (older_than or not_downloaded_since or min_size or include):
+        raise ValueError("Give at least one of: older than, not downloaded since, minimum size or include pattern.")
+    now = time.time() if now is None else now
+    return {
+        "createdBefore": now - older_than * 86400 if older_than else None,
+        "downloadedBefore": now - not_downloaded_since * 86400 if not_downloaded_since else None,
+        "minSize": int(min_size) if min_size else None,
+        "include": list(include or []),
+        "exclude": list(exclude or []),
+    }
+
+
+def aql_criteria(repo_key, rules):
+    """
+    Returns the AQL find() criteria selecting the candidate files of a
+    repository, so the server filters by date and size before paging.
+    """
+    criteria = {"repo": repo_key, "type": "file"}
+    if rules["createdBefore"]:
+        criteria["created"] = {"$lt": _iso(rules["createdBefore"])}
+    if rules["minSize"]:
+        criteria["size"] = {"$gte": rules["minSize"]}
+    if rules["downloadedBefore"]:
+        criteria["$or"] = [
+            {"stat.downloaded": {"$lt": _iso(rules["downloadedBefore"])}},
+            {"stat.downloads": {"$eq": None}},
+        ]
+    return criteria
+
+
+def item_path(row):
+    """
+    Returns the path of an AQL item inside its repository, e.g. "org/lib/1.0/lib-1.0.jar".
+    """
+    return row["name"] if row.get("path") in (None, "", ".") else f"{row['path']}/{row['name']}"
+
+
+def matches(entry, rules):
+    """
+    Checks a plan entry against the rules. Path patterns are only applied
+    here; the date and size checks repeat what the AQL criteria asked for.
+    """
+    path = entry["path"]
+    if rules["include"] and not any(fnmatch.fnmatchcase(path, pattern) for pattern in rules["include"]):
+        return False
+    if any(fnmatch.fnmatchcase(path, pattern) for pattern in rules["exclude"]):
+        return False
+    if rules["minSize"] and entry["size"] < rules["minSize"]:
+        return False
+    if rules["createdBefore"]:
+        created = _timestamp(entry["created"])
+        if created is None or created >= rules["createdBefore"]:
+            return False
+    if rules["downloadedBefore"]:
+        downloaded = _timestamp(entry["downloaded"])
+        if downloaded is not None and downloaded >= rules["downloadedBefore"]:
+            return False
+    return True
+
+
+def iter_candidates(repos, rules, page_size=10000, on_scan=None):
+    """
+    Streams the artifacts of repos matching the rules, one repository after
+    another, paging through AQL results while they are being filtered.
+
+    Args:
+        repos (list): Repository keys.
+        rules (dict): Output of build_rules.
+        page_size (int): AQL rows per request.
+        on_scan (callable): Called as on_scan(scanned, matched) every AQL page.
+
+    Yields:
+        dict: Plan entries {"repo", "path", "size", "created", "downloaded"}.
+    """
+    scanned = matched = 0
+    for repo_key in repos:
+        for row in iter_results(aql_criteria(repo_key, rules), include=list(FIELDS), page_size=page_size):
+            scanned += 1
+            stats = row.get("stats") or [{}]
+            entry = {
+                "repo": row.get("repo", repo_key),
+                "path": item_path(row),
+                "size": int(row.get("size") or 0),
+                "created": row.get("created"),
+                "downloaded": stats[0].get("downloaded"),
+            }
+            if matches(entry, rules):
+                matched += 1
+                yield entry
+            if on_scan and scanned % page_size == 0:
+                on_scan(scanned, matched)
+    if on_scan:
+        on_scan(scanned, matched)
+
+
+def write_plan(path, repos, rules, page_size=10000, on_scan=None):
+    """
+    Plans a cleanup into a JSONL file without holding it in memory.
+
+    The first line describes the plan (instance, repositories, rules), each
+    following line is one artifact to delete, and the last line holds the
+    summary, so a plan of any size can be reviewed and run later.
+
+    Returns:
+        dict: The summary: "items", "bytes" and per repository [items, bytes].
+    """
+    summary = {"items": 0, "bytes": 0, "repositories": {}}
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(json.dumps({"plan": {"instance": controls.base_url, "repositories": list(repos),
+                                          "rules": rules, "createdAt": time.time()}}) + "\n")
+        for entry in iter_candidates(repos, rules, page_size, on_scan):
+            handle.write(json.dumps(entry) + "\n")
+            summary["items"] += 1
+            summary["bytes"] += entry["size"]
+            totals = summary["repositories"].setdefault(entry["repo"], [0, 0])
+            totals[0] += 1
+            totals[1] += entry["size"]
+        handle.write(json.dumps({"summary": summary}) + "\n")
+    return summary
+
+
+def read_plan(path):
+    """
+    Reads the header and summary of a plan written by write_plan.
+
+    Returns:
+        tuple: (header, summary).
+
+    Raises:
+        ValueError: If the file is not a complete cleanup plan.
+    """
+    header = summary = None
+    with open(path, encoding="utf-8") as handle:
+        for number, line in enumerate(handle, 1):
+            if number == 1:
+                header = json.loads(line).get("plan")
+            last = line
+        if header is None:
+            raise ValueError(f"'{path}' is not a cleanup plan.")
+        summary = json.loads(last).get("summary")
+    if summary is None:
+        raise ValueError(f"'{path}' is incomplete; planning was interrupted. Plan again.")
+    return header, summary
+
+
+def iter_plan(path):
+    """
+    Streams the artifacts of a plan written by write_plan.
+    """
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            entry = json.loads(line)
+            if "repo" in entry:
+                yield entry
+
+
+def journal_path(plan_path):
+    return plan_path + ".journal"
+
+
+def load_journal(path):
+    """
+    Returns the set of "repo/path" artifacts a previous run already deleted.
+    """
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return {line.rstrip("\n") for line in handle if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+
+def _delete_entry(entry):
+    return controls.delete_artifact_control(entry["repo"], entry["path"], missing_ok=True)
+
+
+def run_plan(path, concurrency=None, journal=None, on_result=None):
+    """
+    Deletes the artifacts of a plan on a pool of parallel workers.
+
+    Every deleted artifact is appended to a journal, flushed in batches of
+    JOURNAL_BATCH, and artifacts already in the journal are skipped, so an
+    interrupted run picks up where it stopped. Artifacts that are already
+    gone count as deleted.
+
+    Args:
+        path (str): Plan file from write_plan.
+        concurrency (int): Number of parallel workers. Defaults to the scheduler's maximum.
+        journal (str): Journal file. Defaults to the plan path plus ".journal".
+        on_result (callable): Called as on_result(entry, response) as deletions complete.
+
+    Returns:
+        dict: "deleted", "failed" and "skipped" counts, "bytes" reclaimed,
+        "elapsed" seconds and "rate" deletions per second.
+    """
+    journal = journal or journal_path(path)
+    done = load_journal(journal)
+    summary = {"deleted": 0, "failed": 0, "skipped": 0, "bytes": 0}
+    pending = []
+
+    def todo():
+        for entry in iter_plan(path):
+            if f"{entry['repo']}/{entry['path']}" in done:
+                summary["skipped"] += 1
+            else:
+                yield (entry,)
+
+    start = time.perf_counter()
+    with open(journal, "a", encoding="utf-8") as handle:
+        def record(item, response):
+            entry = item[0]
+            if isinstance(response, Exception):
+                response = {"error": str(response)}
+            if "error" in response:
+                summary["failed"] += 1
+            else:
+                summary["deleted"] += 1
+                summary["bytes"] += entry["size"]
+                pending.append(f"{entry['repo']}/{entry['path']}\n")
+                if len(pending) >= JOURNAL_BATCH:
+                    handle.writelines(pending)
+                    handle.flush()
+                    pending.clear()
+            if on_result:
+                on_result(entry, response)
+
+        try:
+            async_controls.run_each(_delete_entry, todo(), concurrency or scheduler.max_concurrency, record)
+        finally:
+            handle.writelines(pending)
+
+    summary["elapsed"] = time.perf_counter() - start
+    summary["rate"] = summary["deleted"] / summary["elapsed"] if summary["elapsed"] else 0.0
+    return summary
@@ -0,0 +1,295 @@
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from artifactory_cli import metrics, scheduler
+
+
+# Connection settings shared by every control function
+pool_size = 20            # Max keep-alive connections kept open per host
+timeout = (5, 60)         # (connect, read) timeout in seconds
+max_retries = 3           # Retries for connection errors and retryable statuses
+backoff_factor = 0.5      # Sleep between retries: backoff_factor * 2 ** (retry - 1)
+retry_statuses = (502, 504)   # 429 and 503 are retried by the scheduler for every method
+
+# Only read-only calls are retried; a retried POST/PUT/DELETE could apply twice
+retry_methods = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Called as on_unauthorized(stale_token) when a Bearer request gets 401; returns
+# a new token to resend the request with, or None. Set by controls.login_control.
+on_unauthorized = None
+
+_session = None
+_session_lock = threading.Lock()
+_environment = {}
+
+
+class _ConnectTiming:
+    # _new_conn resolves the host and opens the TCP connection
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            metrics.add_phase("connect", time.perf_counter() - start)
+
+
+class _TimedHTTPConnection(_ConnectTiming, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_ConnectTiming, HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        before = metrics.get_phase("connect")
+        super().connect()
+        # Whatever connect() spent beyond _new_conn is the TLS handshake
+        tcp = metrics.get_phase("connect") - before
+        metrics.add_phase("tls", time.perf_counter() - start - tcp)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose new connections report connect and TLS times to metrics.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def configure_session(pool_size=None, timeout=None, max_retries=None, backoff_factor=None):
+    """
+    Updates the connection settings and drops the current session so the
+    next request is made with the new settings.
+
+    Args:
+        pool_size (int): Number of connections kept alive per host.
+        timeout (float or tuple): Default (connect, read) timeout in seconds.
+        max_retries (int): Number of retries for failed read-only requests.
+        backoff_factor (float): Backoff factor between retries.
+    """
+    global _session
+    settings = globals()
+
+    with _session_lock:
+        for name, value in (
+            ("pool_size", pool_size),
+            ("timeout", timeout),
+            ("max_retries", max_retries),
+            ("backoff_factor", backoff_factor),
+        ):
+            if value is not None:
+                settings[name] = value
+
+        if _session is not None:
+            _session.close()
+            _session = None
+        _environment.clear()
+
+
+def get_session():
+    """
+    Returns the shared requests.Session, creating it on first use.
+
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTP adapter.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=max_retries,
+                    backoff_factor=backoff_factor,
+                    status_forcelist=retry_statuses,
+                    allowed_methods=retry_methods,
+                    raise_on_status=False,
+                )
+                adapter = _TimedHTTPAdapter(
+                    pool_connections=pool_size,
+                    pool_maxsize=pool_size,
+                    max_retries=retry,
+                )
+                session = requests.Session()
+                # Proxy, CA bundle and netrc settings are resolved once per host by _environment_settings
+                session.trust_env = False
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+
+    return _session
+
+
+def close_session():
+    """
+    Closes the shared session and all of its pooled connections.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        _environment.clear()
+
+
+def _environment_settings(url):
+    """
+    Returns the proxies, CA bundle and netrc credentials the environment sets
+    for the host of url, as requests would find them.
+
+    requests looks these up on every call by scanning all environment
+    variables, which costs more CPU than a small request itself; they are
+    cached per host instead.
+    """
+    parts = urlsplit(url)
+    origin = (parts.scheme, parts.netloc)
+    settings = _environment.get(origin)
+    if settings is None:
+        settings = {"proxies": requests.utils.get_environ_proxies(url)}
+        verify = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+        if verify:
+            settings["verify"] = verify
+        auth = requests.utils.get_netrc_auth(url)
+        if auth:
+            settings["auth"] = auth
+        _environment[origin] = settings
+    return settings
+
+
+def request(method, url, **kwargs):
+    """
+    Sends a request over the shared session, applying the default timeout.
+
+    Every request goes through the scheduler, which applies the rate limit
+    and adaptive concurrency limit of the target host. Responses with 429 or
+    503 are retried (after Retry-After, which also pauses other requests to
+    the same host) as long as the request body can be sent again. A 401 to
+    a Bearer request is sent once more with the token on_unauthorized returns.
+
+    Args:
+        method (str): HTTP method, e.g. "GET".
+        url (str): Full request URL.
+        **kwargs: Passed through to requests.Session.request.
+
+    Returns:
+        requests.Response: The response.
+    """
+    kwargs.setdefault("timeout", timeout)
+    for name, value in _environment_settings(url).items():
+        if kwargs.get(name) is None:
+            kwargs[name] = value
+
+    # File bodies are rewound before a retry; other streams cannot be resent
+    body = kwargs.get("data")
+    position = body.tell() if hasattr(body, "seek") and hasattr(body, "tell") else None
+    resendable = body is None or isinstance(body, (str, bytes, dict, list)) or position is not None
+
+    attempt = 0
+    reauthenticated = False
+    while True:
+        slot = scheduler.acquire(url)
+        throttled = False
+        try:
+            response = _send(method, url, kwargs)
+            throttled = response.status_code in scheduler.THROTTLE_STATUSES
+        finally:
+            scheduler.release(slot, throttled)
+
+        if not throttled or not resendable or attempt >= scheduler.max_throttle_retries:
+            if response.status_code != 401 or not resendable or reauthenticated or not _reauthenticate(kwargs):
+                return response
+            reauthenticated = True
+            response.close()
+            if position is not None:
+                body.seek(position)
+            continue
+
+        scheduler.pause(scheduler.retry_after(response, attempt), url)
+        response.close()
+        attempt += 1
+        if position is not None:
+            body.seek(position)
+
+
+def _reauthenticate(kwargs):
+    # Swaps a rejected Bearer token for the one on_unauthorized returns
+    headers = kwargs.get("headers") or {}
+    authorization = headers.get("Authorization", "")
+    if on_unauthorized is None or not authorization.startswith("Bearer "):
+        return False
+    new_token = on_unauthorized(authorization[len("Bearer "):])
+    if not new_token:
+        return False
+    kwargs["headers"] = dict(headers, Authorization=f"Bearer {new_token}")
+    return True
+
+
+def _send(method, url, kwargs):
+    if not metrics.enabled:
+        return get_session().request(method, url, **kwargs)
+
+    metrics.begin_request()
+    start = time.perf_counter()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except Exception:
+        metrics.record(method, url, None, 0, time.perf_counter() - start, metrics.end_request())
+        raise
+    phases = metrics.end_request()
+    phases["first_byte"] = response.elapsed.total_seconds()
+
+    def finish():
+        received = response.raw.tell() if hasattr(response.raw, "tell") else len(response.content)
+        metrics.record(method, url, response.status_code, received, time.perf_counter() - start, phases)
+
+    if kwargs.get("stream"):
+        # A streamed body is read after this returns; record once it is closed
+        close = response.close
+
+        def close_and_record():
+            close()
+            if not getattr(response, "_metrics_recorded", False):
+                response._metrics_recorded = True
+                finish()
+
+        response.close = close_and_record
+    else:
+        finish()
+    return response
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+def put(url, **kwargs):
+    return request("PUT", url, **kwargs)
+
+
+def delete(url, **kwargs):
+    return request("DELETE", url, **kwargs)
@@ -1,6 +1,12 @@
 import os
 import requests
 import base64
+import hashlib
+import threading
+from urllib.parse import quote, urlencode
+from artifactory_cli import client, response_cache, token_cache
+from artifactory_cli.models import Repository, StorageInfo, User
+from artifactory_cli.streaming import iter_json_array
 
 
 # Global variable to store the token and base url
@@ -8,6 +14,11 @@ token = None
 expire_time = 18000 # Token expiration time in seconds (5 hour)
 base_url = "https://trials5ruji.jfrog.io"
 
+# Credentials of a login answered from the token cache, kept so a token the
+# server rejects (revoked, or keys rotated) can be replaced once
+_cached_login = None
+_cached_login_lock = threading.Lock()
+
 
 def ping_system_control():
     """
@@ -25,7 +36,7 @@ def ping_system_control():
     headers = {"Authorization": f"Bearer {token}"}
 
     try:
-        response = requests.get(url, headers=headers)
+        response = client.get(url, headers=headers)
         response.raise_for_status()
         return response.text
     except requests.exceptions.RequestException as e:
@@ -47,19 +58,42 @@ def get_system_version_control():
     headers = {"Authorization": f"Bearer {token}"}
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return response_cache.get_json(url, headers)
     except requests.exceptions.RequestException as e:
         raise Exception(f"Failed to retrieve system version: {e}")
 
 
-def list_repositories_control():
+def repositories_url(repo_type=None, package_type=None):
+    """
+    Builds the repository listing URL with Artifactory's server-side filters.
+
+    Args:
+        repo_type (str): local, remote, virtual, federated or distribution.
+        package_type (str): e.g. maven, npm, docker.
+
+    Returns:
+        str: The listing URL.
+    """
+    params = {}
+    if repo_type:
+        params["type"] = repo_type.lower()
+    if package_type:
+        params["packageType"] = package_type.lower()
+
+    url = f"{base_url}/artifactory/api/repositories"
+    return f"{url}?{urlencode(params)}" if params else url
+
+
+def list_repositories_control(repo_type=None, package_type=None):
     """
     Sends a request to retrieve the list of repositories in Artifactory.
 
+    Args:
+        repo_type (str): Only list repositories of this type (filtered by the server).
+        package_type (str): Only list repositories of this package type (filtered by the server).
+
     Returns:
-        list: A list of repository details.
+        list: Repository records.
 
     Raises:
         Exception: If the request fails.
@@ -69,23 +103,77 @@ def list_repositories_control():
     if not base_url or not token:
         raise Exception("Base URL or Identity Token is missing. Please check your .env file.")
 
-    url = f"{base_url}/artifactory/api/repositories"
+    url = repositories_url(repo_type, package_type)
     headers = {"Authorization": f"Bearer {token}"}
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return response_cache.get_json(url, headers, parse=Repository.from_list)
     except requests.exceptions.RequestException as e:
         raise Exception(f"Failed to retrieve repositories: {e}")
 
 
+def iter_json_array_control(url, headers, description, key=None, chunk_size=65536, data=None, missing_ok=False):
+    """
+    Streams a JSON array endpoint, yielding records while the body downloads.
+
+    Args:
+        url (str): Full request URL.
+        headers (dict): Request headers.
+        description (str): What is being fetched, used in error messages.
+        key (str): Top-level key holding the array when the body is an object.
+        chunk_size (int): Bytes read from the socket at a time.
+        data (str): Request body; when set the request is a POST instead of a GET.
+        missing_ok (bool): Yield nothing instead of failing when the server answers 404.
+
+    Yields:
+        dict: One record at a time.
+
+    Raises:
+        Exception: If the request fails or the body is not valid JSON.
+    """
+    try:
+        if data is None:
+            response = client.get(url, headers=headers, stream=True)
+        else:
+            response = client.post(url, headers=headers, data=data, stream=True)
+        with response:
+            if missing_ok and response.status_code == 404:
+                return
+            response.raise_for_status()
+            yield from iter_json_array(response.iter_content(chunk_size), key=key)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        raise Exception(f"Failed to retrieve {description}: {e}")
+
+
+def iter_repositories_control(repo_type=None, package_type=None):
+    """
+    Streams the list of repositories, yielding each repository as it is parsed.
+    Unlike list_repositories_control, the response is never cached or held in memory.
+
+    Args:
+        repo_type (str): Only list repositories of this type (filtered by the server).
+        package_type (str): Only list repositories of this package type (filtered by the server).
+
+    Yields:
+        Repository: One repository at a time.
+
+    Raises:
+        Exception: If the request fails.
+    """
+    if not base_url or not token:
+        raise Exception("Base URL or Identity Token is missing. Please check your .env file.")
+
+    url = repositories_url(repo_type, package_type)
+    headers = {"Authorization": f"Bearer {token}"}
+    yield from map(Repository.from_json, iter_json_array_control(url, headers, "repositories"))
+
+
 def get_storage_info_control():
     """
     Sends a request to retrieve Artifactory's storage information.
 
     Returns:
-        dict: JSON response containing storage details.
+        StorageInfo: Binaries summary, file store summary and one record per repository.
 
     Raises:
         Exception: If the request fails.
@@ -98,9 +186,7 @@ def get_storage_info_control():
     headers = {"Authorization": f"Bearer {token}"}
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return response_cache.get_json(url, headers, parse=StorageInfo.from_json)
     except requests.exceptions.RequestException as e:
         raise Exception(f"Failed to retrieve storage info: {e}")
 
@@ -110,7 +196,7 @@ def list_users_control():
     Fetches the list of users from Artifactory.
 
     Returns:
-        list: A list of user details.
+        list: User records.
         Raises Exception: If the request fails.
     """
     url = f"{base_url}/artifactory/api/users"  # API endpoint to list users
@@ -120,13 +206,29 @@ def list_users_control():
     }
 
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()  # Returns a list of user details
+        return response_cache.get_json(url, headers, parse=User.from_list)  # Returns a list of users
     except requests.exceptions.RequestException as e:
         raise Exception(f"Failed to retrieve users: {e}")
 
 
+def iter_users_control():
+    """
+    Streams the list of users, yielding each user as it is parsed.
+    Unlike list_users_control, the response is never cached or held in memory.
+
+    Yields:
+        User: One user at a time.
+
+    Raises:
+        Exception: If the request fails.
+    """
+    url = f"{base_url}/artifactory/api/users"
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    }
+    yield from map(User.from_json, iter_json_array_control(url, headers, "users"))
+
 
 def create_user_control(username, email, password, admin=False):
     """
@@ -154,7 +256,8 @@ def create_user_control(username, email, password, admin=False):
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = client.post(url, headers=headers, json=payload)
+        response_cache.invalidate(f"{base_url}/artifactory/api/users")
         response.raise_for_status()
         if response.status_code == 201:
             return response.status_code
@@ -183,7 +286,8 @@ def delete_user_control(username):
     }
 
     try:
-        response = requests.delete(url, headers=headers)
+        response = client.delete(url, headers=headers)
+        response_cache.invalidate(f"{base_url}/artifactory/api/users")
         response.raise_for_status()
         if response.status_code == 204:
             return {"message": f"User: '{username}' has been deleted successfully!"}
@@ -195,19 +299,37 @@ def delete_user_control(username):
         return {"error": str(err)}
 
 
-def create_repository_control(repo_key, repo_type, package_type, remote_url=None):
+def invalidate_repository_cache():
+    """
+    Drops cached repository listings and storage info after a repository change.
+    """
+    response_cache.invalidate(
+        f"{base_url}/artifactory/api/repositories",
+        f"{base_url}/artifactory/api/storageinfo",
+    )
+
+
+def create_repository_control(repo_key, repo_type, package_type, remote_url=None, settings=None):
     """
     Creates a new repository in Artifactory.
+
+    Args:
+        repo_key (str): The repository key.
+        repo_type (str): local, remote or virtual.
+        package_type (str): e.g. maven, npm, docker.
+        remote_url (str): Upstream URL, required for remote repositories.
+        settings (dict): Extra repository configuration (description, notes, ...).
     """
     url = f"{base_url}/artifactory/api/repositories/{repo_key}"
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json"
     }
-    payload = {
+    payload = dict(settings or {})
+    payload.update({
         "rclass": repo_type.lower(),  # e.g., local, remote, virtual
         "packageType": package_type.lower()  # e.g., maven, npm, docker
-    }
+    })
 
     if repo_type.lower() == "remote":
         if not remote_url:
@@ -215,7 +337,8 @@ def create_repository_control(repo_key, repo_type, package_type, remote_url=None
         payload["url"] = remote_url
 
     try:
-        response = requests.put(url, headers=headers, json=payload)
+        response = client.put(url, headers=headers, json=payload)
+        invalidate_repository_cache()
         response.raise_for_status()
         if response.status_code == 200:
             return {"message": f"Repository '{repo_key}' created successfully!"}
@@ -238,7 +361,8 @@ def update_repository_control(repo_key, updates):
     }
 
     try:
-        response = requests.post(url, headers=headers, json=updates)
+        response = client.post(url, headers=headers, json=updates)
+        invalidate_repository_cache()
         response.raise_for_status()
         if response.status_code == 200:
             return {"message": f"Repository '{repo_key}' updated successfully!"}
@@ -250,18 +374,275 @@ def update_repository_control(repo_key, updates):
         return {"error": str(err)}
 
 
+def get_repository_config_control(repo_key):
+    """
+    Fetches the full configuration of a repository.
 
-def login_control(username, password):
+    Args:
+        repo_key (str): The repository key.
+
+    Returns:
+        dict: The repository configuration, including settings the listing does not return.
+
+    Raises:
+        Exception: If the request fails.
+    """
+    url = f"{base_url}/artifactory/api/repositories/{quote(repo_key)}"
+    headers = {"Authorization": f"Bearer {token}"}
+
+    try:
+        response = client.get(url, headers=headers)
+        response.raise_for_status()
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Failed to retrieve configuration of repository '{repo_key}': {e}")
+
+
+def artifact_url(repo_key, path):
+    """
+    Builds the deploy/download URL of an artifact path in a repository.
+    """
+    return f"{base_url}/artifactory/{quote(repo_key)}/{quote(path.lstrip('/'))}"
+
+
+def file_checksums(local_path, chunk_size=1024 * 1024):
+    """
+    Computes the SHA-1, SHA-256 and MD5 of a file in one streaming pass.
+
+    Returns:
+        dict: {"sha1": ..., "sha256": ..., "md5": ..., "size": ...}
+    """
+    sha1, sha256, md5 = hashlib.sha1(), hashlib.sha256(), hashlib.md5()
+    size = 0
+    with open(local_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            sha1.update(chunk)
+            sha256.update(chunk)
+            md5.update(chunk)
+            size += len(chunk)
+    return {"sha1": sha1.hexdigest(), "sha256": sha256.hexdigest(), "md5": md5.hexdigest(), "size": size}
+
+
+def upload_artifact_control(repo_key, local_path, target_path, checksum_deploy=True, checksums=None):
+    """
+    Deploys a local file to a repository path.
+
+    A checksum deploy (checksum headers, no body) is tried first, so content
+    Artifactory already stores is linked without being sent again. Only if
+    the server does not know the checksum is the file streamed from disk.
+
+    Args:
+        repo_key (str): Target repository key.
+        local_path (str): File to upload.
+        target_path (str): Path of the artifact inside the repository.
+        checksum_deploy (bool): Try a checksum deploy before uploading the body.
+        checksums (dict): Precomputed file_checksums output, to avoid hashing twice.
+
+    Returns:
+        dict: A success message with "deployed" ("checksum" or "upload") and
+        "bytes" sent, or an error message.
+    """
+    url = artifact_url(repo_key, target_path)
+
+    try:
+        checksums = checksums or file_checksums(local_path)
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "X-Checksum-Sha1": checksums["sha1"],
+            "X-Checksum-Sha256": checksums["sha256"],
+            "X-Checksum": checksums["md5"],
+        }
+
+        if checksum_deploy:
+            response = client.put(url, headers={**headers, "X-Checksum-Deploy": "true"})
+            if response.status_code in (200, 201):
+                response_cache.invalidate(f"{base_url}/artifactory/api/storageinfo")
+                return {"message": f"'{target_path}' deployed by checksum to '{repo_key}'.",
+                        "deployed": "checksum", "bytes": 0}
+            # 404 means the content is new to the server; anything else is a real error
+            if response.status_code != 404:
+                response.raise_for_status()
+
+        with open(local_path, "rb") as handle:
+            response = client.put(url, headers={**headers, "Content-Length": str(checksums["size"])}, data=handle)
+        response.raise_for_status()
+        response_cache.invalidate(f"{base_url}/artifactory/api/storageinfo")
+        return {"message": f"'{target_path}' uploaded to '{repo_key}'.",
+                "deployed": "upload", "bytes": checksums["size"]}
+    except requests.exceptions.HTTPError as http_err:
+        return {"error": f"HTTP error occurred: {http_err.response.text}"}
+    except Exception as err:
+        return {"error": str(err)}
+
+
+def get_artifact_info_control(repo_key, path):
+    """
+    Fetches the storage details of an artifact: size, checksums and download URI.
+
+    Returns:
+        dict: JSON response of the storage API for the file.
+
+    Raises:
+        Exception: If the request fails.
+    """
+    url = f"{base_url}/artifactory/api/storage/{quote(repo_key)}/{quote(path.lstrip('/'))}"
+    headers = {"Authorization": f"Bearer {token}"}
+
+    try:
+        response = client.get(url, headers=headers)
+        response.raise_for_status()
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Failed to retrieve artifact info for '{path}': {e}")
+
+
+def iter_file_list_control(repo_key, path="", missing_ok=False):
+    """
+    Streams the deep file list of a repository folder in a single request.
+
+    Args:
+        repo_key (str): Repository key.
+        path (str): Folder inside the repository (default: repository root).
+        missing_ok (bool): Treat a folder that does not exist (404) as empty.
+
+    Yields:
+        dict: One file at a time with "uri" (relative to path), "size",
+        "lastModified", "sha1" and "sha2".
+
+    Raises:
+        Exception: If the request fails.
+    """
+    folder = quote(path.strip("/"))
+    url = f"{base_url}/artifactory/api/storage/{quote(repo_key)}/{folder}?list&deep=1&listFolders=0&mdTimestamps=0"
+    headers = {"Authorization": f"Bearer {token}"}
+    yield from iter_json_array_control(url, headers, f"file list of '{repo_key}'", key="files",
+                                       missing_ok=missing_ok)
+
+
+def iter_aql_control(query):
+    """
+    Runs an AQL query and streams its result rows as they are parsed.
+
+    Args:
+        query (str): AQL text, e.g. 'items.find({"repo": "libs-release-local"}).limit(100)'.
+
+    Yields:
+        dict: One result row at a time.
+
+    Raises:
+        Exception: If the request fails or the query is rejected.
+    """
+    url = f"{base_url}/artifactory/api/search/aql"
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "text/plain"}
+    yield from iter_json_array_control(url, headers, "AQL results", key="results", data=query)
+
+
+def delete_artifact_control(repo_key, path, missing_ok=False):
+    """
+    Deletes an artifact (or folder) from a repository.
+
+    Args:
+        repo_key (str): The repository key.
+        path (str): Path of the artifact inside the repository.
+        missing_ok (bool): Treat an artifact that no longer exists as deleted.
+
+    Returns:
+        dict: A success message or an error message.
+    """
+    url = artifact_url(repo_key, path)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    try:
+        response = client.delete(url, headers=headers)
+        if missing_ok and response.status_code == 404:
+            return {"message": f"'{path}' was already gone from '{repo_key}'."}
+        response.raise_for_status()
+        response_cache.invalidate(f"{base_url}/artifactory/api/storageinfo")
+        return {"message": f"'{path}' deleted from '{repo_key}'."}
+    except requests.exceptions.HTTPError as http_err:
+        return {"error": f"HTTP error occurred: {http_err.response.text}"}
+    except Exception as err:
+        return {"error": str(err)}
+
+
+def download_range_control(repo_key, path, output_path, start, end, chunk_size=1024 * 1024):
+    """
+    Downloads bytes start..end (inclusive) of an artifact into the same
+    offset of an existing output file, one chunk at a time.
+
+    Several ranges of the same file can be fetched concurrently, since each
+    call writes through its own file handle to a disjoint region.
+
+    Returns:
+        int: Number of bytes written.
+
+    Raises:
+        Exception: If the request fails or the server returns a different range.
+    """
+    url = artifact_url(repo_key, path)
+    headers = {"Authorization": f"Bearer {token}", "Range": f"bytes={start}-{end}"}
+    expected = end - start + 1
+
+    try:
+        with client.get(url, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            # A server that ignores Range sends the whole file with 200
+            if response.status_code != 206 and start != 0:
+                raise Exception("server does not support range requests")
+            written = 0
+            with open(output_path, "r+b") as handle:
+                handle.seek(start)
+                for chunk in response.iter_content(chunk_size):
+                    chunk = chunk[:expected - written]
+                    handle.write(chunk)
+                    written += len(chunk)
+                    if written == expected:
+                        break
+        if written != expected:
+            raise Exception(f"expected {expected} bytes, received {written}")
+        return written
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Failed to download bytes {start}-{end} of '{path}': {e}")
+
+
+def login_control(username, password, use_cache=True):
     """
     Generates a token from Artifactory using Basic Auth credentials.
 
+    A token cached on disk from an earlier login is reused while it is valid,
+    and a new one is generated shortly before it expires. If the server
+    rejects a cached token with 401, it is removed from the cache and the
+    request is sent again with a newly generated token.
+
     Args:
         username (str): The username for Artifactory.
         password (str): The password for Artifactory.
+        use_cache (bool): Reuse and store tokens in the on-disk token cache.
 
     Returns:
-        dict: Contains the generated token or an error message.
+        dict: Contains the generated token (and "cached": True when it came
+        from the cache) or an error message.
     """
+    global token, _cached_login
+
+    if use_cache:
+        try:
+            cached_token = token_cache.get_cached_token(base_url, username, password)
+        except OSError:
+            cached_token = None
+        if cached_token:
+            token = cached_token
+            _cached_login = {"username": username, "password": password, "token": cached_token, "new_token": None}
+            client.on_unauthorized = _replace_cached_token
+            return {"token": cached_token, "cached": True}
+
+    _cached_login = None
+    return _generate_token(username, password, use_cache)
+
+
+def _generate_token(username, password, use_cache):
+    global token
+
     url = f"{base_url}/access/api/v1/tokens"  # Endpoint to generate token
     headers = {
         "Authorization": f"Basic {base64.b64encode(f'{username}:{password}'.encode()).decode()}",
@@ -273,13 +654,43 @@ def login_control(username, password):
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = client.post(url, headers=headers, json=payload)
         response.raise_for_status()  # Raise exception for HTTP errors
         token_data = response.json()  # Parse the response as JSON
         
-        global token
         token = token_data["access_token"]
+
+        if use_cache:
+            try:
+                token_cache.store_token(base_url, username, password, token,
+                                        token_data.get("expires_in") or expire_time)
+            except OSError:
+                pass  # Caching is best effort; the token is still usable for this run
         
         return {"token": token_data.get("access_token", None)}
     except requests.exceptions.RequestException as e:
         return {"error": f"Failed to generate token: {e}"}
+
+
+def _replace_cached_token(stale_token):
+    """
+    client.on_unauthorized hook: drops a cached token the server rejected
+    and logs in again. Requests failing at the same time with the same
+    token share the one new token.
+
+    Returns:
+        str or None: The new token, or None if stale_token is not the cached
+        token of the last login or no new token could be generated.
+    """
+    with _cached_login_lock:
+        login = _cached_login
+        if login is None or stale_token != login["token"]:
+            return None
+        if login["new_token"] is None:
+            try:
+                token_cache.remove_token(base_url, login["username"])
+            except OSError:
+                pass
+            response = _generate_token(login["username"], login["password"], use_cache=True)
+            login["new_token"] = response.get("token") or ""
+        return login["new_token"] or None
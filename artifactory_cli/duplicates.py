@@ -0,0 +1,227 @@
+import os
+import queue
+import sqlite3
+import threading
+
+from artifactory_cli import async_controls, controls
+from artifactory_cli.paths import cache_dir, instance_slug
+
+
+# Deep file lists fetched at once; each one is a heavy query on the server
+default_concurrency = 8
+
+# Files handed from the fetching workers to the index writer per batch
+BATCH_SIZE = 10000
+
+# Batches buffered for the writer; bounds memory however fast the server answers
+MAX_BATCHES = 16
+
+# Page cache of the index in KiB; sorting and grouping beyond this spill to temporary files
+CACHE_KIB = 64 * 1024
+
+# Checksums are stored as 20 raw bytes and repositories as small integers,
+# so each file costs its path plus a few dozen bytes on disk
+SCHEMA = """
+CREATE TABLE repos (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL
+);
+
+CREATE TABLE files (
+    sha1 BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    repo INTEGER NOT NULL,
+    path TEXT NOT NULL
+);
+"""
+
+
+def index_path():
+    """
+    Returns the index file of the current instance, e.g. ~/.cache/artifactory-cli/duplicates/example.jfrog.io.sqlite3.
+    """
+    return os.path.join(cache_dir("duplicates"), f"{instance_slug(controls.base_url)}.sqlite3")
+
+
+def _connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode = OFF")
+    connection.execute("PRAGMA synchronous = OFF")
+    connection.execute(f"PRAGMA cache_size = -{CACHE_KIB}")
+    connection.execute("PRAGMA temp_store = FILE")
+    return connection
+
+
+def build_index(repos, path=None, concurrency=None, on_progress=None):
+    """
+    Fetches the deep file lists of repos concurrently into an on-disk checksum index.
+
+    Each file list is streamed and parsed as it arrives, and its files go to
+    a single writer thread in batches through a bounded queue. Memory use
+    therefore stays flat for tens of millions of files; the index itself
+    lives on disk and replaces any previous one.
+
+    Args:
+        repos (list): Repository keys.
+        path (str): Index file. Defaults to index_path().
+        concurrency (int): File lists fetched at once. Defaults to default_concurrency.
+        on_progress (callable): Called as on_progress(files_indexed) after every batch.
+
+    Returns:
+        dict: "files" indexed, "repositories" scanned, and "errors" as {repo_key: message}
+        for repositories whose file list failed (their files are left out).
+    """
+    path = path or index_path()
+    for suffix in ("", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    batches = queue.Queue(maxsize=MAX_BATCHES)
+    state = {"files": 0, "failed": set(), "error": None}
+
+    def write():
+        # Whatever fails, the queue is drained until the end so the fetching workers never block
+        connection = None
+        try:
+            connection = _connect(path)
+            connection.executescript(SCHEMA)
+            connection.executemany("INSERT INTO repos (id, key) VALUES (?, ?)", enumerate(repos))
+        except Exception as e:
+            state["error"] = e
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                if state["error"]:
+                    continue
+                try:
+                    connection.executemany("INSERT INTO files (sha1, size, repo, path) VALUES (?, ?, ?, ?)", batch)
+                    state["files"] += len(batch)
+                    if on_progress:
+                        on_progress(state["files"])
+                except Exception as e:
+                    state["error"] = e
+            if not state["error"]:
+                # Partly fetched repositories are dropped so the analysis never counts half a repository
+                if state["failed"]:
+                    state["files"] -= connection.executemany("DELETE FROM files WHERE repo = ?",
+                                                             ((repo,) for repo in state["failed"])).rowcount
+                connection.execute("CREATE INDEX files_sha1 ON files (sha1, size, repo)")
+                connection.commit()
+        except Exception as e:
+            state["error"] = e
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def scan(repo_id, repo_key):
+        batch = []
+        for entry in controls.iter_file_list_control(repo_key):
+            if entry.get("folder") or not entry.get("sha1"):
+                continue
+            batch.append((bytes.fromhex(entry["sha1"]), int(entry.get("size") or 0), repo_id,
+                          entry["uri"].lstrip("/")))
+            if len(batch) == BATCH_SIZE:
+                batches.put(batch)
+                batch = []
+        if batch:
+            batches.put(batch)
+
+    errors = {}
+
+    def collect(item, result):
+        if isinstance(result, Exception):
+            state["failed"].add(item[0])
+            errors[item[1]] = str(result)
+
+    writer = threading.Thread(target=write, name="artifactory-cli-duplicates", daemon=True)
+    writer.start()
+    try:
+        async_controls.run_each(scan, enumerate(repos), concurrency or default_concurrency, collect)
+    finally:
+        batches.put(None)
+        writer.join()
+    if isinstance(state["error"], sqlite3.Error):
+        raise Exception(f"Failed to write the checksum index '{path}': {state['error']}")
+    if state["error"]:
+        raise state["error"]
+
+    return {"files": state["files"], "repositories": len(repos) - len(errors), "errors": errors}
+
+
+def analyze(path=None, top=10, examples=3):
+    """
+    Reports duplicate binaries from a checksum index built by build_index.
+
+    Logical bytes count every file; physical bytes count each checksum once,
+    which is what Artifactory actually stores. A duplicate group is a
+    checksum stored under more than one path; its wasted bytes are the
+    copies beyond the first.
+
+    Args:
+        path (str): Index file. Defaults to index_path().
+        top (int): Number of groups and repositories to list.
+        examples (int): Paths listed per group.
+
+    Returns:
+        dict: Totals ("repositories", "files", "logicalBytes", "physicalBytes",
+        "duplicateBytes", "groups", "crossRepoGroups"), "topGroups" by wasted
+        bytes and "topRepositories" by bytes also stored in another repository.
+
+    Raises:
+        Exception: If there is no index yet.
+    """
+    path = path or index_path()
+    if not os.path.exists(path):
+        raise Exception("No checksum index yet. Run 'artifactory-cli duplicates' without --from-index first.")
+
+    connection = _connect(path)
+    try:
+        repositories, = connection.execute("SELECT COUNT(*) FROM repos").fetchone()
+        files, logical = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM files").fetchone()
+        unique, physical, groups, cross_repo, wasted = connection.execute("""
+            SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(copies > 1), 0), COALESCE(SUM(repos > 1), 0),
+                   COALESCE(SUM(size * (copies - 1)), 0)
+            FROM (SELECT MAX(size) AS size, COUNT(*) AS copies, COUNT(DISTINCT repo) AS repos
+                  FROM files GROUP BY sha1)
+        """).fetchone()
+
+        top_groups = []
+        for sha1, size, copies, repos in connection.execute("""
+            SELECT sha1, MAX(size), COUNT(*), COUNT(DISTINCT repo) FROM files
+            GROUP BY sha1 HAVING COUNT(*) > 1
+            ORDER BY MAX(size) * (COUNT(*) - 1) DESC LIMIT ?
+        """, (top,)).fetchall():
+            paths = [f"{key}/{item_path}" for key, item_path in connection.execute(
+                "SELECT repos.key, files.path FROM files JOIN repos ON repos.id = files.repo "
+                "WHERE files.sha1 = ? ORDER BY repos.key, files.path LIMIT ?", (sha1, examples))]
+            top_groups.append({"sha1": sha1.hex(), "size": size, "copies": copies, "repositories": repos,
+                               "wastedBytes": size * (copies - 1), "examples": paths})
+
+        totals = {repo: (count, size) for repo, count, size in
+                  connection.execute("SELECT repo, COUNT(*), SUM(size) FROM files GROUP BY repo")}
+        top_repositories = [
+            {"repo": key, "files": totals[repo][0], "bytes": totals[repo][1], "sharedFiles": count, "sharedBytes": size}
+            for repo, key, count, size in connection.execute("""
+                WITH shared AS (SELECT sha1 FROM files GROUP BY sha1 HAVING COUNT(DISTINCT repo) > 1)
+                SELECT files.repo, repos.key, COUNT(*), SUM(files.size)
+                FROM files JOIN shared ON shared.sha1 = files.sha1 JOIN repos ON repos.id = files.repo
+                GROUP BY files.repo ORDER BY SUM(files.size) DESC LIMIT ?
+            """, (top,))
+        ]
+    finally:
+        connection.close()
+
+    return {
+        "repositories": repositories,
+        "files": files,
+        "uniqueBinaries": unique,
+        "logicalBytes": logical,
+        "physicalBytes": physical,
+        "duplicateBytes": wasted,
+        "groups": groups,
+        "crossRepoGroups": cross_repo,
+        "topGroups": top_groups,
+        "topRepositories": top_repositories,
+    }
@@ -0,0 +1,202 @@
+import json
+import os
+import threading
+import time
+
+import requests
+
+from artifactory_cli import client
+from artifactory_cli.models import StorageInfo
+
+
+# Health checks run against every instance, and the endpoint each one calls
+CHECKS = ("ping", "version", "storage")
+ENDPOINTS = {
+    "ping": "/artifactory/api/system/ping",
+    "version": "/artifactory/api/system/version",
+    "storage": "/artifactory/api/storageinfo",
+}
+
+# Seconds an instance gets to answer all of its checks
+default_timeout = 10.0
+
+
+def _expand(value):
+    # "$VAR" / "${VAR}" references keep secrets out of the inventory file
+    return os.path.expandvars(value) if isinstance(value, str) else value
+
+
+def load_inventory(path, token=None, username=None, password=None):
+    """
+    Loads the Artifactory instances to check from a JSON or YAML inventory.
+
+    The inventory is a list of instances or an object with an "instances"
+    list. Each instance has a "url" and optionally a "name" and credentials:
+    a "token", or a "user" and "password". Values may reference environment
+    variables, e.g. {"token": "${EDGE_EU_TOKEN}"}. Instances without
+    credentials use the ones given here.
+
+    Args:
+        path (str): Path to a .json, .yaml or .yml file.
+        token (str): Default access token.
+        username (str): Default username, used with password for basic auth.
+        password (str): Default password.
+
+    Returns:
+        list: Instances as {"name", "url", "headers", "auth"} dicts.
+
+    Raises:
+        ValueError: If the inventory is malformed.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    with open(path, encoding="utf-8") as handle:
+        if extension in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML inventories need PyYAML. Install it with 'pip install PyYAML'.")
+            data = yaml.safe_load(handle)
+        elif extension == ".json":
+            data = json.load(handle)
+        else:
+            raise ValueError(f"Unsupported inventory type '{extension}'. Use .json, .yaml or .yml.")
+
+    if isinstance(data, dict):
+        data = data.get("instances")
+    if not isinstance(data, list):
+        raise ValueError("Inventory must be a list of instances or contain an 'instances' list.")
+
+    instances = []
+    seen = set()
+    for index, entry in enumerate(data, 1):
+        if isinstance(entry, str):
+            entry = {"url": entry}
+        if not isinstance(entry, dict) or not entry.get("url"):
+            raise ValueError(f"Instance #{index} needs a 'url'.")
+
+        url = _expand(entry["url"]).rstrip("/")
+        name = _expand(entry.get("name")) or url.split("://", 1)[-1]
+        if name in seen:
+            raise ValueError(f"Instance '{name}' is listed more than once.")
+        seen.add(name)
+
+        instance_token = _expand(entry.get("token"))
+        instance_user = _expand(entry.get("user"))
+        instance_password = _expand(entry.get("password"))
+        if not instance_token and not (instance_user and instance_password):
+            instance_token, instance_user, instance_password = token, username, password
+
+        headers = {"Authorization": f"Bearer {instance_token}"} if instance_token else {}
+        auth = (instance_user, instance_password) if not instance_token and instance_user and instance_password else None
+        instances.append({"name": name, "url": url, "headers": headers, "auth": auth})
+    return instances
+
+
+def _summarize(check, response):
+    if check == "ping":
+        return response.text.strip()
+    data = response.json()
+    if check == "version":
+        return data.get("version")
+    storage = StorageInfo.from_json(data)
+    return {
+        "repositories": sum(repo.repo_key != "TOTAL" for repo in storage.repositories),
+        "binariesSize": storage.binaries_summary.binaries_size,
+        "artifactsSize": storage.binaries_summary.artifacts_size,
+    }
+
+
+def run_check(instance, check, timeout=None):
+    """
+    Runs one health check against one instance.
+
+    Args:
+        instance (dict): An instance from load_inventory.
+        check (str): "ping", "version" or "storage".
+        timeout (float): Connect and read timeout in seconds.
+
+    Returns:
+        dict: {"ok", "ms", "value"} on success or {"ok", "ms", "error"} on failure.
+    """
+    timeout = timeout or default_timeout
+    start = time.perf_counter()
+    try:
+        response = client.get(instance["url"] + ENDPOINTS[check], headers=instance["headers"],
+                              auth=instance["auth"], timeout=(timeout, timeout))
+        response.raise_for_status()
+        value = _summarize(check, response)
+        return {"ok": True, "ms": (time.perf_counter() - start) * 1000, "value": value}
+    except requests.exceptions.Timeout:
+        error = f"timed out after {timeout:g}s"
+    except (requests.exceptions.RequestException, ValueError) as e:
+        error = str(e)
+    return {"ok": False, "ms": (time.perf_counter() - start) * 1000, "error": error}
+
+
+def check_fleet(instances, checks=CHECKS, timeout=None, on_result=None):
+    """
+    Runs the health checks against every instance at once.
+
+    Every (instance, check) pair runs on its own daemon thread and all of
+    them share one deadline, so the whole check takes as long as the slowest
+    instance and never longer than timeout. Checks still running at the
+    deadline are reported as timed out and left behind; being daemon
+    threads, they do not delay exit.
+
+    Args:
+        instances (list): Instances from load_inventory.
+        checks (tuple): Checks to run.
+        timeout (float): Seconds each instance gets to answer.
+        on_result (callable): Called as on_result(instance_name, check, result)
+            as checks finish.
+
+    Returns:
+        list: Per instance, in inventory order: {"name", "url", "ok", "ms",
+        "checks": {check: result}}, where "ms" is the slowest check.
+
+    Raises:
+        ValueError: If a check name is unknown.
+    """
+    unknown = [check for check in checks if check not in ENDPOINTS]
+    if unknown:
+        raise ValueError(f"Unknown check(s): {', '.join(unknown)}. Use: {', '.join(CHECKS)}")
+
+    timeout = timeout or default_timeout
+    results = [{"name": instance["name"], "url": instance["url"], "checks": {}} for instance in instances]
+    condition = threading.Condition()
+    state = {"finished": 0, "closed": False}
+
+    def work(index, check):
+        result = run_check(instances[index], check, timeout)
+        with condition:
+            if state["closed"]:
+                return
+            results[index]["checks"][check] = result
+            state["finished"] += 1
+            condition.notify()
+        if on_result:
+            on_result(instances[index]["name"], check, result)
+
+    for index in range(len(instances)):
+        for check in checks:
+            threading.Thread(target=work, args=(index, check), name="artifactory-cli-fleet", daemon=True).start()
+
+    deadline = time.monotonic() + timeout
+    total = len(instances) * len(checks)
+    with condition:
+        while state["finished"] < total:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            condition.wait(remaining)
+        state["closed"] = True
+
+    for result in results:
+        for check in checks:
+            result["checks"].setdefault(check, {"ok": False, "ms": timeout * 1000,
+                                                "error": f"timed out after {timeout:g}s"})
+        result["checks"] = {check: result["checks"][check] for check in checks}
+        result["ok"] = all(check["ok"] for check in result["checks"].values())
+        result["ms"] = max((check["ms"] for check in result["checks"].values()), default=0.0)
+    return results
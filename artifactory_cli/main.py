@@ -1,9 +1,12 @@
 import os
+import sys
 import time
-from InquirerPy import inquirer
-from artifactory_cli.views import *
 import argparse
 
+# Keep module-level imports light: InquirerPy, requests and the views are
+# imported only by the code paths that need them so scripted subcommands
+# start fast.
+
 
 def show_help():
     """
@@ -14,24 +17,97 @@ def show_help():
 
     Usage:
       artifactory-cli [--help]
+      artifactory-cli <command> [options]
 
     Options:
       --help                     Show this help menu.
 
+    Commands (run 'artifactory-cli <command> --help' for options):
+      menu                       Start the interactive menu (default).
+      ping                       Check the health status of the Artifactory system.
+      version                    Retrieve the current version of the Artifactory system.
+      storage                    Retrieve storage information for Artifactory.
+      storage --analytics        Top repositories and totals (--top, --by, --snapshot).
+      storage --diff [OLD NEW]   Growth between two storage snapshots.
+      duplicates [REPO...]       Binaries copied across repositories, from their checksums (--top, --json).
+      watch                      Live ping latency stats and storage changes (--interval, --samples FILE).
+      users list                 List all users.
+      users create               Create a user.
+      users import FILE          Create users from a CSV or JSONL file in parallel.
+      users delete USERNAME      Delete a user.
+      users bulk-delete          Delete users by --match, --email-domain or --file in parallel (--dry-run).
+      repos list                 List repositories (--type, --package-type, --filter).
+      repos create KEY           Create a repository.
+      repos update KEY           Update a repository's properties.
+      repos apply MANIFEST       Create/update repositories from a JSON/YAML manifest.
+      repos export OUTPUT        Save every repository's full configuration (directory or .jsonl).
+      repos import SNAPSHOT      Create/update repositories from an exported snapshot (--dry-run).
+      repos diff OLD [NEW]       Compare two snapshots, or a snapshot and the live configurations.
+      upload REPO PATH...        Upload files/directories in parallel (checksum deploy first).
+      download REPO PATH...      Download artifacts in parallel segments, resuming if interrupted.
+      sync DIR REPO              Upload new/changed files of a folder (--delete removes orphans).
+      aql CRITERIA               Page through an AQL query, writing JSONL or CSV (--output FILE).
+      cleanup plan REPO...       Plan deleting stale artifacts (--older-than, --not-downloaded-since, --min-size).
+      cleanup run PLAN           Delete the artifacts of a plan in parallel, resuming from its journal.
+      index refresh              Update the local index of users/repositories/storage (changed rows only).
+      index status               Show the row counts and age of the local index.
+      fleet INVENTORY            Ping/version/storage of many instances at once (--timeout, --json).
+
+    Throttling (any command):
+      --rate-limit N             Send at most N requests per second to each instance.
+      --max-concurrency N        Cap the adaptive number of requests in flight (default: 64).
+      Requests answered with 429/503 are retried after Retry-After, and the
+      number of parallel requests adapts to what the server tolerates.
+
+    Local index (any listing or selection):
+      --offline                  Read users, repositories and storage info from the local index.
+      --refresh                  Refresh the index first, then read from it.
+
+    Profiling (any command):
+      --profile                  Print per-endpoint request timings (p50/p99, first byte, connect, TLS) at exit.
+      --profile-output FILE      Also export the metrics as JSON (.json) or Prometheus text.
+
+    Credentials (flags or environment variables):
+      --url       ARTIFACTORY_URL       Base URL of the Artifactory instance.
+      --token     ARTIFACTORY_TOKEN     Access token; skips the login call.
+      --user      ARTIFACTORY_USER      Username used to generate a token.
+      --password  ARTIFACTORY_PASSWORD  Password used to generate a token.
+      Tokens generated from a username/password are cached on disk until
+      shortly before they expire; pass --no-token-cache to always log in.
+
     Menu Options:
       1. System Ping             Check the health status of the Artifactory system.
       2. Get System Version      Retrieve the current version of the Artifactory system.
       3. List Users              List all users in the Artifactory instance.
       4. Create User             Create a new user in the Artifactory instance.
-      5. Delete User             Delete an existing user from the Artifactory instance.
-      6. List Repositories       List all repositories in the Artifactory instance.
-      7. Create Repository       Create a new repository (local, remote, or virtual).
-      8. Update Repository       Update an existing repository's properties.
-      9. Get Storage Info        Retrieve storage information for Artifactory.
+      5. Bulk Create Users       Create users from a CSV or JSONL file in parallel.
+      6. Delete User             Delete an existing user from the Artifactory instance.
+      7. Bulk Delete Users       Delete users selected by pattern, email domain or file.
+      8. List Repositories       List all repositories in the Artifactory instance.
+      9. Create Repository       Create a new repository (local, remote, or virtual).
+      10. Update Repository      Update an existing repository's properties.
+      11. Apply Repo Manifest    Create/update repositories from a JSON/YAML manifest.
+      12. Export Repo Configs    Save every repository's full configuration to a snapshot.
+      13. Import Repo Configs    Create/update repositories from a snapshot.
+      14. Diff Repo Configs      Compare a snapshot with another one or with live configurations.
+      15. Get Storage Info       Retrieve storage information for Artifactory.
+      16. Storage Analytics      Top repositories, totals and a snapshot for growth tracking.
+      17. Duplicate Binaries     Find binaries copied across repositories and the bytes they take.
+      18. Upload Artifacts       Upload files or a directory to a repository.
+      19. Download Artifacts     Download artifacts, resuming interrupted downloads.
+      20. Sync Folder            Mirror a local folder into a repository.
+      21. AQL Search             Query items with AQL and save the results.
+      22. Plan Cleanup           Plan deleting stale artifacts and show the space to reclaim.
+      23. Run Cleanup            Delete the artifacts of a cleanup plan in parallel.
+      24. Fleet Health Check     Check every instance of an inventory file at once.
+      25. Watch                  Live ping latency and storage changes until Ctrl+C.
+      26. Refresh Local Index    Update the local index used by --offline.
     """
     print(help_text)
 
 def login():
+    from artifactory_cli.views import login_view
+
     while True:
         token = login_view()
         if token:
@@ -39,6 +115,9 @@ def login():
             break
 
 def main_menu():
+    from InquirerPy import inquirer
+    from artifactory_cli import views
+
     while True:
         # Display menu options
         choice = inquirer.select(
@@ -50,89 +129,853 @@ def main_menu():
                 "System Ping",
                 "System Version",
                 "Get Storage Info",
+                "Storage Analytics",
+                "Duplicate Binaries",
                 "List Users",
                 "Create User",
+                "Bulk Create Users",
                 "Delete User",
+                "Bulk Delete Users",
                 "List Repositories",
                 "Create Repository",
                 "Update Repository",
+                "Apply Repository Manifest",
+                "Export Repository Configs",
+                "Import Repository Configs",
+                "Diff Repository Configs",
+                "Upload Artifacts",
+                "Download Artifacts",
+                "Sync Folder",
+                "AQL Search",
+                "Plan Cleanup",
+                "Run Cleanup",
+                "Fleet Health Check",
+                "Watch",
+                "Refresh Local Index",
                 "Exit",
             ],
             default="System Ping",
         ).execute()
-        
+
         if choice == "System Ping":
-            system_ping_view()
-            os.system('pause') 
-            os.system('cls') 
-            
+            views.system_ping_view()
+            os.system('pause')
+            os.system('cls')
+
         elif choice == "System Version":
-            get_system_version_view()
+            views.get_system_version_view()
             os.system('pause')
             os.system('cls')
-            
+
         elif choice == "Get Storage Info":
-            get_storage_info_view()
-            os.system('pause') 
+            views.get_storage_info_view()
+            os.system('pause')
             os.system('cls')
-        
+
+        elif choice == "Storage Analytics":
+            views.storage_analytics_view(snapshot=True)
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Duplicate Binaries":
+            views.duplicates_view()
+            os.system('pause')
+            os.system('cls')
+
         elif choice == "List Users":
-            list_users_view()
+            views.list_users_view()
             os.system('pause')
             os.system('cls')
-                    
+
         elif choice == "Create User":
-            create_user_view()
+            views.create_user_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Bulk Create Users":
+            views.bulk_create_users_view()
             os.system('pause')
             os.system('cls')
-            
+
         elif choice == "Delete User":
-            delete_user_view()
-            os.system('pause') 
+            views.delete_user_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Bulk Delete Users":
+            views.bulk_delete_users_view()
+            os.system('pause')
             os.system('cls')
-            
+
         elif choice == "List Repositories":
-            list_repositories_view()
-            os.system('pause') 
+            views.list_repositories_view()
+            os.system('pause')
             os.system('cls')
-            
+
         elif choice == "Create Repository":
-            create_repository_view()
-            os.system('pause') 
+            views.create_repository_view()
+            os.system('pause')
             os.system('cls')
-            
+
         elif choice == "Update Repository":
-            update_repository_view()
-            os.system('pause') 
+            views.update_repository_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Apply Repository Manifest":
+            views.apply_manifest_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Export Repository Configs":
+            views.export_configs_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Import Repository Configs":
+            views.import_configs_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Diff Repository Configs":
+            views.diff_configs_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Upload Artifacts":
+            views.upload_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Download Artifacts":
+            views.download_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Sync Folder":
+            views.sync_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "AQL Search":
+            views.aql_search_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Plan Cleanup":
+            views.cleanup_plan_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Run Cleanup":
+            views.cleanup_run_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Fleet Health Check":
+            views.fleet_view()
+            os.system('pause')
+            os.system('cls')
+
+        elif choice == "Watch":
+            views.watch_view()
+            os.system('pause')
             os.system('cls')
-            
+
+        elif choice == "Refresh Local Index":
+            refresh_index()
+            os.system('pause')
+            os.system('cls')
+
         elif choice == "Exit":
             print("Exiting... Goodbye!")
             time.sleep(1.5)
             break
 
 
+def print_json(data):
+    import json
+    from artifactory_cli.models import to_json
+    print(json.dumps(data, indent=2, default=to_json))
+
+
+def configure_url(args):
+    """
+    Applies the base URL from --url or ARTIFACTORY_URL.
+    """
+    from artifactory_cli import controls
+
+    url = args.url or os.environ.get("ARTIFACTORY_URL")
+    if url:
+        controls.base_url = url.rstrip("/")
+
+
+def configure_connection(args):
+    """
+    Applies the base URL and credentials from flags or environment variables.
+
+    Returns:
+        bool: True if a token is available (given directly or generated by login).
+    """
+    from artifactory_cli import controls
+
+    configure_url(args)
+
+    token = args.token or os.environ.get("ARTIFACTORY_TOKEN")
+    if token:
+        controls.token = token
+        return True
+
+    username = args.user or os.environ.get("ARTIFACTORY_USER")
+    password = args.password or os.environ.get("ARTIFACTORY_PASSWORD")
+    if username and password:
+        response = controls.login_control(username, password, use_cache=not args.no_token_cache)
+        if "error" in response:
+            print(f"\n❌ Login failed: {response['error']}\n", file=sys.stderr)
+            return False
+        return True
+
+    return False
+
+
+def require_login(args):
+    if configure_connection(args):
+        return True
+    if sys.stdin.isatty():
+        login()
+        return True
+    print("❌ No credentials. Pass --token or --user/--password, or set ARTIFACTORY_TOKEN "
+          "or ARTIFACTORY_USER/ARTIFACTORY_PASSWORD.", file=sys.stderr)
+    return False
+
+
+def run_read_command(args, control_name, view_name):
+    """
+    Runs a read-only command, printing raw JSON with --json or the formatted view otherwise.
+    """
+    if args.json:
+        from artifactory_cli import controls, metadata_store
+        try:
+            if metadata_store.enabled and control_name in metadata_store.READERS:
+                table, reader = metadata_store.READERS[control_name]
+                print(metadata_store.describe(table), file=sys.stderr)
+                print_json(reader())
+            else:
+                print_json(getattr(controls, control_name)())
+            return True
+        except Exception as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            return False
+
+    from artifactory_cli import views
+    return getattr(views, view_name)()
+
+
+def cmd_menu(args):
+    configure_connection(args) or login()
+    main_menu()
+    return True
+
+
+def cmd_ping(args):
+    return run_read_command(args, "ping_system_control", "system_ping_view")
+
+
+def cmd_version(args):
+    return run_read_command(args, "get_system_version_control", "get_system_version_view")
+
+
+def cmd_duplicates(args):
+    from artifactory_cli.views import duplicates_view
+    return duplicates_view(args.repos, args.type, args.package_type, args.top, args.concurrency,
+                           from_index=args.from_index, as_json=args.json)
+
+
+def cmd_storage(args):
+    from artifactory_cli import views
+
+    if args.diff is not None:
+        if len(args.diff) not in (0, 2):
+            print("❌ --diff takes either no snapshots (the last two) or exactly two.", file=sys.stderr)
+            return False
+        return views.storage_diff_view(*args.diff, top=args.top)
+    if args.analytics or args.snapshot:
+        return views.storage_analytics_view(args.top, args.by, args.snapshot)
+    return run_read_command(args, "get_storage_info_control", "get_storage_info_view")
+
+
+def run_stream_command(args, iter_name, view_name):
+    """
+    Streams a listing, printing one JSON object per line with --json or the formatted view otherwise.
+    """
+    if args.json:
+        import json
+        from artifactory_cli import controls
+        try:
+            for record in getattr(controls, iter_name)():
+                print(json.dumps(record.to_json()))
+            return True
+        except Exception as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            return False
+
+    from artifactory_cli import views
+    return getattr(views, view_name)(stream=True)
+
+
+def cmd_watch(args):
+    from artifactory_cli.views import watch_view
+    return watch_view(args.interval, args.storage_interval, args.window, args.samples, args.count, args.top)
+
+
+def cmd_users_list(args):
+    # The local index is read in one query, so there is nothing to stream
+    if args.stream and not (args.offline or args.refresh):
+        return run_stream_command(args, "iter_users_control", "list_users_view")
+    return run_read_command(args, "list_users_control", "list_users_view")
+
+
+def cmd_users_create(args):
+    from artifactory_cli.views import create_user_view
+    password = args.new_password or os.environ.get("ARTIFACTORY_NEW_USER_PASSWORD")
+    return create_user_view(args.username, args.email, password, args.admin)
+
+
+def cmd_users_import(args):
+    from artifactory_cli.views import bulk_create_users_view
+    return bulk_create_users_view(args.file, args.concurrency)
+
+
+def cmd_users_delete(args):
+    from artifactory_cli.views import delete_user_view
+    return delete_user_view(args.username, assume_yes=args.yes)
+
+
+def cmd_users_bulk_delete(args):
+    from artifactory_cli.views import bulk_delete_users_view
+
+    args.match = args.match.strip() if args.match is not None else None
+    args.email_domain = args.email_domain.strip() if args.email_domain is not None else None
+    if args.match == "" or args.email_domain == "":
+        print("❌ --match and --email-domain cannot be blank.", file=sys.stderr)
+        return False
+    if not (args.match or args.email_domain or args.file) and not sys.stdin.isatty():
+        print("❌ Select users with --match, --email-domain or --file.", file=sys.stderr)
+        return False
+    return bulk_delete_users_view(args.match, args.email_domain, args.file, args.protect, args.dry_run,
+                                  args.concurrency, assume_yes=args.yes)
+
+
+def cmd_repos_list(args):
+    from artifactory_cli import controls, views
+
+    if args.filter and args.stream:
+        print("❌ --filter cannot be combined with --stream.", file=sys.stderr)
+        return False
+
+    if args.stream and not (args.offline or args.refresh):
+        if args.json:
+            import json
+            try:
+                for repo in controls.iter_repositories_control(args.type, args.package_type):
+                    print(json.dumps(repo.to_json()))
+                return True
+            except Exception as e:
+                print(f"❌ Error: {e}", file=sys.stderr)
+                return False
+        return views.list_repositories_view(stream=True, repo_type=args.type, package_type=args.package_type)
+
+    if args.json:
+        try:
+            if args.offline or args.refresh:
+                from artifactory_cli import metadata_store
+                print(metadata_store.describe("repositories"), file=sys.stderr)
+                repositories = metadata_store.list_repositories(args.type, args.package_type)
+            else:
+                repositories = controls.list_repositories_control(args.type, args.package_type)
+            if args.filter:
+                from artifactory_cli.search_index import index_for
+                repositories = index_for(repositories).search(args.filter, args.match)
+            print_json(repositories)
+            return True
+        except Exception as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            return False
+
+    return views.list_repositories_view(repo_type=args.type, package_type=args.package_type,
+                                        query=args.filter, match=args.match)
+
+
+def cmd_repos_create(args):
+    from artifactory_cli.views import create_repository_view
+    return create_repository_view(args.key, args.type, args.package_type, args.remote_url)
+
+
+def cmd_repos_update(args):
+    from artifactory_cli.views import update_repository_view
+    updates = {}
+    for field, value in (
+        ("description", args.description),
+        ("notes", args.notes),
+        ("includesPattern", args.includes),
+        ("excludesPattern", args.excludes),
+    ):
+        if value:
+            updates[field] = value
+    return update_repository_view(args.key, updates)
+
+
+def cmd_repos_apply(args):
+    from artifactory_cli.views import apply_manifest_view
+    return apply_manifest_view(args.manifest, dry_run=args.dry_run, concurrency=args.concurrency,
+                               assume_yes=args.yes)
+
+
+def cmd_repos_export(args):
+    from artifactory_cli.views import export_configs_view
+    return export_configs_view(args.output, args.type, args.package_type, args.concurrency)
+
+
+def cmd_repos_import(args):
+    from artifactory_cli.views import import_configs_view
+    return import_configs_view(args.snapshot, dry_run=args.dry_run, concurrency=args.concurrency,
+                               assume_yes=args.yes)
+
+
+def cmd_repos_diff(args):
+    from artifactory_cli.views import diff_configs_view
+    return diff_configs_view(args.old, args.new, args.concurrency, as_json=args.json)
+
+
+def cmd_upload(args):
+    from artifactory_cli.views import upload_view
+    return upload_view(args.repo, args.paths, args.target, args.concurrency, not args.no_checksum_deploy)
+
+
+def cmd_download(args):
+    from artifactory_cli.views import download_view
+    return download_view(args.repo, args.paths, args.dest, args.concurrency, args.segment_size, args.flat)
+
+
+def cmd_sync(args):
+    from artifactory_cli.views import sync_view
+    return sync_view(args.local_dir, args.repo, args.target, args.delete, args.dry_run,
+                     args.concurrency, args.yes)
+
+
+def cmd_aql(args):
+    import json
+    from artifactory_cli.views import aql_search_view
+
+    try:
+        if args.criteria.startswith("@"):
+            with open(args.criteria[1:], encoding="utf-8") as handle:
+                criteria = json.load(handle)
+        else:
+            criteria = json.loads(args.criteria)
+    except (OSError, ValueError) as e:
+        print(f"❌ Invalid criteria: {e}", file=sys.stderr)
+        return False
+
+    split = lambda value: [field.strip() for field in value.split(",") if field.strip()] if value else None
+    return aql_search_view(criteria, args.domain, split(args.include), split(args.sort), args.desc,
+                           args.limit, args.page_size, args.output, args.format)
+
+
+def cmd_cleanup_plan(args):
+    from artifactory_cli.models import parse_size
+    from artifactory_cli.views import cleanup_plan_view
+
+    min_size = parse_size(args.min_size) if args.min_size else None
+    if args.min_size and not min_size:
+        print(f"❌ Invalid size '{args.min_size}', e.g. 500MB.", file=sys.stderr)
+        return False
+    return bool(cleanup_plan_view(args.repos, args.older_than, args.not_downloaded_since, min_size, args.include,
+                                  args.exclude, args.output, args.page_size))
+
+
+def cmd_cleanup_run(args):
+    from artifactory_cli.views import cleanup_run_view
+    return cleanup_run_view(args.plan, args.concurrency, assume_yes=args.yes, journal=args.journal)
+
+
+def cmd_fleet(args):
+    checks = [check.strip() for check in args.checks.split(",") if check.strip()]
+    token = args.token or os.environ.get("ARTIFACTORY_TOKEN")
+    username = args.user or os.environ.get("ARTIFACTORY_USER")
+    password = args.password or os.environ.get("ARTIFACTORY_PASSWORD")
+
+    if args.json:
+        from artifactory_cli.fleet import check_fleet, load_inventory
+        try:
+            results = check_fleet(load_inventory(args.inventory, token, username, password), checks, args.timeout)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            return False
+        print_json(results)
+        return all(result["ok"] for result in results)
+
+    from artifactory_cli.views import fleet_view
+    return fleet_view(args.inventory, checks, args.timeout, token, username, password)
+
+
+def refresh_index(tables=None):
+    """
+    Refreshes the local metadata index, printing what changed per table to stderr.
+
+    Returns:
+        bool: True if every table was refreshed.
+    """
+    from artifactory_cli import metadata_store
+
+    start = time.perf_counter()
+    results = metadata_store.refresh(tables or metadata_store.TABLES)
+    ok = True
+    for table, result in results.items():
+        if "error" in result:
+            ok = False
+            print(f"❌ {table}: {result['error']}", file=sys.stderr)
+        else:
+            print(f"🗂  {table}: {result['rows']} rows, {result['inserted']} new, {result['updated']} changed, "
+                  f"{result['deleted']} removed", file=sys.stderr)
+    print(f"Index refreshed in {time.perf_counter() - start:.2f}s ({metadata_store.database_path()}).",
+          file=sys.stderr)
+    return ok
+
+
+def cmd_index_refresh(args):
+    tables = [table.strip() for table in args.tables.split(",") if table.strip()] if args.tables else None
+    return refresh_index(tables)
+
+
+def cmd_index_status(args):
+    from artifactory_cli import metadata_store
+
+    status = metadata_store.status()
+    if args.json:
+        print_json(status)
+        return True
+    print(f"🗂  {metadata_store.database_path()}")
+    for table, entry in status.items():
+        flag = "⚠️  stale" if entry["stale"] else "✅"
+        age = f"{metadata_store.format_age(entry['age'])} ago" if entry["age"] is not None else "never"
+        print(f"  {table:<14} {entry['rows']:>8} rows   refreshed {age:>9}   {flag}")
+    return True
+
+
+def report_profile(args):
+    """
+    Prints the request metrics summary and writes the export file, if profiling.
+    """
+    from artifactory_cli import metrics
+
+    print("\n🔹 HTTP Profile:\n" + metrics.format_table(), file=sys.stderr)
+    if args.profile_output:
+        output_format = args.profile_format or ("json" if args.profile_output.endswith(".json") else "prometheus")
+        with open(args.profile_output, "w", encoding="utf-8") as handle:
+            handle.write(metrics.to_json() if output_format == "json" else metrics.to_prometheus())
+        print(f"Metrics written to '{args.profile_output}' ({output_format}).", file=sys.stderr)
+
+
+def build_parser():
+    """
+    Builds the argument parser with one subcommand per operation.
+    """
+    from artifactory_cli.utils_list import PACKAGE_TYPES, REPO_TYPE
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--url", help="Artifactory base URL (env: ARTIFACTORY_URL)")
+    common.add_argument("--token", help="Access token (env: ARTIFACTORY_TOKEN)")
+    common.add_argument("--user", help="Username for login (env: ARTIFACTORY_USER)")
+    common.add_argument("--password", help="Password for login (env: ARTIFACTORY_PASSWORD)")
+    common.add_argument("--json", action="store_true", help="Print raw JSON for read commands")
+    common.add_argument("--no-token-cache", action="store_true",
+                        help="Always generate a new token instead of reusing a cached one")
+    common.add_argument("--rate-limit", type=float, metavar="N",
+                        help="Send at most N requests per second to each instance (default: unlimited)")
+    common.add_argument("--max-concurrency", type=int, metavar="N",
+                        help="Upper bound for the adaptive number of requests in flight (default: 64)")
+    common.add_argument("--offline", action="store_true",
+                        help="Read users, repositories and storage info from the local index instead of the API")
+    common.add_argument("--refresh", action="store_true",
+                        help="Refresh the local index first, then read from it (implies --offline)")
+    common.add_argument("--profile", action="store_true",
+                        help="Time every HTTP request and print a per-endpoint summary at exit")
+    common.add_argument("--profile-output", metavar="FILE",
+                        help="Also write the request metrics to FILE (implies --profile)")
+    common.add_argument("--profile-format", choices=["json", "prometheus"],
+                        help="Format of --profile-output (default: json for .json files, else prometheus)")
+
+    parser = argparse.ArgumentParser(prog="artifactory-cli", add_help=False)  # Disable default help
+    parser.add_argument("--help", action="store_true", help="Show help menu")
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("menu", parents=[common], help="Start the interactive menu").set_defaults(func=cmd_menu)
+    commands.add_parser("ping", parents=[common], help="Ping the system").set_defaults(func=cmd_ping)
+    commands.add_parser("version", parents=[common], help="Show the system version").set_defaults(func=cmd_version)
+    storage = commands.add_parser("storage", parents=[common], help="Show storage information")
+    storage.add_argument("--analytics", action="store_true",
+                         help="Show top repositories and totals per package/repository type")
+    storage.add_argument("--top", type=int, default=10, help="Number of repositories to show (default: 10)")
+    storage.add_argument("--by", choices=["space", "files", "folders", "items"], default="space",
+                         help="Column used to rank repositories (default: space)")
+    storage.add_argument("--snapshot", action="store_true", help="Save a timestamped snapshot (implies --analytics)")
+    storage.add_argument("--diff", nargs="*", metavar="SNAPSHOT",
+                         help="Compare two snapshots (default: the two most recent)")
+    storage.set_defaults(func=cmd_storage)
+
+    duplicates = commands.add_parser("duplicates", parents=[common],
+                                     help="Find binaries stored in more than one repository or path")
+    duplicates.add_argument("repos", nargs="*", help="Repository keys (default: every local repository)")
+    duplicates.add_argument("--type", choices=REPO_TYPE + ["federated"],
+                            help="Repository type to analyze when no keys are given (default: local)")
+    duplicates.add_argument("--package-type", choices=PACKAGE_TYPES, help="Only repositories of this package type")
+    duplicates.add_argument("--top", type=int, default=10, help="Groups and repositories to list (default: 10)")
+    duplicates.add_argument("--concurrency", type=int, default=8, help="File lists fetched at once (default: 8)")
+    duplicates.add_argument("--from-index", action="store_true",
+                            help="Analyze the index of the last run again instead of fetching the file lists")
+    duplicates.set_defaults(func=cmd_duplicates)
+
+    watch = commands.add_parser("watch", parents=[common], help="Monitor ping latency and storage changes live")
+    watch.add_argument("--interval", type=float, default=1.0, help="Seconds between pings (default: 1)")
+    watch.add_argument("--storage-interval", type=float, default=60.0,
+                       help="Seconds between storage polls, 0 to disable (default: 60)")
+    watch.add_argument("--window", type=int, default=300, help="Pings covered by the rolling statistics (default: 300)")
+    watch.add_argument("--samples", metavar="FILE", help="Append every sample to this JSONL file")
+    watch.add_argument("--count", type=int, help="Stop after this many pings (default: run until Ctrl+C)")
+    watch.add_argument("--top", type=int, default=20, help="Changed repositories shown per poll (default: 20)")
+    watch.set_defaults(func=cmd_watch)
+
+    users = commands.add_parser("users", help="Manage users").add_subparsers(dest="action", required=True)
+    list_users = users.add_parser("list", parents=[common], help="List users")
+    list_users.add_argument("--stream", action="store_true",
+                            help="Print users as they arrive (JSON Lines with --json)")
+    list_users.set_defaults(func=cmd_users_list)
+
+    create_user = users.add_parser("create", parents=[common], help="Create a user")
+    create_user.add_argument("--username", required=True)
+    create_user.add_argument("--email", required=True)
+    create_user.add_argument("--new-password", help="Password of the new user (env: ARTIFACTORY_NEW_USER_PASSWORD)")
+    create_user.add_argument("--admin", action="store_true", help="Grant admin privileges")
+    create_user.set_defaults(func=cmd_users_create)
+
+    import_users = users.add_parser("import", parents=[common], help="Create users from a CSV/JSONL file")
+    import_users.add_argument("file")
+    import_users.add_argument("--concurrency", type=int,
+                              help="Parallel workers (default: adaptive, see --max-concurrency)")
+    import_users.set_defaults(func=cmd_users_import)
+
+    delete_user = users.add_parser("delete", parents=[common], help="Delete a user")
+    delete_user.add_argument("username")
+    delete_user.add_argument("--yes", action="store_true", help="Do not ask for confirmation")
+    delete_user.set_defaults(func=cmd_users_delete)
+
+    bulk_delete = users.add_parser("bulk-delete", parents=[common], help="Delete many users at once")
+    bulk_delete.add_argument("--match", metavar="REGEX", help="Select users whose username matches this pattern")
+    bulk_delete.add_argument("--email-domain", metavar="DOMAIN", help="Select users with an email in this domain")
+    bulk_delete.add_argument("--file", help="Select the usernames listed in a .txt, .csv or .jsonl file")
+    bulk_delete.add_argument("--protect", metavar="USERNAME", action="append",
+                             help="Never delete this user (repeatable; adds to ARTIFACTORY_PROTECTED_USERS)")
+    bulk_delete.add_argument("--dry-run", action="store_true", help="Only list the selected users")
+    bulk_delete.add_argument("--yes", action="store_true", help="Do not ask for confirmation")
+    bulk_delete.add_argument("--concurrency", type=int,
+                             help="Parallel deletes (default: adaptive, see --max-concurrency)")
+    bulk_delete.set_defaults(func=cmd_users_bulk_delete)
+
+    repos = commands.add_parser("repos", help="Manage repositories").add_subparsers(dest="action", required=True)
+    list_repos = repos.add_parser("list", parents=[common], help="List repositories")
+    list_repos.add_argument("--stream", action="store_true",
+                            help="Print repositories as they arrive (JSON Lines with --json)")
+    list_repos.add_argument("--type", choices=REPO_TYPE + ["federated", "distribution"],
+                            help="Only list this repository type (filtered by the server)")
+    list_repos.add_argument("--package-type", choices=PACKAGE_TYPES,
+                            help="Only list this package type (filtered by the server)")
+    list_repos.add_argument("--filter", help="Search key, type, package type and URL locally")
+    list_repos.add_argument("--match", choices=["auto", "prefix", "substring", "fuzzy"], default="auto",
+                            help="How --filter matches (default: auto, tries prefix, substring, then fuzzy)")
+    list_repos.set_defaults(func=cmd_repos_list)
+
+    create_repo = repos.add_parser("create", parents=[common], help="Create a repository")
+    create_repo.add_argument("key")
+    create_repo.add_argument("--type", required=True, choices=REPO_TYPE)
+    create_repo.add_argument("--package-type", required=True, choices=PACKAGE_TYPES)
+    create_repo.add_argument("--remote-url", help="Upstream URL for remote repositories")
+    create_repo.set_defaults(func=cmd_repos_create)
+
+    update_repo = repos.add_parser("update", parents=[common], help="Update a repository")
+    update_repo.add_argument("key")
+    update_repo.add_argument("--description")
+    update_repo.add_argument("--notes")
+    update_repo.add_argument("--includes", help="Includes pattern, e.g. '**/*'")
+    update_repo.add_argument("--excludes", help="Excludes pattern, e.g. '*.tmp'")
+    update_repo.set_defaults(func=cmd_repos_update)
+
+    apply_repos = repos.add_parser("apply", parents=[common], help="Apply a repository manifest")
+    apply_repos.add_argument("manifest")
+    apply_repos.add_argument("--dry-run", action="store_true", help="Only show the plan")
+    apply_repos.add_argument("--yes", action="store_true", help="Do not ask for confirmation")
+    apply_repos.add_argument("--concurrency", type=int,
+                             help="Parallel API calls (default: adaptive, see --max-concurrency)")
+    apply_repos.set_defaults(func=cmd_repos_apply)
+
+    export_repos = repos.add_parser("export", parents=[common], help="Export full repository configurations")
+    export_repos.add_argument("output", help="Snapshot directory, or a .jsonl file")
+    export_repos.add_argument("--type", choices=REPO_TYPE + ["federated", "distribution"],
+                              help="Only export this repository type")
+    export_repos.add_argument("--package-type", choices=PACKAGE_TYPES, help="Only export this package type")
+    export_repos.add_argument("--concurrency", type=int,
+                              help="Parallel API calls (default: adaptive, see --max-concurrency)")
+    export_repos.set_defaults(func=cmd_repos_export)
+
+    import_repos = repos.add_parser("import", parents=[common], help="Import repository configurations")
+    import_repos.add_argument("snapshot", help="Snapshot directory or .jsonl file from 'repos export'")
+    import_repos.add_argument("--dry-run", action="store_true", help="Only show the plan")
+    import_repos.add_argument("--yes", action="store_true", help="Do not ask for confirmation")
+    import_repos.add_argument("--concurrency", type=int,
+                              help="Parallel API calls (default: adaptive, see --max-concurrency)")
+    import_repos.set_defaults(func=cmd_repos_import)
+
+    diff_repos = repos.add_parser("diff", parents=[common], help="Compare repository configurations")
+    diff_repos.add_argument("old", help="Snapshot to compare")
+    diff_repos.add_argument("new", nargs="?", help="Snapshot to compare with (default: live configurations)")
+    diff_repos.add_argument("--concurrency", type=int,
+                            help="Parallel API calls (default: adaptive, see --max-concurrency)")
+    diff_repos.set_defaults(func=cmd_repos_diff)
+
+    upload = commands.add_parser("upload", parents=[common], help="Upload files or directories to a repository")
+    upload.add_argument("repo", help="Target repository key")
+    upload.add_argument("paths", nargs="+", help="Files or directories to upload")
+    upload.add_argument("--target", default="", help="Folder inside the repository (default: root)")
+    upload.add_argument("--concurrency", type=int, default=8, help="Parallel uploads (default: 8)")
+    upload.add_argument("--no-checksum-deploy", action="store_true",
+                        help="Always send file contents instead of trying a checksum deploy first")
+    upload.set_defaults(func=cmd_upload)
+
+    download = commands.add_parser("download", parents=[common], help="Download artifacts with parallel range requests")
+    download.add_argument("repo", help="Repository key")
+    download.add_argument("paths", nargs="+", help="Artifact paths inside the repository")
+    download.add_argument("--dest", default=".", help="Destination folder (default: current folder)")
+    download.add_argument("--flat", action="store_true", help="Save files by name only, without the repository folders")
+    download.add_argument("--concurrency", type=int, default=4, help="Segments fetched in parallel per file (default: 4)")
+    download.add_argument("--segment-size", type=float, default=8, metavar="MB", help="Segment size in MB (default: 8)")
+    download.set_defaults(func=cmd_download)
+
+    sync = commands.add_parser("sync", parents=[common], help="Mirror a local folder into a repository")
+    sync.add_argument("local_dir", help="Local folder to mirror")
+    sync.add_argument("repo", help="Target repository key")
+    sync.add_argument("--target", default="", help="Folder inside the repository (default: root)")
+    sync.add_argument("--delete", action="store_true", help="Delete remote files that do not exist locally")
+    sync.add_argument("--dry-run", action="store_true", help="Only show what would change")
+    sync.add_argument("--yes", action="store_true", help="Do not ask before deleting remote files")
+    sync.add_argument("--concurrency", type=int, default=8, help="Parallel hashing and uploads (default: 8)")
+    sync.set_defaults(func=cmd_sync)
+
+    aql = commands.add_parser("aql", parents=[common], help="Run an AQL query and write the results as JSONL or CSV")
+    aql.add_argument("criteria", help='find() criteria as JSON, e.g. \'{"repo": "libs-release-local"}\', or @FILE')
+    aql.add_argument("--domain", default="items", help="Primary domain (default: items)")
+    aql.add_argument("--include", help="Comma-separated fields to return, e.g. repo,path,name,size")
+    aql.add_argument("--sort", help="Comma-separated fields to sort by (items default to repo,path,name)")
+    aql.add_argument("--desc", action="store_true", help="Sort descending")
+    aql.add_argument("--limit", type=int, help="Stop after this many rows")
+    aql.add_argument("--page-size", type=int, default=10000, help="Rows per request (default: 10000)")
+    aql.add_argument("--output", help="Output file (default: print to stdout)")
+    aql.add_argument("--format", choices=["jsonl", "csv"], help="Output format (default: from the file extension, else jsonl)")
+    aql.set_defaults(func=cmd_aql)
+
+    cleanup = commands.add_parser("cleanup", help="Delete stale artifacts").add_subparsers(dest="action",
+                                                                                          required=True)
+    cleanup_plan = cleanup.add_parser("plan", parents=[common], help="Plan deleting stale artifacts")
+    cleanup_plan.add_argument("repos", nargs="+", help="Repository keys to clean up")
+    cleanup_plan.add_argument("--older-than", type=int, metavar="DAYS", help="Only artifacts created DAYS ago or earlier")
+    cleanup_plan.add_argument("--not-downloaded-since", type=int, metavar="DAYS",
+                              help="Only artifacts not downloaded in DAYS (or never)")
+    cleanup_plan.add_argument("--min-size", metavar="SIZE", help="Only artifacts of at least SIZE, e.g. 100MB")
+    cleanup_plan.add_argument("--include", action="append", metavar="PATTERN",
+                              help="Only paths matching this glob, e.g. '*/snapshots/*' (repeatable)")
+    cleanup_plan.add_argument("--exclude", action="append", metavar="PATTERN",
+                              help="Keep paths matching this glob (repeatable)")
+    cleanup_plan.add_argument("--output", help="Plan file (default: cleanup-plan-<timestamp>.jsonl)")
+    cleanup_plan.add_argument("--page-size", type=int, default=10000, help="AQL rows per request (default: 10000)")
+    cleanup_plan.set_defaults(func=cmd_cleanup_plan)
+
+    cleanup_run = cleanup.add_parser("run", parents=[common], help="Delete the artifacts of a plan")
+    cleanup_run.add_argument("plan", help="Plan file from 'cleanup plan'")
+    cleanup_run.add_argument("--yes", action="store_true", help="Do not ask for confirmation")
+    cleanup_run.add_argument("--concurrency", type=int,
+                             help="Parallel deletes (default: adaptive, see --max-concurrency)")
+    cleanup_run.add_argument("--journal", help="Journal of deleted artifacts (default: PLAN.journal)")
+    cleanup_run.set_defaults(func=cmd_cleanup_run)
+
+    index = commands.add_parser("index", help="Manage the local metadata index").add_subparsers(dest="action",
+                                                                                             required=True)
+    index_refresh = index.add_parser("refresh", parents=[common], help="Update the index, rewriting only changed rows")
+    index_refresh.add_argument("--tables", help="Comma-separated tables: users,repositories,storage (default: all)")
+    index_refresh.set_defaults(func=cmd_index_refresh)
+    index.add_parser("status", parents=[common], help="Show the row counts and age of the index").set_defaults(
+        func=cmd_index_status)
+
+    fleet = commands.add_parser("fleet", parents=[common], help="Check many Artifactory instances at once")
+    fleet.add_argument("inventory", help="JSON/YAML file listing the instances (url, name, token or user/password)")
+    fleet.add_argument("--checks", default="ping,version,storage",
+                       help="Comma-separated checks to run (default: ping,version,storage)")
+    fleet.add_argument("--timeout", type=float, default=10.0, help="Seconds each instance gets to answer (default: 10)")
+    fleet.set_defaults(func=cmd_fleet)
+
+    return parser
+
+
 def main():
     """
     Main entry point for the CLI application.
-    Handles command-line arguments and displays the menu.
+    Handles command-line arguments and runs a subcommand or the interactive menu.
     """
-    parser = argparse.ArgumentParser(add_help=False)  # Disable default help
-    parser.add_argument("--help", action="store_true", help="Show help menu")
+    parser = build_parser()
     args = parser.parse_args()
 
     if args.help:
         show_help()
         return
-    
+
+    if not args.command:
+        args = parser.parse_args(["menu"])
+
+    if args.rate_limit is not None or args.max_concurrency:
+        from artifactory_cli import scheduler
+        scheduler.configure(rate=args.rate_limit, maximum=args.max_concurrency)
+
+    profile = args.profile or args.profile_output
+    if profile:
+        from artifactory_cli import metrics
+        metrics.enable()
+
+    if args.offline or args.refresh:
+        from artifactory_cli import metadata_store
+        metadata_store.enable()
+
     try:
-        login()
-        main_menu()
-        
+        if args.command == "menu":
+            args.func(args)
+            return
+
+        # Reading the local indexes needs no credentials; fleet checks use those of each inventory entry
+        if (args.offline and not args.refresh) or (args.command == "index" and args.action == "status") \
+                or getattr(args, "from_index", False):
+            configure_url(args)
+        elif args.command != "fleet" and not require_login(args):
+            sys.exit(2)
+        if args.refresh and args.command != "index" and not refresh_index():
+            sys.exit(1)
+        if not args.func(args):
+            sys.exit(1)
+
     except KeyboardInterrupt:
         print("\n\n👋 Application terminated by user (Ctrl+C). Goodbye!")
     except Exception as e:
         print(f"\n❌ An unexpected error occurred: {e}\n")
+        sys.exit(1)
+    finally:
+        if profile:
+            report_profile(args)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+
+from artifactory_cli import async_controls, controls, scheduler
+from artifactory_cli.paths import cache_dir, instance_slug
+
+
+# Settings that the repository listing exposes and can be compared directly
+LISTED_FIELDS = ("description", "url")
+
+
+def load_manifest(path):
+    """
+    Loads the desired repositories from a JSON or YAML manifest.
+
+    The manifest is either a list of repositories or an object with a
+    "repositories" list. Each repository uses the Artifactory configuration
+    keys, e.g. {"key": "libs-local", "rclass": "local", "packageType": "maven"}.
+
+    Args:
+        path (str): Path to a .json, .yaml or .yml file.
+
+    Returns:
+        list: Repository specs.
+
+    Raises:
+        ValueError: If the manifest is malformed.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    with open(path, encoding="utf-8") as handle:
+        if extension in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML manifests need PyYAML. Install it with 'pip install PyYAML'.")
+            data = yaml.safe_load(handle)
+        elif extension == ".json":
+            data = json.load(handle)
+        else:
+            raise ValueError(f"Unsupported manifest type '{extension}'. Use .json, .yaml or .yml.")
+
+    if isinstance(data, dict):
+        data = data.get("repositories")
+    if not isinstance(data, list):
+        raise ValueError("Manifest must be a list of repositories or contain a 'repositories' list.")
+
+    specs = []
+    seen = set()
+    for index, spec in enumerate(data, 1):
+        if not isinstance(spec, dict):
+            raise ValueError(f"Repository #{index} must be an object.")
+        missing = [field for field in ("key", "rclass", "packageType") if not spec.get(field)]
+        if missing:
+            raise ValueError(f"Repository #{index} is missing: {', '.join(missing)}")
+        if spec["key"] in seen:
+            raise ValueError(f"Repository '{spec['key']}' is listed more than once.")
+        if spec["rclass"].lower() == "remote" and not spec.get("url"):
+            raise ValueError(f"Remote repository '{spec['key']}' needs a 'url'.")
+        seen.add(spec["key"])
+        specs.append(spec)
+
+    return specs
+
+
+def spec_digest(spec):
+    """
+    Returns a stable hash of a repository spec, independent of key order.
+    """
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+
+def _state_path():
+    return os.path.join(cache_dir("apply-state"), f"{instance_slug(controls.base_url)}.json")
+
+
+def load_state():
+    """
+    Returns {repo_key: spec_digest} for the specs last applied to this instance.
+    """
+    try:
+        with open(_state_path(), encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state):
+    with open(_state_path(), "w", encoding="utf-8") as handle:
+        json.dump(state, handle, indent=2, sort_keys=True)
+
+
+def plan_apply(specs, current, state):
+    """
+    Computes the actions needed to move the current repositories to the specs.
+
+    Fields returned by the repository listing are compared directly. Other
+    fields (notes, include patterns, ...) are not part of the listing, so a
+    repository is also updated when its spec differs from the one last
+    applied from this machine.
+
+    Args:
+        specs (list): Desired repository specs from load_manifest.
+        current (list): Output of list_repositories_control.
+        state (dict): Output of load_state.
+
+    Returns:
+        list: Dicts with "action" ("create", "update", "noop" or "conflict"),
+        "key", "spec" and "reason".
+    """
+    current_by_key = {repo.key: repo for repo in current}
+    plan = []
+
+    for spec in specs:
+        key = spec["key"]
+        repo = current_by_key.get(key)
+
+        if repo is None:
+            plan.append({"action": "create", "key": key, "spec": spec, "reason": "missing"})
+            continue
+
+        # rclass and packageType cannot be changed on an existing repository
+        immutable = []
+        if str(repo.type or "").lower() != spec["rclass"].lower():
+            immutable.append(f"rclass {repo.type} -> {spec['rclass']}")
+        if str(repo.package_type or "").lower() != spec["packageType"].lower():
+            immutable.append(f"packageType {repo.package_type} -> {spec['packageType']}")
+        if immutable:
+            plan.append({"action": "conflict", "key": key, "spec": spec, "reason": "; ".join(immutable)})
+            continue
+
+        changed = [
+            field for field in LISTED_FIELDS
+            if field in spec and (field != "url" or spec["rclass"].lower() == "remote")
+            and getattr(repo, field) != spec[field]
+        ]
+        if changed:
+            plan.append({"action": "update", "key": key, "spec": spec, "reason": f"changed: {', '.join(changed)}"})
+        elif state.get(key) != spec_digest(spec):
+            plan.append({"action": "update", "key": key, "spec": spec, "reason": "spec changed since last apply"})
+        else:
+            plan.append({"action": "noop", "key": key, "spec": spec, "reason": "up to date"})
+
+    return plan
+
+
+def _settings(spec):
+    return {name: value for name, value in spec.items() if name not in ("key", "rclass", "packageType", "url")}
+
+
+def apply_plan(plan, concurrency=None):
+    """
+    Runs the create and update actions of a plan in parallel and records the
+    applied specs so the next run can skip them.
+
+    Args:
+        plan (list): Output of plan_apply.
+        concurrency (int): Maximum API calls in flight. Defaults to the
+            scheduler's maximum; the adaptive limit keeps it within what the server tolerates.
+
+    Returns:
+        list: (plan entry, response) tuples for every action that was run.
+    """
+    concurrency = concurrency or scheduler.max_concurrency
+    if concurrency > async_controls.concurrency:
+        async_controls.set_concurrency(concurrency)
+
+    calls = []
+    actions = [entry for entry in plan if entry["action"] in ("create", "update")]
+    for entry in actions:
+        spec = entry["spec"]
+        if entry["action"] == "create":
+            calls.append((controls.create_repository_control,
+                          (spec["key"], spec["rclass"], spec["packageType"], spec.get("url"), _settings(spec))))
+        else:
+            updates = {name: value for name, value in spec.items() if name != "key"}
+            calls.append((controls.update_repository_control, (spec["key"], updates)))
+
+    responses = async_controls.run_concurrently(calls) if calls else []
+
+    state = load_state()
+    for entry in plan:
+        if entry["action"] == "noop":
+            state[entry["key"]] = spec_digest(entry["spec"])
+    results = []
+    for entry, response in zip(actions, responses):
+        if isinstance(response, Exception):
+            response = {"error": str(response)}
+        if "error" not in response:
+            state[entry["key"]] = spec_digest(entry["spec"])
+        results.append((entry, response))
+    save_state(state)
+
+    return results
@@ -0,0 +1,288 @@
+import json
+import os
+import sqlite3
+import time
+
+from artifactory_cli import async_controls, controls, response_cache
+from artifactory_cli.models import Repository, StorageInfo, User
+from artifactory_cli.paths import cache_dir, instance_slug
+
+
+# Set by --offline/--refresh: listings and selection prompts read the local index instead of the API
+enabled = False
+
+# Age in seconds after which the index is reported as stale
+stale_after = 24 * 3600
+
+TABLES = ("users", "repositories", "storage")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    name TEXT PRIMARY KEY,
+    email TEXT,
+    email_domain TEXT,
+    admin INTEGER,
+    realm TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_email_domain ON users (email_domain);
+
+CREATE TABLE IF NOT EXISTS repositories (
+    key TEXT PRIMARY KEY,
+    type TEXT,
+    package_type TEXT,
+    url TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS repositories_type ON repositories (type, package_type);
+CREATE INDEX IF NOT EXISTS repositories_package_type ON repositories (package_type);
+
+CREATE TABLE IF NOT EXISTS storage (
+    repo_key TEXT PRIMARY KEY,
+    repo_type TEXT,
+    package_type TEXT,
+    used_bytes INTEGER,
+    files INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS storage_used_bytes ON storage (used_bytes);
+
+CREATE TABLE IF NOT EXISTS refreshes (
+    name TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL,
+    rows INTEGER NOT NULL,
+    extra TEXT
+);
+"""
+
+# Per table: key column, indexed columns, and how to derive them from a record
+_COLUMNS = {
+    "users": ("name", ("email", "email_domain", "admin", "realm"), lambda user: (
+        user.name,
+        user.email,
+        user.email_domain,
+        1 if user.admin else 0,
+        user.realm,
+    )),
+    "repositories": ("key", ("type", "package_type", "url"), lambda repo: (
+        repo.key,
+        (repo.type or "").lower(),
+        (repo.package_type or "").lower(),
+        repo.url,
+    )),
+    "storage": ("repo_key", ("repo_type", "package_type", "used_bytes", "files"), lambda repo: (
+        repo.repo_key,
+        (repo.repo_type or "").lower(),
+        (repo.package_type or "").lower(),
+        repo.used_bytes,
+        repo.files,
+    )),
+}
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def database_path():
+    """
+    Returns the index file of the current instance, e.g. ~/.cache/artifactory-cli/metadata/example.jfrog.io.sqlite3.
+    """
+    return os.path.join(cache_dir("metadata"), f"{instance_slug(controls.base_url)}.sqlite3")
+
+
+def connect():
+    """
+    Opens the index of the current instance, creating the tables on first use.
+    """
+    connection = sqlite3.connect(database_path())
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _sync_table(connection, table, records):
+    """
+    Rewrites only the rows of table that differ from records; deletes rows that are gone.
+
+    Returns:
+        dict: Counts of "inserted", "updated", "deleted" and "unchanged" rows.
+    """
+    key_column, columns, derive = _COLUMNS[table]
+    existing = dict(connection.execute(f"SELECT {key_column}, data FROM {table}"))
+    counts = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+    rows = []
+    for record in records:
+        values = derive(record)
+        if values[0] is None:
+            continue
+        data = json.dumps(record.to_json(), sort_keys=True, separators=(",", ":"))
+        old = existing.pop(values[0], None)
+        if old == data:
+            counts["unchanged"] += 1
+            continue
+        counts["inserted" if old is None else "updated"] += 1
+        rows.append(values + (data,))
+
+    placeholders = ", ".join("?" * (len(columns) + 2))
+    connection.executemany(f"INSERT OR REPLACE INTO {table} ({key_column}, {', '.join(columns)}, data) "
+                           f"VALUES ({placeholders})", rows)
+    connection.executemany(f"DELETE FROM {table} WHERE {key_column} = ?", ((key,) for key in existing))
+    counts["deleted"] = len(existing)
+    return counts
+
+
+def refresh(tables=TABLES):
+    """
+    Fetches users, repositories and storage info concurrently and updates the
+    index. Responses are revalidated with their ETag, and only rows whose
+    content changed are rewritten, each table in one transaction.
+
+    Args:
+        tables (tuple): Tables to refresh.
+
+    Returns:
+        dict: Per table, the _sync_table counts plus "rows", or {"error": message}.
+    """
+    fetchers = {
+        "users": (controls.list_users_control, "/artifactory/api/users"),
+        "repositories": (controls.list_repositories_control, "/artifactory/api/repositories"),
+        "storage": (controls.get_storage_info_control, "/artifactory/api/storageinfo"),
+    }
+    unknown = [table for table in tables if table not in fetchers]
+    if unknown:
+        raise ValueError(f"Unknown table(s): {', '.join(unknown)}. Use: {', '.join(TABLES)}")
+
+    response_cache.expire(*(controls.base_url + fetchers[table][1] for table in tables))
+    payloads = async_controls.run_concurrently([(fetchers[table][0], ()) for table in tables])
+
+    results = {}
+    connection = connect()
+    try:
+        for table, payload in zip(tables, payloads):
+            if isinstance(payload, Exception):
+                results[table] = {"error": str(payload)}
+                continue
+            extra = None
+            if table == "storage":
+                extra = json.dumps({"binariesSummary": payload.binaries_summary.to_json(),
+                                    "fileStoreSummary": payload.file_store_summary})
+                payload = payload.repositories
+            with connection:
+                counts = _sync_table(connection, table, payload)
+                counts["rows"] = len(payload)
+                connection.execute("INSERT OR REPLACE INTO refreshes (name, refreshed_at, rows, extra) "
+                                   "VALUES (?, ?, ?, ?)", (table, time.time(), len(payload), extra))
+            results[table] = counts
+    finally:
+        connection.close()
+    return results
+
+
+def status():
+    """
+    Returns {table: {"refreshedAt", "rows", "age", "stale"}} for every table;
+    refreshedAt and age are None for tables never refreshed.
+    """
+    connection = connect()
+    try:
+        rows = {name: (refreshed_at, count) for name, refreshed_at, count
+                in connection.execute("SELECT name, refreshed_at, rows FROM refreshes")}
+    finally:
+        connection.close()
+
+    now = time.time()
+    result = {}
+    for table in TABLES:
+        refreshed_at, count = rows.get(table, (None, 0))
+        age = now - refreshed_at if refreshed_at is not None else None
+        result[table] = {"refreshedAt": refreshed_at, "rows": count, "age": age,
+                         "stale": age is None or age > stale_after}
+    return result
+
+
+def format_age(seconds):
+    """
+    Formats an age in seconds, e.g. 90 -> "1m", 7200 -> "2h".
+    """
+    if seconds is None:
+        return "never"
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return f"{int(seconds)}s"
+
+
+def describe(table):
+    """
+    Returns a one-line notice saying that table is read from the index and how old it is.
+    """
+    entry = status()[table]
+    if entry["age"] is None:
+        return f"🗂  {table.capitalize()} from the local index, never refreshed"
+    notice = f"🗂  {table.capitalize()} from the local index, refreshed {format_age(entry['age'])} ago"
+    if entry["stale"]:
+        notice += " ⚠️  stale, pass --refresh to update"
+    return notice
+
+
+def _read(table, query, parameters=()):
+    connection = connect()
+    try:
+        if not connection.execute("SELECT 1 FROM refreshes WHERE name = ?", (table,)).fetchone():
+            raise Exception(f"The local index has no {table} yet. Run 'artifactory-cli index refresh' "
+                            f"or pass --refresh.")
+        return [json.loads(data) for (data,) in connection.execute(query, parameters)]
+    finally:
+        connection.close()
+
+
+def list_users(email_domain=None):
+    """
+    Returns the indexed users, like list_users_control, optionally only those
+    with an email in email_domain.
+    """
+    if email_domain:
+        return User.from_list(_read("users", "SELECT data FROM users WHERE email_domain = ? ORDER BY name",
+                                    (email_domain.strip().lstrip("@").lower(),)))
+    return User.from_list(_read("users", "SELECT data FROM users ORDER BY name"))
+
+
+def list_repositories(repo_type=None, package_type=None):
+    """
+    Returns the indexed repositories, like list_repositories_control, with the same filters.
+    """
+    conditions = []
+    parameters = []
+    if repo_type:
+        conditions.append("type = ?")
+        parameters.append(repo_type.lower())
+    if package_type:
+        conditions.append("package_type = ?")
+        parameters.append(package_type.lower())
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return Repository.from_list(_read("repositories", f"SELECT data FROM repositories{where} ORDER BY key",
+                                      parameters))
+
+
+def get_storage_info():
+    """
+    Returns the indexed storage info in the get_storage_info_control format,
+    largest repositories first and the TOTAL row last.
+    """
+    repositories = _read("storage", "SELECT data FROM storage ORDER BY repo_key = 'TOTAL', used_bytes DESC")
+    connection = connect()
+    try:
+        (extra,) = connection.execute("SELECT extra FROM refreshes WHERE name = 'storage'").fetchone()
+    finally:
+        connection.close()
+    return StorageInfo.from_json(dict(json.loads(extra or "{}"), repositoriesSummaryList=repositories))
+
+
+# Index table and reader standing in for each control function of the same data
+READERS = {
+    "list_users_control": ("users", list_users),
+    "list_repositories_control": ("repositories", list_repositories),
+    "get_storage_info_control": ("storage", get_storage_info),
+}
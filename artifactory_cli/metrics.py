@@ -0,0 +1,268 @@
+import json
+import re
+import threading
+from bisect import bisect_left
+from urllib.parse import urlparse
+
+
+# Set by enable(); client.request only measures requests while this is True
+enabled = False
+
+# Histogram bucket upper bounds in seconds
+BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.0075, 0.01, 0.015, 0.025, 0.035, 0.05, 0.075, 0.1, 0.15,
+    0.25, 0.35, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 7.5, 10.0, 15.0, 30.0, 60.0,
+)
+
+# Timed phases: whole request, time to first byte, and for new connections
+# the TCP connect (including DNS) and the TLS handshake
+PHASES = ("total", "first_byte", "connect", "tls")
+
+# Paths with names in them are grouped under a template to keep the endpoint count small
+ENDPOINT_TEMPLATES = (
+    (re.compile(r"^/artifactory/api/repositories/[^/]+$"), "/artifactory/api/repositories/{key}"),
+    (re.compile(r"^/artifactory/api/storage/.+"), "/artifactory/api/storage/{path}"),
+    (re.compile(r"^/access/api/v2/users/[^/]+$"), "/access/api/v2/users/{name}"),
+    (re.compile(r"^/(artifactory|access)/api/"), None),
+    (re.compile(r"^/artifactory/[^/]+/.+"), "/artifactory/{repo}/{path}"),
+)
+
+_lock = threading.Lock()
+_endpoints = {}
+_current = threading.local()
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram with interpolated quantiles.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def quantile(self, q):
+        """
+        Estimates the q-quantile (0..1) by linear interpolation inside its bucket.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = BUCKETS[index - 1] if index else 0.0
+                upper = BUCKETS[index] if index < len(BUCKETS) else self.max
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                return min(max(estimate, self.min), self.max)
+            seen += count
+        return self.max
+
+
+class EndpointStats:
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.statuses = {}
+        self.histograms = {phase: Histogram() for phase in PHASES}
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def reset():
+    with _lock:
+        _endpoints.clear()
+
+
+def endpoint_name(url):
+    """
+    Maps a request URL to its endpoint template, e.g.
+    ".../artifactory/api/repositories/libs-local" -> "/artifactory/api/repositories/{key}".
+    """
+    path = urlparse(url).path
+    for pattern, template in ENDPOINT_TEMPLATES:
+        if pattern.match(path):
+            return template or path
+    return path
+
+
+def begin_request():
+    """
+    Starts collecting connection phase timings for a request on this thread.
+    """
+    _current.phases = {}
+
+
+def add_phase(phase, seconds):
+    """
+    Adds time to a phase of the request running on this thread, if any.
+    """
+    phases = getattr(_current, "phases", None)
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+def get_phase(phase):
+    """
+    Returns the time recorded so far for a phase of the request on this thread.
+    """
+    phases = getattr(_current, "phases", None)
+    return phases.get(phase, 0.0) if phases else 0.0
+
+
+def end_request():
+    """
+    Returns the phase timings collected since begin_request.
+    """
+    phases = getattr(_current, "phases", None) or {}
+    _current.phases = None
+    return phases
+
+
+def record(method, url, status, num_bytes, seconds, phases=None):
+    """
+    Records one finished request.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Request URL.
+        status (int): Response status, or None if no response was received.
+        num_bytes (int): Response body bytes received.
+        seconds (float): Wall time of the whole request.
+        phases (dict): Optional first_byte/connect/tls timings in seconds.
+    """
+    key = (method, endpoint_name(url))
+    with _lock:
+        stats = _endpoints.get(key)
+        if stats is None:
+            stats = _endpoints[key] = EndpointStats()
+        stats.count += 1
+        stats.bytes += num_bytes or 0
+        label = str(status) if status else "error"
+        stats.statuses[label] = stats.statuses.get(label, 0) + 1
+        if not status or status >= 400:
+            stats.errors += 1
+        stats.histograms["total"].observe(seconds)
+        for phase, value in (phases or {}).items():
+            stats.histograms[phase].observe(value)
+
+
+def snapshot():
+    """
+    Returns the collected metrics as a JSON-serializable list, slowest endpoints first.
+    """
+    with _lock:
+        items = list(_endpoints.items())
+
+    result = []
+    for (method, endpoint), stats in items:
+        phases = {}
+        for phase, histogram in stats.histograms.items():
+            if not histogram.count:
+                continue
+            phases[phase] = {
+                "count": histogram.count,
+                "sum": histogram.sum,
+                "min": histogram.min,
+                "max": histogram.max,
+                "p50": histogram.quantile(0.5),
+                "p90": histogram.quantile(0.9),
+                "p99": histogram.quantile(0.99),
+                "buckets": dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"], histogram.counts)),
+            }
+        result.append({"method": method, "endpoint": endpoint, "count": stats.count, "errors": stats.errors,
+                        "bytes": stats.bytes, "statuses": dict(stats.statuses), "phases": phases})
+    result.sort(key=lambda entry: entry["phases"]["total"]["sum"], reverse=True)
+    return result
+
+
+def to_json():
+    return json.dumps({"buckets": BUCKETS, "endpoints": snapshot()}, indent=2)
+
+
+def _labels(**labels):
+    escape = lambda value: str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+
+def to_prometheus():
+    """
+    Renders the metrics in the Prometheus text exposition format.
+    """
+    entries = snapshot()
+    lines = [
+        "# HELP artifactory_cli_http_requests_total HTTP requests sent, by status.",
+        "# TYPE artifactory_cli_http_requests_total counter",
+    ]
+    for entry in entries:
+        for status, count in sorted(entry["statuses"].items()):
+            lines.append(f"artifactory_cli_http_requests_total{{"
+                         f"{_labels(method=entry['method'], endpoint=entry['endpoint'], status=status)}}} {count}")
+
+    lines += [
+        "# HELP artifactory_cli_http_response_bytes_total Response body bytes received.",
+        "# TYPE artifactory_cli_http_response_bytes_total counter",
+    ]
+    for entry in entries:
+        lines.append(f"artifactory_cli_http_response_bytes_total{{"
+                     f"{_labels(method=entry['method'], endpoint=entry['endpoint'])}}} {entry['bytes']}")
+
+    lines += [
+        "# HELP artifactory_cli_http_request_duration_seconds Request time by phase.",
+        "# TYPE artifactory_cli_http_request_duration_seconds histogram",
+    ]
+    for entry in entries:
+        for phase, data in entry["phases"].items():
+            labels = _labels(method=entry["method"], endpoint=entry["endpoint"], phase=phase)
+            cumulative = 0
+            for bound, count in data["buckets"].items():
+                cumulative += count
+                lines.append(f'artifactory_cli_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"artifactory_cli_http_request_duration_seconds_sum{{{labels}}} {data['sum']}")
+            lines.append(f"artifactory_cli_http_request_duration_seconds_count{{{labels}}} {data['count']}")
+
+    return "\n".join(lines) + "\n"
+
+
+def format_table():
+    """
+    Returns a per-endpoint summary table of the collected metrics.
+    """
+    def ms(phase, name):
+        value = phase.get(name) if phase else None
+        return f"{value * 1000:.1f}" if value is not None else "-"
+
+    entries = snapshot()
+    header = (f"{'endpoint':<48}{'calls':>7}{'err':>5}{'bytes':>12}{'p50 ms':>9}{'p99 ms':>9}"
+              f"{'max ms':>9}{'ttfb p50':>10}{'new conn':>10}{'conn p50':>10}{'tls p50':>9}")
+    lines = [header, "-" * len(header)]
+    for entry in entries:
+        phases = entry["phases"]
+        total = phases["total"]
+        connect = phases.get("connect")
+        name = f"{entry['method']} {entry['endpoint']}"
+        lines.append(f"{name[:47]:<48}{entry['count']:>7}{entry['errors']:>5}{entry['bytes']:>12}"
+                     f"{ms(total, 'p50'):>9}{ms(total, 'p99'):>9}{ms(total, 'max'):>9}"
+                     f"{ms(phases.get('first_byte'), 'p50'):>10}{connect['count'] if connect else 0:>10}"
+                     f"{ms(connect, 'p50'):>10}{ms(phases.get('tls'), 'p50'):>9}")
+
+    calls = sum(entry["count"] for entry in entries)
+    seconds = sum(entry["phases"]["total"]["sum"] for entry in entries)
+    received = sum(entry["bytes"] for entry in entries)
+    lines.append("-" * len(header))
+    lines.append(f"{calls} request(s), {received} bytes received, {seconds:.3f}s spent in HTTP calls")
+    return "\n".join(lines)
@@ -0,0 +1,291 @@
+import gc
+import re
+import sys
+from contextlib import contextmanager
+
+
+UNITS = {
+    "": 1, "b": 1, "byte": 1, "bytes": 1,
+    "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3, "tb": 1024 ** 4, "pb": 1024 ** 5,
+}
+
+_SIZE = re.compile(r"^\s*([\d.,]+)\s*([A-Za-z]*)\s*$")
+
+
+def parse_size(value):
+    """
+    Converts a size such as "12.3 GB", "1,024 bytes" or a number to bytes.
+    Artifactory reports sizes in binary (1024-based) units.
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _SIZE.match(str(value or ""))
+    if not match:
+        return 0
+    number = float(match.group(1).replace(",", ""))
+    return int(number * UNITS.get(match.group(2).lower(), 1))
+
+
+def parse_count(value):
+    """
+    Converts a count such as "1,234" or a number to an int.
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(str(value or "0").replace(",", "").strip() or 0)
+    except ValueError:
+        return 0
+
+
+def parse_percentage(value):
+    """
+    Converts a percentage such as "12.5%" to a float.
+    """
+    try:
+        return float(str(value or "0").rstrip("%").strip() or 0)
+    except ValueError:
+        return 0.0
+
+
+def _extra(data, fields):
+    # Fields the record class does not model, kept so to_json returns what the API sent
+    if data.keys() <= fields:
+        return None
+    return {field: value for field, value in data.items() if field not in fields}
+
+
+def _intern(value):
+    # Repository and package types repeat across every record; one shared string each
+    return sys.intern(value) if type(value) is str else value
+
+
+@contextmanager
+def _gc_paused():
+    # Allocating a large listing triggers repeated cyclic GC passes over every object built so
+    # far; records hold no reference cycles, so the collector is paused while they are built
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class Record:
+    """
+    Base of the records the controls parse API responses into.
+
+    Subclasses list their attributes in ATTRIBUTES and the JSON field of each
+    attribute in FIELDS, in the same order. Attributes live in __slots__, so
+    there is no per-instance dict, and low-cardinality strings are interned:
+    a record costs a fraction of the dict it replaces and its fields are
+    read as plain attributes. Fields the class does not model are kept in
+    extra (None when there are none). Records parsed by the controls may be
+    cached and shared, so treat them as read-only.
+    """
+
+    __slots__ = ("extra",)
+    FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.KNOWN = frozenset(cls.FIELDS)
+
+    @classmethod
+    def from_list(cls, items):
+        """
+        Parses a JSON array of records, e.g. a listing response.
+        """
+        with _gc_paused():
+            return list(map(cls.from_json, items))
+
+    def to_json(self):
+        """
+        Returns the record in the API's JSON shape; unset fields are left out.
+        """
+        data = {field: value for field, value in zip(self.FIELDS, map(self.__getattribute__, self.ATTRIBUTES))
+                if value is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.ATTRIBUTES)
+        return f"{type(self).__name__}({values})"
+
+
+class User(Record):
+    """
+    A user from /api/users. email and admin are only set by servers that list them.
+
+    Construction only stores the fields, since a listing builds one record
+    per user. email_domain (lowercase) is derived on first access and kept,
+    so repeated selections by domain compare one shared string.
+    """
+
+    __slots__ = ("name", "email", "admin", "realm", "uri", "_email_domain")
+    ATTRIBUTES = FIELDS = ("name", "email", "admin", "realm", "uri")
+
+    def __init__(self, name, email=None, admin=None, realm=None, uri=None, extra=None):
+        self.name = name
+        self.email = email
+        self.admin = admin
+        self.realm = _intern(realm)
+        self.uri = uri
+        self.extra = extra
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data.get("name"), data.get("email"), data.get("admin"), data.get("realm"), data.get("uri"),
+                   _extra(data, cls.KNOWN))
+
+    @classmethod
+    def from_list(cls, items):
+        # Listings hold up to hundreds of thousands of users: build them inline, not through from_json
+        known = cls.KNOWN
+        with _gc_paused():
+            return [cls(data.get("name"), data.get("email"), data.get("admin"), data.get("realm"), data.get("uri"),
+                        None if data.keys() <= known else _extra(data, known)) for data in items]
+
+    @property
+    def email_domain(self):
+        try:
+            return self._email_domain
+        except AttributeError:
+            email = self.email
+            self._email_domain = sys.intern(email[email.rfind("@") + 1:].lower()) if email else None
+            return self._email_domain
+
+
+class Repository(Record):
+    """
+    A repository from /api/repositories.
+    """
+
+    __slots__ = ATTRIBUTES = ("key", "type", "package_type", "description", "url")
+    FIELDS = ("key", "type", "packageType", "description", "url")
+
+    def __init__(self, key, type=None, package_type=None, description=None, url=None, extra=None):
+        self.key = key
+        self.type = _intern(type)
+        self.package_type = _intern(package_type)
+        self.description = description
+        self.url = url
+        self.extra = extra
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data.get("key"), data.get("type"), data.get("packageType"), data.get("description"),
+                   data.get("url"), _extra(data, cls.KNOWN))
+
+
+class RepositorySummary(Record):
+    """
+    A row of repositoriesSummaryList in /api/storageinfo.
+
+    The attributes keep the values as the server sent them (display strings
+    such as "1,234" on some versions, None when absent), so to_json returns
+    the payload unchanged. folders, files, items and used_bytes are the
+    same values parsed to ints once; used_bytes comes from usedSpaceInBytes
+    or, on servers without it, from usedSpace.
+    """
+
+    __slots__ = ("repo_key", "repo_type", "package_type", "folders_count", "files_count", "items_count",
+                 "used_space", "used_space_in_bytes", "percentage", "folders", "files", "items", "used_bytes")
+    ATTRIBUTES = ("repo_key", "repo_type", "package_type", "folders_count", "files_count", "items_count",
+                  "used_space", "used_space_in_bytes", "percentage")
+    FIELDS = ("repoKey", "repoType", "packageType", "foldersCount", "filesCount", "itemsCount",
+              "usedSpace", "usedSpaceInBytes", "percentage")
+
+    def __init__(self, repo_key, repo_type=None, package_type=None, folders_count=None, files_count=None,
+                 items_count=None, used_space=None, used_space_in_bytes=None, percentage=None, extra=None):
+        self.repo_key = repo_key
+        self.repo_type = _intern(repo_type)
+        self.package_type = _intern(package_type)
+        self.folders_count = folders_count
+        self.files_count = files_count
+        self.items_count = items_count
+        self.used_space = used_space
+        self.used_space_in_bytes = used_space_in_bytes
+        self.percentage = percentage
+        self.folders = parse_count(folders_count)
+        self.files = parse_count(files_count)
+        self.items = parse_count(items_count)
+        self.used_bytes = parse_size(used_space if used_space_in_bytes is None else used_space_in_bytes)
+        self.extra = extra
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data.get("repoKey"), data.get("repoType"), data.get("packageType"), data.get("foldersCount"),
+                   data.get("filesCount"), data.get("itemsCount"), data.get("usedSpace"),
+                   data.get("usedSpaceInBytes"), data.get("percentage"), _extra(data, cls.KNOWN))
+
+
+class BinariesSummary(Record):
+    """
+    binariesSummary of /api/storageinfo. The server sends every value as a
+    display string ("1,024", "12.3 GB", "81.45%"); they are kept as such.
+    """
+
+    __slots__ = ATTRIBUTES = ("binaries_count", "binaries_size", "artifacts_size", "optimization", "items_count",
+                              "artifacts_count")
+    FIELDS = ("binariesCount", "binariesSize", "artifactsSize", "optimization", "itemsCount", "artifactsCount")
+
+    def __init__(self, binaries_count=None, binaries_size=None, artifacts_size=None, optimization=None,
+                 items_count=None, artifacts_count=None, extra=None):
+        self.binaries_count = binaries_count
+        self.binaries_size = binaries_size
+        self.artifacts_size = artifacts_size
+        self.optimization = optimization
+        self.items_count = items_count
+        self.artifacts_count = artifacts_count
+        self.extra = extra
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data.get("binariesCount"), data.get("binariesSize"), data.get("artifactsSize"),
+                   data.get("optimization"), data.get("itemsCount"), data.get("artifactsCount"),
+                   _extra(data, cls.KNOWN))
+
+
+class StorageInfo(Record):
+    """
+    The /api/storageinfo response. repositories includes the "TOTAL" row the
+    server appends; file_store_summary is kept as the server's dict.
+    """
+
+    __slots__ = ATTRIBUTES = ("binaries_summary", "file_store_summary", "repositories")
+    FIELDS = ("binariesSummary", "fileStoreSummary", "repositoriesSummaryList")
+
+    def __init__(self, binaries_summary=None, file_store_summary=None, repositories=None, extra=None):
+        self.binaries_summary = binaries_summary if binaries_summary is not None else BinariesSummary()
+        self.file_store_summary = file_store_summary if file_store_summary is not None else {}
+        self.repositories = repositories if repositories is not None else []
+        self.extra = extra
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(BinariesSummary.from_json(data.get("binariesSummary") or {}), data.get("fileStoreSummary"),
+                   RepositorySummary.from_list(data.get("repositoriesSummaryList") or []),
+                   _extra(data, cls.KNOWN))
+
+    def to_json(self):
+        data = {
+            "binariesSummary": self.binaries_summary.to_json(),
+            "fileStoreSummary": self.file_store_summary,
+            "repositoriesSummaryList": [repo.to_json() for repo in self.repositories],
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+def to_json(value):
+    """
+    json.dumps default= hook serializing records, e.g. json.dumps(users, default=to_json).
+    """
+    if isinstance(value, Record):
+        return value.to_json()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,43 @@
+import os
+import re
+from urllib.parse import urlparse
+
+
+def cache_dir(*parts):
+    """
+    Returns a directory under the per-user cache folder, creating it if needed.
+
+    The base folder can be overridden with ARTIFACTORY_CLI_CACHE_DIR.
+
+    Args:
+        *parts (str): Sub-folders below the cache folder.
+
+    Returns:
+        str: Absolute path to the directory.
+    """
+    base = os.environ.get("ARTIFACTORY_CLI_CACHE_DIR")
+    if not base:
+        if os.name == "nt":
+            root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        else:
+            root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(root, "artifactory-cli")
+
+    path = os.path.join(base, *parts)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def instance_slug(url):
+    """
+    Turns a base URL into a string that is safe to use as a file name.
+
+    Args:
+        url (str): Artifactory base URL, e.g. "https://example.jfrog.io".
+
+    Returns:
+        str: e.g. "example.jfrog.io".
+    """
+    parsed = urlparse(url)
+    raw = parsed.netloc + parsed.path.rstrip("/") if parsed.netloc else url
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", raw).strip("_") or "default"
@@ -0,0 +1,227 @@
+import json
+import os
+import time
+
+from artifactory_cli import async_controls, controls, scheduler
+
+
+# Fields that cannot be changed on an existing repository
+IMMUTABLE_FIELDS = ("key", "rclass", "packageType")
+
+
+def fetch_configs(keys=None, concurrency=None, on_result=None):
+    """
+    Fetches the full configuration of many repositories in parallel.
+
+    Args:
+        keys (iterable): Repository keys. Defaults to every repository on the server.
+        concurrency (int): Number of parallel workers. Defaults to the scheduler's maximum.
+        on_result (callable): Called as on_result(key, config_or_exception) as
+            configurations arrive.
+
+    Returns:
+        tuple: ({key: config} of the fetched configurations, {key: error} of
+        the failed ones).
+    """
+    if keys is None:
+        keys = [repo.key for repo in controls.list_repositories_control()]
+    configs = {}
+    errors = {}
+
+    def collect(item, result):
+        key = item[0]
+        if isinstance(result, Exception):
+            errors[key] = str(result)
+        else:
+            configs[key] = result
+        if on_result:
+            on_result(key, result)
+
+    async_controls.run_each(controls.get_repository_config_control, ((key,) for key in keys),
+                            workers=concurrency or scheduler.max_concurrency, on_result=collect)
+    return configs, errors
+
+
+def save_snapshot(configs, path):
+    """
+    Writes configurations to a snapshot: a single JSONL file when path ends
+    in .jsonl, otherwise a directory with one <key>.json file per repository.
+
+    Both layouts are sorted by key with sorted fields, so snapshots of the
+    same state are byte-identical and diff cleanly in version control.
+    """
+    if path.lower().endswith(".jsonl"):
+        with open(path, "w", encoding="utf-8") as handle:
+            for key in sorted(configs):
+                handle.write(json.dumps(configs[key], sort_keys=True) + "\n")
+        return
+
+    os.makedirs(path, exist_ok=True)
+    for key in sorted(configs):
+        with open(os.path.join(path, f"{key}.json"), "w", encoding="utf-8") as handle:
+            json.dump(configs[key], handle, indent=2, sort_keys=True)
+            handle.write("\n")
+
+
+def load_snapshot(path):
+    """
+    Loads a snapshot written by save_snapshot.
+
+    Args:
+        path (str): A .jsonl file or a snapshot directory.
+
+    Returns:
+        dict: {key: config}.
+
+    Raises:
+        ValueError: If the snapshot is malformed.
+    """
+    entries = []
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".json"):
+                with open(os.path.join(path, name), encoding="utf-8") as handle:
+                    try:
+                        entries.append((name, json.load(handle)))
+                    except ValueError as e:
+                        raise ValueError(f"{name}: {e}")
+    else:
+        with open(path, encoding="utf-8") as handle:
+            for number, line in enumerate(handle, 1):
+                if line.strip():
+                    try:
+                        entries.append((f"line {number}", json.loads(line)))
+                    except ValueError as e:
+                        raise ValueError(f"Line {number}: {e}")
+
+    configs = {}
+    for where, config in entries:
+        if not isinstance(config, dict) or not config.get("key"):
+            raise ValueError(f"{where}: a repository configuration with a 'key' is expected.")
+        if config["key"] in configs:
+            raise ValueError(f"{where}: repository '{config['key']}' is listed more than once.")
+        configs[config["key"]] = config
+    return configs
+
+
+def diff_config(old, new, prefix=""):
+    """
+    Compares two configurations field by field. Nested objects are compared
+    per field, lists as a whole.
+
+    Returns:
+        list: (dotted field name, old value, new value) tuples, sorted by field;
+        a value is None where the field is absent.
+    """
+    changes = []
+    for name in sorted(set(old) | set(new)):
+        field = f"{prefix}{name}"
+        before, after = old.get(name), new.get(name)
+        if isinstance(before, dict) and isinstance(after, dict):
+            changes.extend(diff_config(before, after, f"{field}."))
+        elif before != after:
+            changes.append((field, before, after))
+    return changes
+
+
+def diff_configs(old, new):
+    """
+    Compares two sets of configurations, e.g. two snapshots, or a snapshot and live state.
+
+    Args:
+        old (dict): {key: config}.
+        new (dict): {key: config}.
+
+    Returns:
+        dict: "added" and "removed" repository keys, and "changed" as
+        {key: diff_config(old, new)} for repositories present in both.
+    """
+    changed = {}
+    for key in sorted(set(old) & set(new)):
+        changes = diff_config(old[key], new[key])
+        if changes:
+            changed[key] = changes
+    return {
+        "added": sorted(set(new) - set(old)),
+        "removed": sorted(set(old) - set(new)),
+        "changed": changed,
+    }
+
+
+def plan_import(snapshot, live):
+    """
+    Computes the actions that make the live repositories match a snapshot.
+
+    Args:
+        snapshot (dict): {key: config} from load_snapshot.
+        live (dict): {key: config} of the same repositories on the server;
+            keys missing here do not exist.
+
+    Returns:
+        list: Dicts with "action" ("create", "update", "noop" or "conflict"),
+        "key", "config" and "changes" (diff_config output, or the reason of a conflict).
+    """
+    plan = []
+    for key in sorted(snapshot):
+        config = snapshot[key]
+        if key not in live:
+            plan.append({"action": "create", "key": key, "config": config, "changes": []})
+            continue
+
+        changes = diff_config(live[key], config)
+        immutable = [f"{field} {before} -> {after}" for field, before, after in changes
+                     if field in IMMUTABLE_FIELDS and after is not None
+                     and str(before).lower() != str(after).lower()]
+        if immutable:
+            plan.append({"action": "conflict", "key": key, "config": config, "changes": "; ".join(immutable)})
+        elif any(after is not None for _, _, after in changes):
+            plan.append({"action": "update", "key": key, "config": config, "changes": changes})
+        else:
+            plan.append({"action": "noop", "key": key, "config": config, "changes": []})
+    return plan
+
+
+def _import_one(entry):
+    config = entry["config"]
+    if entry["action"] == "create":
+        settings = {name: value for name, value in config.items() if name not in IMMUTABLE_FIELDS + ("url",)}
+        return controls.create_repository_control(config["key"], config["rclass"], config["packageType"],
+                                                  config.get("url"), settings)
+
+    # Send only the top-level fields that differ; fields missing from the snapshot are left alone
+    fields = {field.split(".", 1)[0] for field, _, after in entry["changes"] if after is not None}
+    updates = {name: config[name] for name in fields if name in config and name not in IMMUTABLE_FIELDS}
+    return controls.update_repository_control(config["key"], updates)
+
+
+def import_snapshot(plan, concurrency=None, on_result=None):
+    """
+    Runs the create and update actions of an import plan in parallel.
+
+    Args:
+        plan (list): Output of plan_import.
+        concurrency (int): Number of parallel workers. Defaults to the scheduler's maximum.
+        on_result (callable): Called as on_result(entry, response) as actions complete.
+
+    Returns:
+        dict: "created", "updated", "failed" and "skipped" counts, plus elapsed seconds.
+    """
+    actions = [entry for entry in plan if entry["action"] in ("create", "update")]
+    counts = {"created": 0, "updated": 0, "failed": 0, "skipped": len(plan) - len(actions)}
+
+    def collect(item, response):
+        entry = item[0]
+        if isinstance(response, Exception):
+            response = {"error": str(response)}
+        if "error" in response:
+            counts["failed"] += 1
+        else:
+            counts["created" if entry["action"] == "create" else "updated"] += 1
+        if on_result:
+            on_result(entry, response)
+
+    start = time.perf_counter()
+    async_controls.run_each(_import_one, ((entry,) for entry in actions),
+                            workers=concurrency or scheduler.max_concurrency, on_result=collect)
+    counts["elapsed"] = time.perf_counter() - start
+    return counts
@@ -0,0 +1,148 @@
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+from artifactory_cli import client
+
+
+# Seconds a cached response is served without asking the server again, per endpoint path
+ttls = {
+    "/artifactory/api/system/version": 300,
+    "/artifactory/api/repositories": 60,
+    "/artifactory/api/users": 60,
+    "/artifactory/api/storageinfo": 30,
+}
+
+max_entries = 128                 # LRU bound on the number of cached responses
+max_bytes = 64 * 1024 * 1024      # LRU bound on the total size of cached response bodies
+
+_entries = OrderedDict()
+_total_bytes = 0
+_lock = threading.Lock()
+
+
+def ttl_for(url):
+    """
+    Returns the TTL configured for the endpoint of a URL, or 0 if it is not cached.
+    """
+    path = urlparse(url).path.rstrip("/")
+    return ttls.get(path, 0)
+
+
+def _evict():
+    global _total_bytes
+    while _entries and (len(_entries) > max_entries or _total_bytes > max_bytes):
+        _, entry = _entries.popitem(last=False)
+        _total_bytes -= entry["size"]
+
+
+def _store(key, response, payload, ttl):
+    global _total_bytes
+    entry = {
+        "payload": payload,
+        "expires_at": time.monotonic() + ttl,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "size": len(response.content),
+    }
+    with _lock:
+        old = _entries.pop(key, None)
+        if old:
+            _total_bytes -= old["size"]
+        _entries[key] = entry
+        _total_bytes += entry["size"]
+        _evict()
+
+
+def get_json(url, headers, ttl=None, parse=None):
+    """
+    GETs a JSON endpoint, serving it from the cache while it is fresh.
+
+    Once an entry expires it is revalidated with If-None-Match /
+    If-Modified-Since when the server sent an ETag or Last-Modified header,
+    so an unchanged body is not downloaded again. Cached payloads are shared
+    between callers and must be treated as read-only.
+
+    Args:
+        url (str): Full request URL.
+        headers (dict): Request headers, including Authorization.
+        ttl (float): Override of the endpoint TTL in seconds; 0 disables caching.
+        parse (callable): Turns the JSON body into the payload, e.g. records
+            from models. It runs once per downloaded body and its result is
+            what gets cached, so a revalidated entry is not parsed again.
+
+    Returns:
+        The parsed JSON body, or what parse returned for it.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    if ttl is None:
+        ttl = ttl_for(url)
+    if ttl <= 0:
+        response = client.get(url, headers=headers)
+        response.raise_for_status()
+        return parse(response.json()) if parse else response.json()
+
+    # Responses depend on who is asking, so the token is part of the key
+    key = (url, headers.get("Authorization"))
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            if entry["expires_at"] > time.monotonic():
+                return entry["payload"]
+
+    request_headers = dict(headers)
+    if entry is not None:
+        if entry["etag"]:
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = client.get(url, headers=request_headers)
+
+    if response.status_code == 304 and entry is not None:
+        with _lock:
+            entry["expires_at"] = time.monotonic() + ttl
+        return entry["payload"]
+
+    response.raise_for_status()
+    payload = parse(response.json()) if parse else response.json()
+    _store(key, response, payload, ttl)
+    return payload
+
+
+def invalidate(*url_prefixes):
+    """
+    Drops cached responses whose URL starts with any of the given prefixes.
+    Called by mutating controls so the next read sees their changes.
+    """
+    global _total_bytes
+    with _lock:
+        for key in [key for key in _entries if key[0].startswith(url_prefixes)]:
+            _total_bytes -= _entries.pop(key)["size"]
+
+
+def expire(*url_prefixes):
+    """
+    Marks cached responses whose URL starts with any of the given prefixes as
+    stale without dropping them, so the next read revalidates with the stored
+    ETag/Last-Modified and only downloads the body if it changed.
+    """
+    with _lock:
+        for key, entry in _entries.items():
+            if key[0].startswith(url_prefixes):
+                entry["expires_at"] = 0.0
+
+
+def clear():
+    """
+    Drops every cached response.
+    """
+    global _total_bytes
+    with _lock:
+        _entries.clear()
+        _total_bytes = 0
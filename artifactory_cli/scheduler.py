@@ -0,0 +1,202 @@
+import email.utils
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+# Scheduler settings, applied to each Artifactory host separately
+rate_limit = None         # Max requests started per second per host (None: unlimited)
+burst = 10                # Requests that may start at once when the rate limit has tokens saved up
+initial_concurrency = 8   # Requests in flight allowed before the server has given any feedback
+min_concurrency = 1
+max_concurrency = 64      # Upper bound for the adaptive limit; also the default bulk worker count
+max_throttle_retries = 5  # Retries of a request answered with 429/503 before giving up
+max_retry_after = 120     # Longest Retry-After honored, in seconds
+backoff_factor = 0.5      # Backoff when a 429/503 carries no Retry-After: backoff_factor * 2 ** retry
+
+THROTTLE_STATUSES = (429, 503)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: acquire() blocks until a request may start.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit, like TCP congestion control.
+
+    The limit starts at initial_concurrency and grows by one per success
+    until the server first throttles (slow start), then by one per window of
+    `limit` successes. A throttled response halves it, but only if the
+    request started after the last decrease, so a burst of 429s caused by
+    the old limit counts as a single signal.
+    """
+
+    def __init__(self, initial, minimum, maximum):
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self.slow_start = True
+        self.last_decrease = 0.0
+        self.throttled = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Waits for a free slot. Returns the start time to pass to release().
+        """
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started, throttled=False):
+        with self.condition:
+            self.in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self.slow_start = False
+                if started >= self.last_decrease:
+                    self.limit = max(self.minimum, self.limit / 2)
+                    self.last_decrease = time.monotonic()
+            elif self.slow_start:
+                self.limit = min(self.maximum, self.limit + 1)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+
+_lock = threading.Lock()
+_buckets = {}
+_limiters = {}
+_paused_until = {}
+
+
+def configure(rate=None, burst_size=None, initial=None, maximum=None):
+    """
+    Changes the scheduler settings. Takes effect for requests started afterwards.
+
+    Args:
+        rate (float): Requests per second per host; 0 removes the limit.
+        burst_size (int): Token bucket capacity.
+        initial (int): Starting concurrency limit.
+        maximum (int): Upper bound for the adaptive concurrency limit.
+    """
+    global rate_limit, burst, initial_concurrency, max_concurrency
+
+    with _lock:
+        if rate is not None:
+            rate_limit = rate or None
+        if burst_size is not None:
+            burst = burst_size
+        if initial is not None:
+            initial_concurrency = initial
+        if maximum is not None:
+            max_concurrency = maximum
+        _buckets.clear()
+        _limiters.clear()
+
+
+def _host(url):
+    return urlsplit(url).netloc.lower() if url else ""
+
+
+def _get(host):
+    # Each host gets its own limits, so a throttling instance does not slow down requests to others
+    with _lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = AdaptiveLimiter(initial_concurrency, min_concurrency, max_concurrency)
+            _buckets[host] = TokenBucket(rate_limit, burst) if rate_limit else None
+        return _buckets[host], limiter
+
+
+def acquire(url=None):
+    """
+    Blocks until a request to url may start: after any pause requested by
+    its host, a rate-limit token and a free concurrency slot.
+
+    Args:
+        url (str): Request URL; limits are kept per host.
+
+    Returns:
+        tuple: The slot, to pass to release() when the response arrives.
+    """
+    host = _host(url)
+    bucket, limiter = _get(host)
+    delay = _paused_until.get(host, 0.0) - time.monotonic()
+    while delay > 0:
+        time.sleep(delay)
+        delay = _paused_until.get(host, 0.0) - time.monotonic()
+    if bucket:
+        bucket.acquire()
+    return limiter, limiter.acquire()
+
+
+def release(slot, throttled=False):
+    """
+    Frees a slot returned by acquire() and feeds the outcome to the adaptive limit.
+    """
+    limiter, started = slot
+    limiter.release(started, throttled)
+
+
+def pause(seconds, url=None):
+    """
+    Holds back every new request to the host of url for the given number of seconds.
+    """
+    host = _host(url)
+    with _lock:
+        _paused_until[host] = max(_paused_until.get(host, 0.0), time.monotonic() + seconds)
+
+
+def retry_after(response, attempt):
+    """
+    Returns how long to wait before retrying a throttled response: its
+    Retry-After header (seconds or an HTTP date), or exponential backoff with
+    jitter when there is none.
+    """
+    header = response.headers.get("Retry-After")
+    if header:
+        try:
+            seconds = float(header)
+        except ValueError:
+            try:
+                seconds = email.utils.parsedate_to_datetime(header).timestamp() - time.time()
+            except (TypeError, ValueError):
+                seconds = 0.0
+        return min(max(seconds, 0.0), max_retry_after)
+    return backoff_factor * 2 ** attempt * (0.5 + random.random() / 2)
+
+
+def stats(url=None):
+    """
+    Returns the current adaptive limit, requests in flight and throttled responses seen for a host.
+    """
+    _, limiter = _get(_host(url))
+    return {"limit": int(limiter.limit), "in_flight": limiter.in_flight, "throttled": limiter.throttled,
+            "rate_limit": rate_limit}
@@ -0,0 +1,155 @@
+import re
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+
+# Repository attributes searched; the first is the key, then type and package type
+SEARCH_FIELDS = ("key", "type", "package_type", "url")
+MATCH_MODES = ("auto", "prefix", "substring", "fuzzy")
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class RepositoryIndex:
+    """
+    In-memory search index over repository listings.
+
+    Built once per listing, it answers prefix queries with a binary search
+    over the sorted field values, substring queries through a trigram index,
+    and fuzzy queries with a compiled subsequence pattern, so lookups do not
+    scan every repository in Python.
+    """
+
+    def __init__(self, repositories):
+        self.repositories = list(repositories)
+        self._values = []          # Lowercase field value per (repository, field)
+        self._prefix = []          # Sorted (value, repository position)
+        self._trigrams = defaultdict(set)   # Trigram -> set of repository positions
+
+        for position, repo in enumerate(self.repositories):
+            values = [str(getattr(repo, field) or "").lower() for field in SEARCH_FIELDS]
+            self._values.append(values)
+            trigrams = set()
+            for value in values:
+                if value:
+                    self._prefix.append((value, position))
+                    trigrams |= _trigrams(value)
+            for trigram in trigrams:
+                self._trigrams[trigram].add(position)
+
+        self._prefix.sort()
+
+        # Keys (and all field values) joined into one newline-separated string
+        # so short and fuzzy queries are a single regex scan instead of a
+        # Python loop; the *_starts lists map match offsets back to positions
+        self._key_text, self._key_starts = self._join(values[0] for values in self._values)
+        self._all_text, self._all_starts = self._join("\t".join(values) for values in self._values)
+
+    @staticmethod
+    def _join(texts):
+        starts = []
+        parts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            parts.append(text)
+            offset += len(text) + 1
+        return "\n".join(parts), starts
+
+    def __len__(self):
+        return len(self.repositories)
+
+    def prefix(self, query):
+        """
+        Returns positions of repositories with a field starting with query.
+        """
+        query = query.lower()
+        start = bisect_left(self._prefix, (query, -1))
+        positions = set()
+        for value, position in self._prefix[start:]:
+            if not value.startswith(query):
+                break
+            positions.add(position)
+        return sorted(positions)
+
+    def substring(self, query):
+        """
+        Returns positions of repositories with a field containing query.
+        """
+        query = query.lower()
+        if len(query) < 3:
+            positions = {bisect_right(self._all_starts, match.start()) - 1
+                         for match in re.finditer(re.escape(query), self._all_text)}
+            return sorted(positions)
+        else:
+            sets = [self._trigrams.get(trigram, set()) for trigram in _trigrams(query)]
+            if not all(sets):
+                return []
+            candidates = sorted(set.intersection(*sorted(sets, key=len)))
+        return [position for position in candidates
+                if any(query in value for value in self._values[position])]
+
+    def fuzzy(self, query):
+        """
+        Returns positions of repositories whose key contains the characters of
+        query in order, best matches (shortest span, earliest start) first.
+        """
+        # "." does not match the newline, so a match never spans two keys
+        pattern = re.compile(".*?".join(re.escape(char) for char in query.lower() if char != "\n"))
+        scored = {}
+        for match in pattern.finditer(self._key_text):
+            position = bisect_right(self._key_starts, match.start()) - 1
+            if position not in scored:
+                start = match.start() - self._key_starts[position]
+                scored[position] = (match.end() - match.start(), start, len(self._values[position][0]), position)
+        return [entry[-1] for entry in sorted(scored.values())]
+
+    def search(self, query, mode="auto", repo_type=None, package_type=None):
+        """
+        Searches the index.
+
+        Args:
+            query (str): Text to look for. Empty matches every repository.
+            mode (str): "prefix", "substring", "fuzzy", or "auto" to try them
+                in that order until one returns results.
+            repo_type (str): Only return repositories of this type (local, remote, virtual).
+            package_type (str): Only return repositories of this package type.
+
+        Returns:
+            list: Matching Repository records.
+        """
+        if mode not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode '{mode}'. Use one of: {', '.join(MATCH_MODES)}")
+
+        if not query:
+            positions = range(len(self.repositories))
+        elif mode == "auto":
+            positions = self.prefix(query) or self.substring(query) or self.fuzzy(query)
+        else:
+            positions = getattr(self, mode)(query)
+
+        results = []
+        for position in positions:
+            values = self._values[position]
+            if repo_type and values[1] != repo_type.lower():
+                continue
+            if package_type and values[2] != package_type.lower():
+                continue
+            results.append(self.repositories[position])
+        return results
+
+
+_last_index = None
+
+
+def index_for(repositories):
+    """
+    Returns a RepositoryIndex for a listing, reusing the last one built when
+    the same listing object (e.g. from the response cache) is passed again.
+    """
+    global _last_index
+    if _last_index is None or _last_index[0] is not repositories:
+        _last_index = (repositories, RepositoryIndex(repositories))
+    return _last_index[1]
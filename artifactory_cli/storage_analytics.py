@@ -0,0 +1,227 @@
+import heapq
+import json
+import os
+import time
+from array import array
+
+from artifactory_cli import controls
+from artifactory_cli.models import parse_percentage
+from artifactory_cli.paths import cache_dir, instance_slug
+
+
+SORT_COLUMNS = {"space": "used_bytes", "files": "files", "folders": "folders", "items": "items"}
+GROUP_COLUMNS = {"packageType": "package_types", "repoType": "repo_types"}
+
+
+def format_size(num_bytes):
+    """
+    Formats a byte count with a binary unit, e.g. 1536 -> "1.50 KB".
+    """
+    size = float(num_bytes)
+    for unit in ("bytes", "KB", "MB", "GB", "TB"):
+        if abs(size) < 1024 or unit == "TB":
+            return f"{int(size)} {unit}" if unit == "bytes" else f"{size:.2f} {unit}"
+        size /= 1024
+
+
+class StorageTable:
+    """
+    Column-oriented view of repositoriesSummaryList.
+
+    Numeric columns are stored in typed arrays, so sorting, top-N and
+    aggregation run over plain numbers instead of going through every
+    RepositorySummary record.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.repo_types = []
+        self.package_types = []
+        self.used_bytes = array("q")
+        self.files = array("q")
+        self.folders = array("q")
+        self.items = array("q")
+        self.percentage = array("d")
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_storage_info(cls, storage_info):
+        """
+        Builds the table from a get_storage_info_control StorageInfo, skipping
+        the "TOTAL" summary row.
+        """
+        table = cls()
+        for repo in storage_info.repositories:
+            if repo.repo_key == "TOTAL":
+                continue
+            table.keys.append(repo.repo_key or "Unknown")
+            table.repo_types.append(repo.repo_type or "Unknown")
+            table.package_types.append(repo.package_type or "Unknown")
+            table.used_bytes.append(repo.used_bytes)
+            table.files.append(repo.files)
+            table.folders.append(repo.folders)
+            table.items.append(repo.items)
+            table.percentage.append(parse_percentage(repo.percentage))
+        return table
+
+    def row(self, index):
+        return {
+            "repoKey": self.keys[index],
+            "repoType": self.repo_types[index],
+            "packageType": self.package_types[index],
+            "usedBytes": self.used_bytes[index],
+            "filesCount": self.files[index],
+            "foldersCount": self.folders[index],
+            "itemsCount": self.items[index],
+            "percentage": self.percentage[index],
+        }
+
+    def top(self, n=10, by="space"):
+        """
+        Returns the indices of the n largest repositories by space, files, folders or items.
+        """
+        column = getattr(self, SORT_COLUMNS[by])
+        return heapq.nlargest(n, range(len(self)), key=column.__getitem__)
+
+    def totals_by(self, group="packageType"):
+        """
+        Aggregates repository count, bytes and files per packageType or repoType.
+
+        Returns:
+            dict: {group value: {"repos": int, "usedBytes": int, "filesCount": int}},
+            largest groups first.
+        """
+        labels = getattr(self, GROUP_COLUMNS[group])
+        totals = {}
+        for label, used, files in zip(labels, self.used_bytes, self.files):
+            entry = totals.get(label)
+            if entry is None:
+                entry = totals[label] = {"repos": 0, "usedBytes": 0, "filesCount": 0}
+            entry["repos"] += 1
+            entry["usedBytes"] += used
+            entry["filesCount"] += files
+        return dict(sorted(totals.items(), key=lambda item: item[1]["usedBytes"], reverse=True))
+
+    def to_snapshot(self, taken_at=None):
+        return {
+            "takenAt": taken_at if taken_at is not None else time.time(),
+            "baseUrl": controls.base_url,
+            "columns": {
+                "repoKey": self.keys,
+                "repoType": self.repo_types,
+                "packageType": self.package_types,
+                "usedBytes": self.used_bytes.tolist(),
+                "filesCount": self.files.tolist(),
+                "foldersCount": self.folders.tolist(),
+                "itemsCount": self.items.tolist(),
+                "percentage": self.percentage.tolist(),
+            },
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        columns = snapshot["columns"]
+        table = cls()
+        table.keys = list(columns["repoKey"])
+        table.repo_types = list(columns["repoType"])
+        table.package_types = list(columns["packageType"])
+        table.used_bytes = array("q", columns["usedBytes"])
+        table.files = array("q", columns["filesCount"])
+        table.folders = array("q", columns["foldersCount"])
+        table.items = array("q", columns["itemsCount"])
+        table.percentage = array("d", columns["percentage"])
+        return table
+
+
+def snapshot_dir():
+    return cache_dir("storage-snapshots", instance_slug(controls.base_url))
+
+
+def save_snapshot(table):
+    """
+    Saves a timestamped snapshot of the table for later diffs.
+
+    Returns:
+        str: Path of the snapshot file.
+    """
+    snapshot = table.to_snapshot()
+    directory = snapshot_dir()
+    # Microseconds keep snapshots taken within one second in order; "x" never overwrites one
+    stamp = int(snapshot["takenAt"] * 10 ** 6)
+    while True:
+        seconds, microseconds = divmod(stamp, 10 ** 6)
+        name = time.strftime("%Y%m%dT%H%M%S", time.gmtime(seconds)) + f".{microseconds:06d}Z.json"
+        path = os.path.join(directory, name)
+        try:
+            with open(path, "x", encoding="utf-8") as handle:
+                json.dump(snapshot, handle)
+            return path
+        except FileExistsError:
+            stamp += 1
+
+
+def list_snapshots():
+    """
+    Returns snapshot paths for the current instance, oldest first.
+    """
+    directory = snapshot_dir()
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(".json")]
+
+
+def load_snapshot(path):
+    """
+    Returns (taken_at, StorageTable) for a snapshot file.
+    """
+    with open(path, encoding="utf-8") as handle:
+        snapshot = json.load(handle)
+    return snapshot["takenAt"], StorageTable.from_snapshot(snapshot)
+
+
+def diff_tables(old, new, elapsed_seconds):
+    """
+    Compares two tables repository by repository.
+
+    Args:
+        old (StorageTable): Earlier state.
+        new (StorageTable): Later state.
+        elapsed_seconds (float): Time between the two states.
+
+    Returns:
+        dict: "repositories" (changed repositories, biggest growth first, each
+        with byte/file deltas and bytes per day), "added", "removed" and
+        overall "totalDeltaBytes" and "bytesPerDay".
+    """
+    old_positions = {key: index for index, key in enumerate(old.keys)}
+    days = elapsed_seconds / 86400 if elapsed_seconds > 0 else 0
+
+    changes = []
+    for index, key in enumerate(new.keys):
+        old_index = old_positions.pop(key, None)
+        old_bytes = old.used_bytes[old_index] if old_index is not None else 0
+        old_files = old.files[old_index] if old_index is not None else 0
+        delta_bytes = new.used_bytes[index] - old_bytes
+        delta_files = new.files[index] - old_files
+        if delta_bytes or delta_files or old_index is None:
+            changes.append({
+                "repoKey": key,
+                "usedBytes": new.used_bytes[index],
+                "deltaBytes": delta_bytes,
+                "deltaFiles": delta_files,
+                "bytesPerDay": delta_bytes / days if days else 0.0,
+                "added": old_index is None,
+            })
+
+    removed = list(old_positions)
+    total_delta = sum(new.used_bytes) - sum(old.used_bytes)
+    changes.sort(key=lambda change: change["deltaBytes"], reverse=True)
+
+    return {
+        "repositories": changes,
+        "added": [change["repoKey"] for change in changes if change["added"]],
+        "removed": removed,
+        "totalDeltaBytes": total_delta,
+        "bytesPerDay": total_delta / days if days else 0.0,
+        "elapsedSeconds": elapsed_seconds,
+    }
@@ -0,0 +1,133 @@
+import codecs
+import json
+import re
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+# The separator after an array item with the whitespace around it
+_SEPARATOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+
+# What may follow the part of a number decoded so far, e.g. "." of "1.5" or "e" of "1e3"
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*")
+
+# Drop consumed text from the buffer once this many characters have been parsed
+_COMPACT_AT = 1 << 16
+
+
+class _Buffer:
+    """
+    Text buffer fed from an iterator of byte chunks, decoding UTF-8 on the fly.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """
+        Appends the next chunk. Returns False once the input is exhausted.
+        """
+        if self.eof:
+            return False
+        if self.pos >= _COMPACT_AT:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        for chunk in self.chunks:
+            if chunk:
+                self.text += self.decoder.decode(chunk)
+                return True
+        self.text += self.decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def skip_whitespace(self):
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text) or not self.fill():
+                return
+
+    def peek(self):
+        self.skip_whitespace()
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            found = self.peek() or "end of input"
+            raise ValueError(f"Expected '{char}' at offset {self.pos}, found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """
+        Decodes one complete JSON value, reading more input until it fits.
+        """
+        if self.pos >= len(self.text) or self.text[self.pos] in _WHITESPACE:
+            self.skip_whitespace()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except ValueError:
+                if self.fill():
+                    continue
+                raise
+            # A number running into the end of the buffer may continue in the next chunk
+            if type(value) in (int, float) and not self.eof \
+                    and _NUMBER_TAIL.match(self.text, end).end() == len(self.text) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks, key=None):
+    """
+    Incrementally parses a JSON array, yielding its items as they arrive
+    without holding the whole document in memory.
+
+    Args:
+        chunks (iterable): Byte chunks, e.g. response.iter_content(65536).
+        key (str): When set, the document is an object and the array to
+            stream is the value of this top-level key. Values before it are
+            parsed and discarded; anything after the array is not read.
+
+    Yields:
+        The decoded array items.
+
+    Raises:
+        ValueError: If the input is not valid JSON of the expected shape.
+    """
+    buffer = _Buffer(chunks)
+
+    if key is not None:
+        buffer.expect("{")
+        while True:
+            if buffer.peek() == "}":
+                return
+            name = buffer.value()
+            buffer.expect(":")
+            if name == key:
+                break
+            buffer.value()
+            if buffer.peek() == ",":
+                buffer.pos += 1
+
+    buffer.expect("[")
+    if buffer.peek() == "]":
+        return
+    while True:
+        yield buffer.value()
+        # Fast path for the common case of the separator being buffered already
+        match = _SEPARATOR.match(buffer.text, buffer.pos)
+        if match:
+            if match.group(1) == "]":
+                return
+            buffer.pos = match.end()
+            continue
+        separator = buffer.peek()
+        if separator == "]":
+            return
+        buffer.expect(",")
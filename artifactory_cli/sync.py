@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import posixpath
+import time
+
+from artifactory_cli import async_controls, controls
+from artifactory_cli.paths import cache_dir
+from artifactory_cli.transfer import upload_files
+
+
+def _hash_cache_path(local_dir):
+    # One cache file per local folder, named after its absolute path
+    name = hashlib.sha1(os.path.abspath(local_dir).encode()).hexdigest()[:16]
+    return os.path.join(cache_dir("sync-hashes"), f"{name}.json")
+
+
+def load_hash_cache(local_dir):
+    """
+    Returns {relative path: [size, mtime_ns, file_checksums]} saved by the last sync of local_dir.
+    """
+    try:
+        with open(_hash_cache_path(local_dir), encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_hash_cache(local_dir, entries):
+    path = _hash_cache_path(local_dir)
+    with open(path + ".tmp", "w", encoding="utf-8") as handle:
+        json.dump(entries, handle)
+    os.replace(path + ".tmp", path)
+
+
+def iter_local_files(local_dir):
+    """
+    Walks local_dir, yielding (relative posix path, absolute path, os.stat_result).
+    """
+    for directory, _, names in os.walk(local_dir):
+        relative_dir = os.path.relpath(directory, local_dir)
+        for name in names:
+            path = os.path.join(directory, name)
+            relative = name if relative_dir == "." else posixpath.join(*relative_dir.split(os.sep), name)
+            yield relative, path, os.stat(path)
+
+
+def plan_sync(local_dir, repo_key, target_prefix="", concurrency=8):
+    """
+    Compares a local folder with a repository folder.
+
+    The remote side is read with one deep file-list request. Local files are
+    only hashed (in parallel) when their size or modification time changed
+    since the last sync, so an unchanged tree costs no hashing at all.
+
+    Args:
+        local_dir (str): Local folder to mirror.
+        repo_key (str): Target repository key.
+        target_prefix (str): Folder inside the repository.
+        concurrency (int): Number of files hashed at once.
+
+    Returns:
+        dict: "upload" ((local_path, target_path, checksums, reason) tuples),
+        "delete" (remote orphan paths), and "unchanged", "local", "remote" and
+        "hashed" counts.
+    """
+    if not os.path.isdir(local_dir):
+        raise FileNotFoundError(f"No such directory: '{local_dir}'")
+    prefix = target_prefix.strip("/")
+
+    # Step 1: Remote state from the deep file list: {relative path: (size, sha1)}.
+    # A target folder that does not exist yet (404) is an empty remote
+    remote = {}
+    for entry in controls.iter_file_list_control(repo_key, prefix, missing_ok=True):
+        if not entry.get("folder"):
+            remote[entry["uri"].lstrip("/")] = (int(entry.get("size", 0)), entry.get("sha1"))
+    if not remote:
+        # A repository that does not exist answers 404 too; fail here instead of on every upload
+        controls.get_repository_config_control(repo_key)
+
+    # Step 2: Local state, reusing cached checksums for untouched files
+    cache = load_hash_cache(local_dir)
+    entries = {}
+    stale = []
+    for relative, path, stat in iter_local_files(local_dir):
+        cached = cache.get(relative)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            entries[relative] = cached
+        else:
+            entries[relative] = [stat.st_size, stat.st_mtime_ns, None]
+            stale.append((relative, path))
+
+    relatives = {path: relative for relative, path in stale}
+    errors = []
+
+    def store(item, result):
+        if isinstance(result, Exception):
+            errors.append(f"{item[0]}: {result}")
+        else:
+            entries[relatives[item[0]]][2] = result
+
+    async_controls.run_each(controls.file_checksums, ((path,) for path in relatives), concurrency, store)
+    if errors:
+        raise Exception(f"Failed to hash {len(errors)} local file(s), e.g. {errors[0]}")
+    save_hash_cache(local_dir, entries)
+
+    # Step 3: Diff
+    remote_count = len(remote)
+    uploads = []
+    unchanged = 0
+    for relative, (size, _, checksums) in sorted(entries.items()):
+        remote_entry = remote.pop(relative, None)
+        if remote_entry is None:
+            reason = "new"
+        elif remote_entry[0] != size or remote_entry[1] != checksums["sha1"]:
+            reason = "changed"
+        else:
+            unchanged += 1
+            continue
+        uploads.append((os.path.join(local_dir, *relative.split("/")),
+                        posixpath.join(prefix, relative).lstrip("/"), checksums, reason))
+
+    return {
+        "upload": uploads,
+        "delete": sorted(posixpath.join(prefix, relative).lstrip("/") for relative in remote),
+        "unchanged": unchanged,
+        "local": len(entries),
+        "remote": remote_count,
+        "hashed": len(stale),
+    }
+
+
+def apply_sync(plan, repo_key, concurrency=8, delete=False, on_result=None):
+    """
+    Uploads the new and changed files of a plan and optionally deletes the
+    remote orphans, both in parallel.
+
+    Args:
+        plan (dict): Output of plan_sync.
+        repo_key (str): Target repository key.
+        concurrency (int): Number of API calls in flight.
+        delete (bool): Delete remote files that no longer exist locally.
+        on_result (callable): Called as on_result(action, target_path, response)
+            with action "upload" or "delete".
+
+    Returns:
+        dict: Counts of "uploaded", "checksum", "deleted" and "failed" files,
+        "bytes" sent and "elapsed" seconds.
+    """
+    start = time.perf_counter()
+
+    def report_upload(local_path, target_path, response):
+        if on_result:
+            on_result("upload", target_path, response)
+
+    files = ((local_path, target_path, checksums) for local_path, target_path, checksums, _ in plan["upload"])
+    summary = upload_files(repo_key, files, concurrency, True, report_upload)
+    summary["deleted"] = 0
+
+    def report_delete(item, response):
+        if isinstance(response, Exception):
+            response = {"error": str(response)}
+        if "error" in response:
+            summary["failed"] += 1
+        else:
+            summary["deleted"] += 1
+        if on_result:
+            on_result("delete", item[1], response)
+
+    if delete and plan["delete"]:
+        async_controls.run_each(controls.delete_artifact_control,
+                                ((repo_key, path) for path in plan["delete"]), concurrency, report_delete)
+
+    summary["elapsed"] = time.perf_counter() - start
+    return summary
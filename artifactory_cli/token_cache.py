@@ -0,0 +1,114 @@
+import hashlib
+import hmac
+import json
+import os
+import time
+
+from artifactory_cli.paths import cache_dir
+
+
+REFRESH_MARGIN = 600        # Refresh tokens this many seconds before they expire
+PBKDF2_ITERATIONS = 50000   # Cost of the password verifier stored with each token
+
+
+def _cache_path():
+    return os.path.join(cache_dir(), "tokens.json")
+
+
+def _cache_key(base_url, username):
+    return f"{base_url.rstrip('/')}|{username}"
+
+
+def _password_verifier(password, salt):
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, PBKDF2_ITERATIONS).hex()
+
+
+def _load():
+    try:
+        with open(_cache_path(), encoding="utf-8") as handle:
+            data = json.load(handle)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(data):
+    """
+    Writes the cache atomically with owner-only (0600) permissions.
+    """
+    path = _cache_path()
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        os.chmod(temp_path, 0o600)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def get_cached_token(base_url, username, password):
+    """
+    Returns a cached token that is still valid for longer than REFRESH_MARGIN.
+
+    The password must match the one the token was created with, so a wrong
+    password never unlocks a cached token.
+
+    Args:
+        base_url (str): Artifactory base URL.
+        username (str): Artifactory username.
+        password (str): Artifactory password.
+
+    Returns:
+        str or None: The token, or None if there is no usable cached token.
+    """
+    entry = _load().get(_cache_key(base_url, username))
+    if not entry:
+        return None
+
+    try:
+        if entry["expires_at"] - REFRESH_MARGIN <= time.time():
+            return None
+        verifier = _password_verifier(password, bytes.fromhex(entry["salt"]))
+        if not hmac.compare_digest(verifier, entry["verifier"]):
+            return None
+        return entry["access_token"]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def store_token(base_url, username, password, access_token, expires_in):
+    """
+    Saves a token and its expiry time, dropping any expired entries.
+
+    Args:
+        base_url (str): Artifactory base URL.
+        username (str): Artifactory username.
+        password (str): Password used to create the token.
+        access_token (str): The token.
+        expires_in (int): Token lifetime in seconds from now.
+    """
+    now = time.time()
+    data = {key: entry for key, entry in _load().items()
+            if isinstance(entry, dict) and entry.get("expires_at", 0) > now}
+
+    salt = os.urandom(16)
+    data[_cache_key(base_url, username)] = {
+        "access_token": access_token,
+        "expires_at": now + expires_in,
+        "salt": salt.hex(),
+        "verifier": _password_verifier(password, salt),
+    }
+    _save(data)
+
+
+def remove_token(base_url, username):
+    """
+    Removes the cached token for a user, e.g. after the server rejected it.
+    """
+    data = _load()
+    if data.pop(_cache_key(base_url, username), None) is not None:
+        _save(data)
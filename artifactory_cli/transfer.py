@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import posixpath
+import time
+
+from artifactory_cli import async_controls, controls
+
+
+def iter_upload_files(paths, target_prefix=""):
+    """
+    Expands files and directories into (local_path, target_path) pairs.
+
+    Files go directly under target_prefix; directories are walked and keep
+    their relative layout below target_prefix/<directory name>.
+
+    Args:
+        paths (list): Local files and/or directories.
+        target_prefix (str): Folder inside the repository.
+
+    Yields:
+        tuple: (local_path, target_path), lazily.
+    """
+    prefix = target_prefix.strip("/")
+
+    for path in paths:
+        if os.path.isdir(path):
+            root_name = os.path.basename(os.path.normpath(path))
+            for directory, _, names in os.walk(path):
+                relative_dir = os.path.relpath(directory, path)
+                for name in sorted(names):
+                    relative = name if relative_dir == "." else posixpath.join(*relative_dir.split(os.sep), name)
+                    yield os.path.join(directory, name), posixpath.join(prefix, root_name, relative).lstrip("/")
+        elif os.path.isfile(path):
+            yield path, posixpath.join(prefix, os.path.basename(path)).lstrip("/")
+        else:
+            raise FileNotFoundError(f"No such file or directory: '{path}'")
+
+
+def upload_files(repo_key, files, concurrency=8, checksum_deploy=True, on_result=None):
+    """
+    Uploads many files in parallel over the pooled session.
+
+    Each file is hashed and checksum-deployed by a worker, and only streamed
+    from disk when Artifactory does not already have its content.
+
+    Args:
+        repo_key (str): Target repository key.
+        files (iterable): (local_path, target_path) pairs, e.g. from iter_upload_files,
+            optionally with precomputed file_checksums as a third item.
+        concurrency (int): Number of files in flight.
+        checksum_deploy (bool): Try checksum deploys before sending bodies.
+        on_result (callable): Called as on_result(local_path, target_path, response).
+
+    Returns:
+        dict: Counts of "uploaded", "checksum" (deployed without sending the
+        body) and "failed" files, "bytes" sent, "elapsed" seconds and "rate"
+        in files per second.
+    """
+    summary = {"uploaded": 0, "checksum": 0, "failed": 0, "bytes": 0}
+
+    def report(item, response):
+        local_path, target_path = item[1], item[2]
+        if isinstance(response, Exception):
+            response = {"error": str(response)}
+        if "error" in response:
+            summary["failed"] += 1
+        else:
+            summary["uploaded" if response["deployed"] == "upload" else "checksum"] += 1
+            summary["bytes"] += response["bytes"]
+        if on_result:
+            on_result(local_path, target_path, response)
+
+    items = ((repo_key, local_path, target_path, checksum_deploy, *checksums)
+             for local_path, target_path, *checksums in files)
+
+    start = time.perf_counter()
+    async_controls.run_each(controls.upload_artifact_control, items, concurrency, report)
+    elapsed = time.perf_counter() - start
+
+    total = summary["uploaded"] + summary["checksum"] + summary["failed"]
+    summary.update({"total": total, "elapsed": elapsed, "rate": total / elapsed if elapsed else 0.0})
+    return summary
+
+
+# Files are fetched in segments of this size, several segments at a time
+segment_size = 8 * 1024 * 1024
+
+# Strongest first; the first checksum the server reports is used for verification
+VERIFY_ALGORITHMS = ("sha256", "sha1", "md5")
+
+
+def download_destination(path, destination, flat=False):
+    """
+    Returns the local path for an artifact path: its repository layout below
+    destination, or just its file name when flat is set.
+    """
+    parts = [part for part in path.split("/") if part]
+    return os.path.join(destination, parts[-1]) if flat else os.path.join(destination, *parts)
+
+
+def _load_journal(journal_path, expected):
+    try:
+        with open(journal_path, encoding="utf-8") as handle:
+            journal = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if any(journal.get(name) != value for name, value in expected.items()):
+        return None
+    return journal
+
+
+def _save_journal(journal_path, journal):
+    temp_path = journal_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(journal, handle)
+    os.replace(temp_path, journal_path)
+
+
+def _file_digest(path, algorithm, chunk_size=1024 * 1024):
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def download_file(repo_key, path, output_path, concurrency=4, segment_bytes=None, on_segment=None):
+    """
+    Downloads one artifact with parallel HTTP range requests.
+
+    The file is preallocated as "<output_path>.part" and every segment is
+    streamed straight to its offset, so memory use does not depend on the
+    file size. Completed segments are recorded in "<output_path>.part.json";
+    if the download is interrupted, running it again only fetches the
+    missing segments. The result is verified against the checksum reported
+    by Artifactory before it is moved into place.
+
+    Args:
+        repo_key (str): Repository key.
+        path (str): Artifact path inside the repository.
+        output_path (str): Local file to create.
+        concurrency (int): Segments fetched at once.
+        segment_bytes (int): Segment size (defaults to segment_size).
+        on_segment (callable): Called as on_segment(bytes_written) per completed segment.
+
+    Returns:
+        dict: A success message with "size", "bytes" downloaded by this run,
+        "segments" and "resumed" segments, or an error message.
+    """
+    segment_bytes = segment_bytes or segment_size
+
+    try:
+        info = controls.get_artifact_info_control(repo_key, path)
+        size = int(info.get("size", 0))
+        checksums = info.get("checksums", {})
+        algorithm = next((name for name in VERIFY_ALGORITHMS if checksums.get(name)), None)
+
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        part_path = output_path + ".part"
+        journal_path = part_path + ".json"
+
+        # Resume only if the journal describes this exact content and layout
+        expected = {"repo": repo_key, "path": path, "size": size,
+                    "checksum": checksums.get(algorithm), "segmentSize": segment_bytes}
+        journal = _load_journal(journal_path, expected)
+        if journal is None or not os.path.exists(part_path) or os.path.getsize(part_path) != size:
+            journal = {**expected, "done": []}
+            with open(part_path, "wb") as handle:
+                handle.truncate(size)
+            _save_journal(journal_path, journal)
+
+        done = set(journal["done"])
+        resumed = len(done)
+        segments = [(start, min(start + segment_bytes, size) - 1) for start in range(0, size, segment_bytes)]
+        pending = ((repo_key, path, part_path, start, end)
+                   for index, (start, end) in enumerate(segments) if index not in done)
+
+        progress = {"bytes": 0, "failed": 0, "error": None}
+
+        def record(item, result):
+            if isinstance(result, Exception):
+                progress["failed"] += 1
+                progress["error"] = progress["error"] or str(result)
+                return
+            done.add(item[3] // segment_bytes)
+            journal["done"] = sorted(done)
+            _save_journal(journal_path, journal)
+            progress["bytes"] += result
+            if on_segment:
+                on_segment(result)
+
+        async_controls.run_each(controls.download_range_control, pending, concurrency, record)
+
+        if progress["failed"]:
+            return {"error": f"{progress['failed']} of {len(segments)} segments failed "
+                             f"({progress['error']}); run the download again to resume."}
+
+        if algorithm and _file_digest(part_path, algorithm) != checksums[algorithm]:
+            os.remove(part_path)
+            os.remove(journal_path)
+            return {"error": f"{algorithm} checksum mismatch for '{path}'; the partial download was removed."}
+
+        os.replace(part_path, output_path)
+        os.remove(journal_path)
+        return {"message": f"'{path}' downloaded to '{output_path}'.", "size": size,
+                "bytes": progress["bytes"], "segments": len(segments), "resumed": resumed,
+                "verified": algorithm}
+    except Exception as err:
+        return {"error": str(err)}
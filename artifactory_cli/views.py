@@ -1,12 +1,59 @@
+import json
+import sys
+import time
+
 from artifactory_cli.controls import *
-from InquirerPy import prompt
 from artifactory_cli.utils_list import PACKAGE_TYPES, REPO_TYPE
 
+
+def prompt(questions):
+    """
+    Runs InquirerPy prompts. InquirerPy (and prompt_toolkit) is imported on
+    first use so scripted subcommands start without loading it.
+    """
+    from InquirerPy import prompt as inquirer_prompt
+    return inquirer_prompt(questions)
+
+
+def load_users():
+    """
+    Returns the users from the local index when offline mode is on, else from the API.
+    """
+    from artifactory_cli import metadata_store
+    if metadata_store.enabled:
+        print(metadata_store.describe("users"))
+        return metadata_store.list_users()
+    return list_users_control()
+
+
+def load_repositories(repo_type=None, package_type=None):
+    """
+    Returns the repositories from the local index when offline mode is on, else from the API.
+    """
+    from artifactory_cli import metadata_store
+    if metadata_store.enabled:
+        print(metadata_store.describe("repositories"))
+        return metadata_store.list_repositories(repo_type, package_type)
+    return list_repositories_control(repo_type, package_type)
+
+
+def load_storage_info():
+    """
+    Returns the storage info from the local index when offline mode is on, else from the API.
+    """
+    from artifactory_cli import metadata_store
+    if metadata_store.enabled:
+        print(metadata_store.describe("storage"))
+        return metadata_store.get_storage_info()
+    return get_storage_info_control()
+
+
 def system_ping_view():
     try:
         response = ping_system_control()
         print("\n✅ System Ping Successful!")
         print(f"Response: {response}\n")
+        return True
     except Exception as e:
         print(f"\n❌ Error: {e}\n")
 
@@ -41,40 +88,64 @@ def get_system_version_view():
             print("    - None")
 
         print("\n")
+        return True
 
     except Exception as e:
         print(f"\n❌ Error: {e}\n")
 
 
-def list_repositories_view():
+def list_repositories_view(stream=False, repo_type=None, package_type=None, query=None, match="auto"):
+    """
+    Lists repositories. With stream=True, repositories are printed while the
+    response is still downloading instead of after it has been parsed.
+    repo_type and package_type are filtered by the server; query searches the
+    listing locally (see search_index.RepositoryIndex.search).
+    """
     try:
-        response = list_repositories_control()
+        if stream:
+            count = 0
+            for repo in iter_repositories_control(repo_type, package_type):
+                if not count:
+                    print("\n✅ Repositories Retrieved Successfully!")
+                print(f"- {repo.key} ({repo.type})")
+                count += 1
+            if not count:
+                print("\n✅ Repositories Retrieved Successfully!")
+            return True
+
+        response = load_repositories(repo_type, package_type)
+        if query:
+            from artifactory_cli.search_index import index_for
+            response = index_for(response).search(query, match)
         print("\n✅ Repositories Retrieved Successfully!")
+        if query and not response:
+            print(f"    - No repositories match '{query}'.")
         for repo in response:
-            print(f"- {repo['key']} ({repo['type']})")
+            print(f"- {repo.key} ({repo.type})")
+        return True
     except Exception as e:
         print(f"\n❌ Error: {e}\n")
 
 
 def get_storage_info_view():
     try:
-        response = get_storage_info_control()
+        response = load_storage_info()
         print("\n✅ Storage Info Retrieved Successfully!\n")
 
         # Extract relevant storage details
-        binaries_summary = response.get("binariesSummary", {})
-        repositories_summary_list = response.get("repositoriesSummaryList", [])
-        file_store_summary = response.get("fileStoreSummary", {})
+        binaries_summary = response.binaries_summary
+        repositories_summary_list = response.repositories
+        file_store_summary = response.file_store_summary
 
         # Display Binary Storage Info
         print("🔹 Binaries Summary:")
         print("  --------------------")
-        print(f"  - Total Binaries Count:    {binaries_summary.get('binariesCount', 'Unknown')}")
-        print(f"  - Total Binaries Size:     {binaries_summary.get('binariesSize', 'Unknown')}")
-        print(f"  - Total Artifacts Size:    {binaries_summary.get('artifactsSize', 'Unknown')}")
-        print(f"  - Optimization:            {binaries_summary.get('optimization', 'Unknown')}")
-        print(f"  - Items Count:             {binaries_summary.get('itemsCount', 'Unknown')}")
-        print(f"  - Artifacts Count:         {binaries_summary.get('artifactsCount', 'Unknown')}")
+        print(f"  - Total Binaries Count:    {binaries_summary.binaries_count or 'Unknown'}")
+        print(f"  - Total Binaries Size:     {binaries_summary.binaries_size or 'Unknown'}")
+        print(f"  - Total Artifacts Size:    {binaries_summary.artifacts_size or 'Unknown'}")
+        print(f"  - Optimization:            {binaries_summary.optimization or 'Unknown'}")
+        print(f"  - Items Count:             {binaries_summary.items_count or 'Unknown'}")
+        print(f"  - Artifacts Count:         {binaries_summary.artifacts_count or 'Unknown'}")
         print()
 
         # Display Repositories Summary
@@ -82,12 +153,12 @@ def get_storage_info_view():
         print("  ------------------------")
         if repositories_summary_list:
             for repo in repositories_summary_list:
-                print(f"  - Repo Key: {repo.get('repoKey', 'Unknown')}")
-                print(f"    - Type:          {repo.get('repoType', 'Unknown')}")
-                print(f"    - Folders Count: {repo.get('foldersCount', 'Unknown')}")
-                print(f"    - Files Count:   {repo.get('filesCount', 'Unknown')}")
-                print(f"    - Used Space:    {repo.get('usedSpace', 'Unknown')}")
-                print(f"    - Percentage:    {repo.get('percentage', 'Unknown')}")
+                print(f"  - Repo Key: {repo.repo_key or 'Unknown'}")
+                print(f"    - Type:          {repo.repo_type or 'Unknown'}")
+                print(f"    - Folders Count: {repo.folders_count if repo.folders_count is not None else 'Unknown'}")
+                print(f"    - Files Count:   {repo.files_count if repo.files_count is not None else 'Unknown'}")
+                print(f"    - Used Space:    {repo.used_space or 'Unknown'}")
+                print(f"    - Percentage:    {repo.percentage or 'Unknown'}")
                 print()
 
         else:
@@ -98,21 +169,292 @@ def get_storage_info_view():
         print("  ----------------------")
         print(f"  - Storage Type:     {file_store_summary.get('storageType', 'Unknown')}")
         print(f"  - Storage Directory:{file_store_summary.get('storageDirectory', 'Unknown')}\n")
+        return True
 
     except Exception as e:
         print(f"\n❌ Error: {e}\n")
 
 
-def list_users_view():
+def storage_analytics_view(top=10, by="space", snapshot=False):
+    """
+    Shows storage as numbers rather than display strings:
+    - The top repositories by used space or file count.
+    - Totals per package type and per repository type.
+    Optionally saves a timestamped snapshot for storage_diff_view.
+    """
+    try:
+        from artifactory_cli.storage_analytics import StorageTable, format_size, save_snapshot
+
+        table = StorageTable.from_storage_info(load_storage_info())
+        print(f"\n✅ Storage Analytics for {len(table)} Repositories\n")
+
+        # Step 1: Top-N repositories
+        print(f"🔹 Top {top} Repositories by {by}:")
+        print(f"  {'Repo Key':<40} {'Type':<8} {'Package':<12} {'Used Space':>12} {'Files':>10}")
+        print("  " + "-" * 86)
+        for index in table.top(top, by):
+            print(f"  {table.keys[index]:<40} {table.repo_types[index]:<8} {table.package_types[index]:<12} "
+                  f"{format_size(table.used_bytes[index]):>12} {table.files[index]:>10,}")
+        print()
+
+        # Step 2: Totals per package type and repository type
+        for group, title in (("packageType", "Package Type"), ("repoType", "Repository Type")):
+            print(f"🔹 Totals by {title}:")
+            print(f"  {title:<20} {'Repos':>7} {'Used Space':>12} {'Files':>12}")
+            print("  " + "-" * 54)
+            for label, totals in table.totals_by(group).items():
+                print(f"  {label:<20} {totals['repos']:>7} {format_size(totals['usedBytes']):>12} "
+                      f"{totals['filesCount']:>12,}")
+            print()
+
+        print(f"🔹 Total: {format_size(sum(table.used_bytes))} in {sum(table.files):,} files\n")
+
+        # Step 3: Snapshot for growth tracking
+        if snapshot:
+            print(f"💾 Snapshot saved to {save_snapshot(table)}\n")
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def duplicates_view(repos=None, repo_type=None, package_type=None, top=10, concurrency=None, from_index=False,
+                    as_json=False):
+    """
+    Finds binaries stored under more than one path:
+    - Streams the deep file list of each repository into an on-disk checksum index.
+    - Shows logical versus physical bytes, the largest duplicate groups and
+      the repositories holding the most bytes that another repository also has.
+    """
+    try:
+        from artifactory_cli.duplicates import analyze, build_index
+        from artifactory_cli.storage_analytics import format_size
+
+        out = sys.stderr if as_json else sys.stdout
+
+        # Step 1: Index the file lists, unless reusing the last index
+        if not from_index:
+            if not repos:
+                repos = [repo.key for repo in load_repositories(repo_type or "local", package_type)]
+            if not repos:
+                print("\n❌ No repositories to analyze.\n", file=out)
+                return
+            print(f"\n🔍 Indexing the files of {len(repos)} repositories...", file=out)
+            interactive = out.isatty()
+
+            def report(files):
+                if interactive:
+                    print(f"\r  {files:,} files indexed", end="", flush=True, file=out)
+
+            start = time.perf_counter()
+            result = build_index(repos, concurrency=concurrency, on_progress=report)
+            elapsed = time.perf_counter() - start
+            if interactive:
+                print(file=out)
+            print(f"🔹 Indexed {result['files']:,} files of {result['repositories']} repositories in {elapsed:.2f}s "
+                  f"({result['files'] / elapsed if elapsed else 0:,.0f} files/s)", file=out)
+            for repo_key, error in sorted(result["errors"].items()):
+                print(f"  ❌ {repo_key}: {error}", file=out)
+
+        # Step 2: Analyze
+        report = analyze(top=top)
+        if as_json:
+            print(json.dumps(report, indent=2))
+            return True
+
+        print(f"\n✅ Duplicate Binaries in {report['repositories']} Repositories\n")
+        print(f"  - Files:            {report['files']:,}")
+        print(f"  - Unique binaries:  {report['uniqueBinaries']:,}")
+        print(f"  - Logical size:     {format_size(report['logicalBytes'])}")
+        print(f"  - Physical size:    {format_size(report['physicalBytes'])}")
+        print(f"  - Duplicated:       {format_size(report['duplicateBytes'])} in {report['groups']:,} groups "
+              f"({report['crossRepoGroups']:,} across repositories)\n")
+
+        if report["topGroups"]:
+            print(f"🔹 Largest Duplicate Groups (top {len(report['topGroups'])}):")
+            print(f"  {'SHA-1':<14} {'Size':>12} {'Copies':>7} {'Repos':>6} {'Wasted':>12}  Example")
+            print("  " + "-" * 96)
+            for group in report["topGroups"]:
+                print(f"  {group['sha1'][:12]:<14} {format_size(group['size']):>12} {group['copies']:>7,} "
+                      f"{group['repositories']:>6} {format_size(group['wastedBytes']):>12}  {group['examples'][0]}")
+                for example in group["examples"][1:]:
+                    print(f"  {'':<56}{example}")
+            print()
+
+        if report["topRepositories"]:
+            print(f"🔹 Repositories Sharing the Most Bytes with Others (top {len(report['topRepositories'])}):")
+            print(f"  {'Repo Key':<40} {'Shared':>12} {'Files':>10} {'of Total':>12}")
+            print("  " + "-" * 78)
+            for repo in report["topRepositories"]:
+                print(f"  {repo['repo']:<40} {format_size(repo['sharedBytes']):>12} {repo['sharedFiles']:>10,} "
+                      f"{format_size(repo['bytes']):>12}")
+            print()
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n", file=sys.stderr if as_json else sys.stdout)
+
+
+def storage_diff_view(old_path=None, new_path=None, top=20):
+    """
+    Compares two storage snapshots (by default the two most recent ones) and
+    shows growth per repository and overall growth rate.
+    """
+    try:
+        from artifactory_cli.storage_analytics import diff_tables, format_size, list_snapshots, load_snapshot
+
+        if not old_path or not new_path:
+            snapshots = list_snapshots()
+            if len(snapshots) < 2:
+                print("\n❌ At least two snapshots are needed. Run 'storage --analytics --snapshot' twice.\n")
+                return
+            old_path, new_path = snapshots[-2], snapshots[-1]
+
+        old_time, old_table = load_snapshot(old_path)
+        new_time, new_table = load_snapshot(new_path)
+        diff = diff_tables(old_table, new_table, new_time - old_time)
+
+        hours = diff["elapsedSeconds"] / 3600
+        print(f"\n✅ Storage Growth over {hours:.1f} hours\n")
+        print(f"  From: {old_path}")
+        print(f"  To:   {new_path}\n")
+
+        changed = diff["repositories"]
+        if changed:
+            print(f"🔹 Changed Repositories (top {min(top, len(changed))} of {len(changed)}):")
+            print(f"  {'Repo Key':<40} {'Used Space':>12} {'Change':>12} {'Files':>8} {'Per Day':>12}")
+            print("  " + "-" * 88)
+            for change in changed[:top]:
+                label = change["repoKey"] + (" (new)" if change["added"] else "")
+                print(f"  {label:<40} {format_size(change['usedBytes']):>12} "
+                      f"{format_size(change['deltaBytes']):>12} {change['deltaFiles']:>+8,} "
+                      f"{format_size(change['bytesPerDay']):>12}")
+            print()
+        else:
+            print("  - No repository changed.\n")
+
+        if diff["removed"]:
+            print(f"🔹 Removed Repositories: {', '.join(diff['removed'])}\n")
+
+        print(f"🔹 Total change: {format_size(diff['totalDeltaBytes'])} "
+              f"({format_size(diff['bytesPerDay'])} per day)\n")
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def watch_view(interval=1.0, storage_interval=60.0, window=300, samples_path=None, count=None, top=20):
+    """
+    Live monitor: pings on an interval with rolling latency statistics and
+    polls storage info at a slower cadence, showing only the repositories
+    whose usage changed since the previous poll. On a terminal the display
+    refreshes in place; otherwise one line is printed per sample.
+    Stops on Ctrl+C or after count pings.
+    """
+    from artifactory_cli import controls
+    from artifactory_cli.storage_analytics import format_size
+    from artifactory_cli.watch import watch
+
+    interactive = sys.stdout.isatty()
+    ms = lambda value: f"{value:.1f}" if value is not None else "-"
+    shown = {"polledAt": None}
+
+    def ping_line(stats):
+        summary = stats.summary()
+        last = stats.last
+        status = f"❌ {last['error']}" if last["error"] else f"✅ {last['ms']:.1f} ms"
+        return (f"🔹 Ping (last {summary['window']}): min {ms(summary['min'])} / avg {ms(summary['avg'])} / "
+                f"p95 {ms(summary['p95'])} / max {ms(summary['max'])} ms, errors {summary['errorRate']:.1%} "
+                f"({summary['errors']} of {summary['count']} total) | last: {status}")
+
+    def storage_lines(storage):
+        if storage is None:
+            return []
+        polled = time.strftime("%H:%M:%S", time.localtime(storage["polledAt"]))
+        if storage["error"]:
+            return [f"❌ Storage poll at {polled} failed: {storage['error']}"]
+        lines = [f"🔹 Storage (polled {polled}): {storage['repositories']} repositories, "
+                 f"{format_size(storage['totalBytes'])}"]
+        changes = storage["changes"]
+        if storage["unchanged"] or (changes and not changes["repositories"] and not changes["removed"]):
+            lines.append("  - No change since the previous poll.")
+        elif changes:
+            changed = changes["repositories"]
+            lines.append(f"  Changed since the previous poll ({len(changed)}), "
+                         f"total {format_size(changes['totalDeltaBytes'])}:")
+            for change in changed[:top]:
+                label = change["repoKey"] + (" (new)" if change["added"] else "")
+                lines.append(f"  {label:<40} {format_size(change['usedBytes']):>12} "
+                             f"{format_size(change['deltaBytes']):>12} {change['deltaFiles']:>+8,}")
+            if len(changed) > top:
+                lines.append(f"  ... and {len(changed) - top} more")
+            if changes["removed"]:
+                lines.append(f"  Removed: {', '.join(changes['removed'])}")
+        return lines
+
+    def render(stats, storage):
+        if interactive:
+            # Redraw in place: cursor home, clear screen
+            print("\033[H\033[J", end="")
+            print(f"👀 Watching {controls.base_url} (ping every {interval:g}s, storage every {storage_interval:g}s). "
+                  f"Ctrl+C to stop.\n")
+            print(ping_line(stats))
+            print()
+            print("\n".join(storage_lines(storage)), flush=True)
+            return
+        print(ping_line(stats), flush=True)
+        if storage and storage["polledAt"] != shown["polledAt"]:
+            shown["polledAt"] = storage["polledAt"]
+            print("\n".join(storage_lines(storage)), flush=True)
+
+    try:
+        stats = watch(interval, storage_interval, window, samples_path, render, count)
+    except KeyboardInterrupt:
+        print("\n\n👋 Watch stopped.\n")
+        return True
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+        return
+
+    return stats.errors == 0
+
+
+def print_user(user):
+    print(f"  - Username: {user.name or 'Unknown'}")
+    print(f"    Email:    {user.email or 'Unknown'}")
+    print(f"    Admin:    {'Yes' if user.admin else 'No'}")
+    print("  ----------------------------------------")
+
+
+def list_users_view(stream=False):
     """
     Retrieves and displays a list of users from Artifactory in a presentable format.
+    With stream=True, users are printed while the response is still downloading,
+    keeping memory flat for very large instances.
     """
     try:
         print("\n📋 List of Users in Artifactory\n")
 
+        if stream:
+            count = 0
+            try:
+                for user in iter_users_control():
+                    if not count:
+                        print("🔹 Artifactory Users:")
+                        print("  ----------------------------------------")
+                    print_user(user)
+                    count += 1
+            except Exception as e:
+                print(f"\n❌ Error fetching users: {e}\n")
+                return
+            if not count:
+                print("No users found.")
+            return True
+
         # Step 1: Fetch the list of users
         try:
-            users = list_users_control()
+            users = load_users()
         except Exception as e:
             print(f"\n❌ Error fetching users: {e}\n")
             return
@@ -122,44 +464,43 @@ def list_users_view():
             print("🔹 Artifactory Users:")
             print("  ----------------------------------------")
             for user in users:
-                username = user.get("name", "Unknown")
-                email = user.get("email", "Unknown")
-                admin = user.get("admin", False)
-
-                print(f"  - Username: {username}")
-                print(f"    Email:    {email}")
-                print(f"    Admin:    {'Yes' if admin else 'No'}")
-                print("  ----------------------------------------")
+                print_user(user)
         else:
             print("No users found.")
+        return True
 
     except Exception as e:
         print(f"\n❌ Application Error: {e}\n")
 
 
-def create_user_view():
+def create_user_view(username=None, email=None, password=None, is_admin=None):
     """
     Handles the user input and logic for creating a new user in Artifactory.
+    Values passed in as arguments are not prompted for.
     """
     try:
         print("\n🛠 Create a New User\n")
 
         # Step 1: Prompt for user details
-        username = input("Enter the username: ").strip()
-        email = input("Enter the email address: ").strip()
-        password = input("Enter the password: ").strip()
+        if username is None:
+            username = input("Enter the username: ").strip()
+        if email is None:
+            email = input("Enter the email address: ").strip()
+        if password is None:
+            password = input("Enter the password: ").strip()
 
         # Step 2: Use InquirerPy for admin selection
-        questions = [
-            {
-                "type": "list",
-                "name": "is_admin",
-                "message": "Should the user be an admin?",
-                "choices": ["No", "Yes"],  # Options for admin status
-            }
-        ]
-        answers = prompt(questions)
-        is_admin = answers["is_admin"] == "Yes"  # Convert response to a boolean
+        if is_admin is None:
+            questions = [
+                {
+                    "type": "list",
+                    "name": "is_admin",
+                    "message": "Should the user be an admin?",
+                    "choices": ["No", "Yes"],  # Options for admin status
+                }
+            ]
+            answers = prompt(questions)
+            is_admin = answers["is_admin"] == "Yes"  # Convert response to a boolean
 
         # Validate inputs
         if not username or not email or not password:
@@ -172,6 +513,7 @@ def create_user_view():
         # Step 4: Handle API response
         if response == 201: 
             print(f"\n✅ User '{username}' created successfully as {'Admin' if is_admin else 'Regular User'}!\n")
+            return True
         else:
             print(f"\n❌ Error: {response['error']}\n")
 
@@ -179,65 +521,129 @@ def create_user_view():
         print(f"\n❌ Application Error: {e}\n")
 
 
-from InquirerPy import prompt
+def print_bulk_user_result(result):
+    line = f"line {result['line']}"
+    username = result["username"] or "-"
+    if result["status"] == "created":
+        print(f"  ✅ {line}: '{username}' created")
+    elif result["status"] == "skipped":
+        print(f"  ⏭  {line}: '{username}' skipped ({result['error']})")
+    else:
+        print(f"  ❌ {line}: '{username}' {result['status']} ({result['error']})")
+
+
+def print_bulk_user_summary(summary):
+    print("\n🔹 Bulk Import Summary:")
+    print("  ----------------------------------------")
+    print(f"  - Rows processed:  {summary['total']}")
+    print(f"  - Created:         {summary['created']}")
+    print(f"  - Skipped:         {summary['skipped']}")
+    print(f"  - Failed:          {summary['failed']}")
+    print(f"  - Invalid:         {summary['invalid']}")
+    print(f"  - Elapsed:         {summary['elapsed']:.2f}s")
+    print(f"  - Throughput:      {summary['rate']:.1f} rows/s\n")
+
+
+def bulk_create_users_view(path=None, concurrency=None):
+    """
+    Creates users in bulk from a CSV or JSONL file, printing a line per row
+    and a throughput summary at the end.
+    """
+    try:
+        print("\n🛠 Bulk Create Users\n")
+
+        # Step 1: Prompt for the file and worker count if not given
+        if not path:
+            path = input("Enter the path to a .csv or .jsonl file: ").strip()
+            if path and concurrency is None:
+                concurrency = input("Number of parallel workers [auto]: ").strip() or None
+        if not path:
+            print("\n❌ A file path is required.\n")
+            return
+        if concurrency is not None:
+            concurrency = int(concurrency)
+            if concurrency < 1:
+                print("\n❌ Number of workers must be at least 1.\n")
+                return
+
+        # Step 2: Stream the file through the worker pool
+        from artifactory_cli.bulk import iter_user_records, bulk_create_users
+        summary = bulk_create_users(iter_user_records(path), concurrency, on_result=print_bulk_user_result)
+
+        # Step 3: Report totals
+        print_bulk_user_summary(summary)
+        return summary["failed"] == 0
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
 
-def delete_user_view():
+def delete_user_view(username=None, assume_yes=False):
     """
     Handles the user interface for deleting a user from Artifactory.
-    Excludes the usernames 'tyrone', 'anonymous', and 'test-user' from the selection.
+    Protected users (see bulk.protected_users) are excluded from the selection.
+    When a username is passed in, the selection is skipped; assume_yes skips the confirmation.
     """
     try:
         print("\n🛠 Delete a User\n")
 
-        # Step 1: Fetch the list of users
-        try:
-            users = list_users_control()
-        except Exception as e:
-            print(f"\n❌ Error fetching users: {e}\n")
-            return
+        # Exclude protected usernames
+        from artifactory_cli.bulk import protected_users
+        excluded_users = protected_users()
 
-        if not users:
-            print("❌ No users found.")
-            return
+        if username is None:
+            # Step 1: Fetch the list of users
+            try:
+                users = load_users()
+            except Exception as e:
+                print(f"\n❌ Error fetching users: {e}\n")
+                return
 
-        # Exclude specific usernames
-        excluded_users = {"tyrone", "anonymous", "test-user"}
-        user_choices = [user["name"] for user in users if user["name"] not in excluded_users]
+            if not users:
+                print("❌ No users found.")
+                return
 
-        if not user_choices:
-            print("\n❌ No users available for deletion.\n")
-            return
+            user_choices = [user.name for user in users if user.name not in excluded_users]
 
-        # Step 2: Use InquirerPy to select a user from the filtered list
-        questions = [
-            {
-                "type": "list",
-                "name": "selected_user",
-                "message": "Select the user to delete:",
-                "choices": user_choices,
-            }
-        ]
-        answers = prompt(questions)
-        username = answers.get("selected_user")
+            if not user_choices:
+                print("\n❌ No users available for deletion.\n")
+                return
+
+            # Step 2: Use InquirerPy to select a user from the filtered list
+            questions = [
+                {
+                    "type": "list",
+                    "name": "selected_user",
+                    "message": "Select the user to delete:",
+                    "choices": user_choices,
+                }
+            ]
+            answers = prompt(questions)
+            username = answers.get("selected_user")
 
         if not username:
             print("\n❌ No user selected.\n")
             return
 
-        # Step 3: Confirm the deletion using InquirerPy
-        confirm_questions = [
-            {
-                "type": "confirm",
-                "name": "confirm_delete",
-                "message": f"Are you sure you want to delete the user '{username}'?",
-                "default": False,  # Default to 'No' for safety
-            }
-        ]
-        confirm_answers = prompt(confirm_questions)
-        if not confirm_answers["confirm_delete"]:
-            print("\n❌ Deletion canceled.\n")
+        if username in excluded_users:
+            print(f"\n❌ User '{username}' is protected and cannot be deleted.\n")
             return
 
+        # Step 3: Confirm the deletion using InquirerPy
+        if not assume_yes:
+            confirm_questions = [
+                {
+                    "type": "confirm",
+                    "name": "confirm_delete",
+                    "message": f"Are you sure you want to delete the user '{username}'?",
+                    "default": False,  # Default to 'No' for safety
+                }
+            ]
+            confirm_answers = prompt(confirm_questions)
+            if not confirm_answers["confirm_delete"]:
+                print("\n❌ Deletion canceled.\n")
+                return
+
         # Step 4: Call the API control function to delete the user
         response = delete_user_control(username)
 
@@ -246,54 +652,202 @@ def delete_user_view():
             print(f"\n❌ Error: {response['error']}\n")
         else:
             print(f"\n✅ {response['message']}\n")
+            return True
 
     except Exception as e:
         print(f"\n❌ Error: {e}\n")
 
 
+def print_progress(done, total, failed, width=30):
+    """
+    Redraws a one-line progress bar in place.
+    """
+    filled = int(width * done / total) if total else width
+    status = f", {failed} failed" if failed else ""
+    print(f"\r  [{'#' * filled}{'-' * (width - filled)}] {done}/{total}{status}", end="", flush=True)
 
-def create_repository_view():
+
+def bulk_delete_users_view(pattern=None, email_domain=None, names_file=None, protect=None, dry_run=None,
+                           concurrency=None, assume_yes=False):
+    """
+    Deletes many users at once:
+    - Selects users by username pattern, email domain, a file of usernames,
+      or (when none is given) a prompt with multi-select.
+    - Lists the selection and leaves protected users out.
+    - Deletes the confirmed users in parallel with a progress bar and summary.
+    """
+    try:
+        print("\n🛠 Bulk Delete Users\n")
+
+        from artifactory_cli.bulk import bulk_delete_users, protected_users, read_usernames, select_users
+
+        protected = protected_users(protect)
+        names = read_usernames(names_file) if names_file else None
+        pattern = pattern.strip() if pattern is not None else None
+        email_domain = email_domain.strip() if email_domain is not None else None
+        if pattern == "" or email_domain == "":
+            print("\n❌ The username pattern and email domain cannot be blank.\n")
+            return
+
+        # Step 1: Fetch the users
+        try:
+            users = load_users()
+        except Exception as e:
+            print(f"\n❌ Error fetching users: {e}\n")
+            return
+
+        # Step 2: Prompt for the selection if no criteria were given
+        if pattern is None and email_domain is None and names is None:
+            mode = prompt([{
+                "type": "list",
+                "name": "mode",
+                "message": "How do you want to select the users?",
+                "choices": ["Pick from a list", "Username pattern (regex)", "Email domain", "File of usernames"],
+            }])["mode"]
+            if mode == "Pick from a list":
+                choices = [user.name for user in users if user.name not in protected]
+                if not choices:
+                    print("\n❌ No users available for deletion.\n")
+                    return
+                names = prompt([{
+                    "type": "fuzzy",
+                    "name": "users",
+                    "message": "Select the users to delete (Tab to mark, Enter to confirm):",
+                    "choices": choices,
+                    "multiselect": True,
+                }])["users"] or []
+            elif mode == "Username pattern (regex)":
+                pattern = input("Enter a regular expression matched against usernames: ").strip()
+            elif mode == "Email domain":
+                email_domain = input("Enter the email domain (e.g. contractor.example.com): ").strip()
+            else:
+                names = read_usernames(input("Enter the path to the file (.txt, .csv or .jsonl): ").strip())
+            if not (pattern or email_domain or names):
+                print("\n❌ No users selected.\n")
+                return
+
+        # Step 3: List the selection
+        selection = select_users(users, pattern, email_domain, names, protected)
+        selected = selection["selected"]
+        for user in selected:
+            print(f"  🗑️  {user.name:<32} {user.email or ''}")
+        for name in selection["protected"]:
+            print(f"  🔒 {name:<32} protected, skipped")
+        for name in selection["missing"]:
+            print(f"  ❔ {name:<32} not found")
+        print(f"\n🔹 {len(selected)} user(s) selected, {len(selection['protected'])} protected, "
+              f"{len(selection['missing'])} not found\n")
+
+        if not selected:
+            print("✅ Nothing to delete.\n")
+            return True
+
+        # Step 4: Confirm, unless this is a dry run
+        if dry_run is None:
+            dry_run = prompt([{
+                "type": "confirm",
+                "name": "dry_run",
+                "message": "Dry run only (do not delete)?",
+                "default": False,
+            }])["dry_run"]
+        if dry_run:
+            print("ℹ️  Dry run, no users deleted.\n")
+            return True
+        if not assume_yes:
+            confirm = prompt([{
+                "type": "confirm",
+                "name": "confirm_delete",
+                "message": f"Are you sure you want to delete {len(selected)} user(s)?",
+                "default": False,
+            }])
+            if not confirm["confirm_delete"]:
+                print("\n❌ Deletion canceled.\n")
+                return
+
+        # Step 5: Delete in parallel
+        total = len(selected)
+        failures = []
+        interactive = sys.stdout.isatty()
+        progress = {"done": 0}
+
+        def report(result):
+            progress["done"] += 1
+            if result["status"] != "deleted":
+                failures.append(result)
+            if interactive:
+                print_progress(progress["done"], total, len(failures))
+            elif result["status"] == "deleted":
+                print(f"  ✅ '{result['username']}' deleted")
+            else:
+                print(f"  ❌ '{result['username']}' {result['status']} ({result['error']})")
+
+        summary = bulk_delete_users([user.name for user in selected], concurrency, protected, report)
+        if interactive:
+            print()
+            for result in failures:
+                print(f"  ❌ '{result['username']}' {result['status']} ({result['error']})")
+
+        # Step 6: Report totals
+        print("\n🔹 Bulk Delete Summary:")
+        print("  ----------------------------------------")
+        print(f"  - Users selected:  {summary['total']}")
+        print(f"  - Deleted:         {summary['deleted']}")
+        print(f"  - Skipped:         {summary['skipped']}")
+        print(f"  - Failed:          {summary['failed']}")
+        print(f"  - Elapsed:         {summary['elapsed']:.2f}s")
+        print(f"  - Throughput:      {summary['rate']:.1f} users/s\n")
+        return summary["failed"] == 0
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def create_repository_view(repo_key=None, repo_type=None, package_type=None, remote_url=None):
     """
     Handles the user interface for creating a new repository in Artifactory.
     Uses InquirerPy to select repository type and package type.
+    Values passed in as arguments are not prompted for.
     """
     try:
         print("\n🛠 Create a New Repository\n")
 
         # Step 1: Prompt for repository key (name)
-        repo_key = input("Enter the repository key (name): ").strip()
+        if repo_key is None:
+            repo_key = input("Enter the repository key (name): ").strip()
         if not repo_key:
             print("\n❌ Repository key is required.\n")
             return
 
         # Step 2: Use InquirerPy to select repository type
-        repo_type_question = [
-            {
-                "type": "list",
-                "name": "repo_type",
-                "message": "Select the repository type:",
-                "choices": REPO_TYPE,
-            }
-        ]
-        repo_type_answer = prompt(repo_type_question)
-        repo_type = repo_type_answer.get("repo_type")
+        if repo_type is None:
+            repo_type_question = [
+                {
+                    "type": "list",
+                    "name": "repo_type",
+                    "message": "Select the repository type:",
+                    "choices": REPO_TYPE,
+                }
+            ]
+            repo_type_answer = prompt(repo_type_question)
+            repo_type = repo_type_answer.get("repo_type")
 
         # Step 3: Use InquirerPy to select package type
-        package_type_question = [
-            {
-                "type": "list",
-                "name": "package_type",
-                "message": "Select the package type:",
-                "choices": PACKAGE_TYPES,
-            }
-        ]
-        package_type_answer = prompt(package_type_question)
-        package_type = package_type_answer.get("package_type")
+        if package_type is None:
+            package_type_question = [
+                {
+                    "type": "list",
+                    "name": "package_type",
+                    "message": "Select the package type:",
+                    "choices": PACKAGE_TYPES,
+                }
+            ]
+            package_type_answer = prompt(package_type_question)
+            package_type = package_type_answer.get("package_type")
 
         # Step 4: Handle additional input for remote repositories
-        remote_url = None
         if repo_type == "remote":
-            remote_url = input("Enter the remote repository URL: ").strip()
+            if remote_url is None:
+                remote_url = input("Enter the remote repository URL: ").strip()
             if not remote_url:
                 print("\n❌ Remote URL is required for remote repositories.\n")
                 return
@@ -306,13 +860,490 @@ def create_repository_view():
             print(f"\n❌ Error: {response['error']}\n")
         else:
             print(f"\n✅ {response['message']}\n")
+            return True
 
     except Exception as e:
         print(f"\n❌ Error: {e}\n")
 
 
+def upload_view(repo_key=None, paths=None, target_prefix=None, concurrency=8, checksum_deploy=True):
+    """
+    Uploads files and directories to a repository in parallel, printing a line
+    per file and a summary with how many bytes checksum deploys saved.
+    """
+    try:
+        print("\n📤 Upload Artifacts\n")
+
+        # Step 1: Prompt for the target and the files if not given
+        if not repo_key:
+            repo_key = input("Enter the target repository key: ").strip()
+        if not paths:
+            path = input("Enter a file or directory to upload: ").strip()
+            paths = [path] if path else []
+        if target_prefix is None:
+            target_prefix = input("Enter the target folder in the repository (leave blank for root): ").strip()
+        if not repo_key or not paths:
+            print("\n❌ A repository key and at least one path are required.\n")
+            return
+
+        # Step 2: Upload on the worker pool, reporting each file as it completes
+        from artifactory_cli.transfer import iter_upload_files, upload_files
+        from artifactory_cli.storage_analytics import format_size
 
-def update_repository_view():
+        def print_result(local_path, target_path, response):
+            if "error" in response:
+                print(f"  ❌ {local_path}: {response['error']}")
+            elif response["deployed"] == "checksum":
+                print(f"  ♻️  {target_path} (checksum deploy, not re-sent)")
+            else:
+                print(f"  ✅ {target_path} ({format_size(response['bytes'])})")
+
+        summary = upload_files(repo_key, iter_upload_files(paths, target_prefix), concurrency,
+                               checksum_deploy, on_result=print_result)
+
+        # Step 3: Report totals
+        print("\n🔹 Upload Summary:")
+        print("  ----------------------------------------")
+        print(f"  - Files:             {summary['total']}")
+        print(f"  - Uploaded:          {summary['uploaded']}")
+        print(f"  - Checksum deployed: {summary['checksum']}")
+        print(f"  - Failed:            {summary['failed']}")
+        print(f"  - Bytes sent:        {format_size(summary['bytes'])}")
+        print(f"  - Elapsed:           {summary['elapsed']:.2f}s")
+        print(f"  - Throughput:        {summary['rate']:.1f} files/s\n")
+        return summary["failed"] == 0
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def download_view(repo_key=None, paths=None, destination=None, concurrency=4, segment_mb=None, flat=False):
+    """
+    Downloads artifacts with parallel range requests, resuming interrupted
+    downloads and verifying each file against its Artifactory checksum.
+    """
+    try:
+        print("\n📥 Download Artifacts\n")
+
+        # Step 1: Prompt for the source and destination if not given
+        if not repo_key:
+            repo_key = input("Enter the repository key: ").strip()
+        if not paths:
+            path = input("Enter the artifact path to download: ").strip()
+            paths = [path] if path else []
+        if destination is None:
+            destination = input("Enter the destination folder (leave blank for current folder): ").strip() or "."
+        if not repo_key or not paths:
+            print("\n❌ A repository key and at least one artifact path are required.\n")
+            return
+
+        # Step 2: Download each artifact in parallel segments
+        from artifactory_cli.transfer import download_destination, download_file
+        from artifactory_cli.storage_analytics import format_size
+
+        segment_bytes = int(segment_mb * 1024 * 1024) if segment_mb else None
+        failed = 0
+        total_bytes = 0
+        start = time.perf_counter()
+
+        for path in paths:
+            output_path = download_destination(path, destination, flat)
+            response = download_file(repo_key, path, output_path, concurrency, segment_bytes)
+            if "error" in response:
+                failed += 1
+                print(f"  ❌ {path}: {response['error']}")
+                continue
+            total_bytes += response["bytes"]
+            resumed = f", resumed {response['resumed']}/{response['segments']} segments" if response["resumed"] else ""
+            verified = f", {response['verified']} verified" if response["verified"] else ", not verified"
+            print(f"  ✅ {output_path} ({format_size(response['size'])}{resumed}{verified})")
+
+        # Step 3: Report totals
+        elapsed = time.perf_counter() - start
+        print("\n🔹 Download Summary:")
+        print("  ----------------------------------------")
+        print(f"  - Files:      {len(paths)}")
+        print(f"  - Failed:     {failed}")
+        print(f"  - Downloaded: {format_size(total_bytes)}")
+        print(f"  - Elapsed:    {elapsed:.2f}s")
+        print(f"  - Throughput: {format_size(total_bytes / elapsed if elapsed else 0)}/s\n")
+        return failed == 0
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def sync_view(local_dir=None, repo_key=None, target_prefix=None, delete=False, dry_run=None,
+              concurrency=8, assume_yes=False):
+    """
+    Mirrors a local folder into a repository folder:
+    - Reads the remote files with a single deep file-list call.
+    - Hashes only local files that changed since the last sync.
+    - Uploads new/changed files and, with delete, removes remote orphans.
+    """
+    try:
+        print("\n🔁 Sync Folder to Repository\n")
+
+        # Step 1: Prompt for the source and target if not given
+        if not local_dir:
+            local_dir = input("Enter the local folder to sync: ").strip()
+        if not repo_key:
+            repo_key = input("Enter the target repository key: ").strip()
+        if target_prefix is None:
+            target_prefix = input("Enter the target folder in the repository (leave blank for root): ").strip()
+        if not local_dir or not repo_key:
+            print("\n❌ A local folder and a repository key are required.\n")
+            return
+
+        # Step 2: Plan
+        from artifactory_cli.sync import plan_sync, apply_sync
+        from artifactory_cli.storage_analytics import format_size
+
+        plan = plan_sync(local_dir, repo_key, target_prefix, concurrency)
+        for local_path, target_path, checksums, reason in plan["upload"]:
+            print(f"  {'➕' if reason == 'new' else '🔄'} {reason:<8} {target_path}")
+        for target_path in plan["delete"]:
+            print(f"  {'🗑️ ' if delete else '❔'} {'delete' if delete else 'orphan':<8} {target_path}")
+        print(f"\n🔹 Plan: {len(plan['upload'])} to upload, {plan['unchanged']} unchanged, "
+              f"{len(plan['delete'])} remote orphans{'' if delete else ' (kept)'}; "
+              f"{plan['local']} local / {plan['remote']} remote files, {plan['hashed']} hashed\n")
+
+        actions = len(plan["upload"]) + (len(plan["delete"]) if delete else 0)
+        if actions == 0:
+            print("✅ Already in sync.\n")
+            return True
+
+        # Step 3: Confirm, unless this is a dry run
+        if dry_run is None:
+            dry_run = prompt([{
+                "type": "confirm",
+                "name": "dry_run",
+                "message": "Dry run only (do not apply changes)?",
+                "default": False,
+            }])["dry_run"]
+        if dry_run:
+            print("ℹ️  Dry run, no changes applied.\n")
+            return True
+        if delete and plan["delete"] and not assume_yes:
+            confirm = prompt([{
+                "type": "confirm",
+                "name": "confirm_delete",
+                "message": f"Delete {len(plan['delete'])} remote file(s) that are not in '{local_dir}'?",
+                "default": False,
+            }])
+            if not confirm["confirm_delete"]:
+                print("\n❌ Sync canceled.\n")
+                return
+
+        # Step 4: Apply in parallel and report
+        def print_result(action, target_path, response):
+            if "error" in response:
+                print(f"  ❌ {target_path}: {response['error']}")
+            elif action == "delete":
+                print(f"  🗑️  {target_path} deleted")
+            elif response["deployed"] == "checksum":
+                print(f"  ♻️  {target_path} (checksum deploy, not re-sent)")
+            else:
+                print(f"  ✅ {target_path} ({format_size(response['bytes'])})")
+
+        summary = apply_sync(plan, repo_key, concurrency, delete, print_result)
+        print("\n🔹 Sync Summary:")
+        print("  ----------------------------------------")
+        print(f"  - Uploaded:          {summary['uploaded']}")
+        print(f"  - Checksum deployed: {summary['checksum']}")
+        print(f"  - Deleted:           {summary['deleted']}")
+        print(f"  - Failed:            {summary['failed']}")
+        print(f"  - Bytes sent:        {format_size(summary['bytes'])}")
+        print(f"  - Elapsed:           {summary['elapsed']:.2f}s\n")
+        return summary["failed"] == 0
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def aql_search_view(criteria=None, domain="items", include=None, sort=None, descending=False, limit=None,
+                    page_size=10000, output_path=None, output_format=None):
+    """
+    Runs an AQL query, paging through the results and writing them as JSONL
+    or CSV while later pages are still being fetched.
+
+    Rows go to output_path, or to the screen when it is not set; the summary
+    is then printed to stderr so the rows can be piped.
+    """
+    try:
+        # Step 1: Prompt for the query if not given
+        if criteria is None:
+            print("\n🔎 AQL Search\n")
+            criteria = json.loads(input('Enter the find() criteria as JSON (e.g. {"repo": "libs-release-local"}): ')
+                                  .strip() or "{}")
+            fields = input("Enter fields to include, comma separated (leave blank for all): ").strip()
+            include = [field.strip() for field in fields.split(",") if field.strip()] or None
+            output_path = input("Enter an output file (.jsonl or .csv, leave blank to print): ").strip() or None
+
+        if output_format is None:
+            output_format = "csv" if output_path and output_path.lower().endswith(".csv") else "jsonl"
+
+        # Step 2: Stream pages into the writer
+        from artifactory_cli.aql import iter_results, write_csv, write_jsonl
+
+        rows = iter_results(criteria, domain, include, sort, descending, page_size, limit)
+        start = time.perf_counter()
+        handle = open(output_path, "w", encoding="utf-8", newline="") if output_path else sys.stdout
+        try:
+            if output_format == "csv":
+                count = write_csv(rows, handle, include)
+            else:
+                count = write_jsonl(rows, handle)
+        finally:
+            if output_path:
+                handle.close()
+        elapsed = time.perf_counter() - start
+
+        # Step 3: Report
+        summary = sys.stderr if not output_path else sys.stdout
+        target = f" to '{output_path}'" if output_path else ""
+        print(f"\n✅ {count} row(s) written{target} in {elapsed:.2f}s "
+              f"({count / elapsed if elapsed else 0:.0f} rows/s).\n", file=summary)
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n", file=sys.stderr)
+
+
+def cleanup_plan_view(repos=None, older_than=None, not_downloaded_since=None, min_size=None, include=None,
+                      exclude=None, output=None, page_size=10000):
+    """
+    Plans a cleanup of stale artifacts:
+    - Pages through AQL results of each repository, filtered by age, last
+      download, size and path patterns.
+    - Streams the artifacts to delete into a reviewable plan file.
+    - Shows the items and bytes to reclaim per repository.
+
+    Returns:
+        str: The plan path, or None on failure.
+    """
+    try:
+        from artifactory_cli.cleanup import build_rules, write_plan
+        from artifactory_cli.models import parse_size
+        from artifactory_cli.storage_analytics import format_size
+
+        # Step 1: Prompt for the criteria if not given
+        if not repos:
+            print("\n🧹 Plan Artifact Cleanup\n")
+            repos = [key.strip() for key in input("Enter repository keys, comma separated: ").split(",") if key.strip()]
+            older_than = int(input("Only artifacts created more than N days ago (blank for any): ").strip() or 0)
+            not_downloaded_since = int(input("Only artifacts not downloaded in N days (blank for any): ").strip() or 0)
+            min_size = parse_size(input("Only artifacts of at least this size, e.g. 100MB (blank for any): ").strip())
+            include = [pattern.strip() for pattern in
+                       input("Path patterns to include, e.g. *.tar.gz (blank for all): ").split(",") if pattern.strip()]
+            exclude = [pattern.strip() for pattern in
+                       input("Path patterns to keep (blank for none): ").split(",") if pattern.strip()]
+        if not repos:
+            print("\n❌ At least one repository is required.\n")
+            return
+        rules = build_rules(older_than, not_downloaded_since, min_size, include, exclude)
+        output = output or time.strftime("cleanup-plan-%Y%m%d-%H%M%S.jsonl")
+
+        # Step 2: Stream the candidates into the plan
+        interactive = sys.stdout.isatty()
+
+        def report(scanned, matched):
+            if interactive:
+                print(f"\r  Scanned {scanned:,} artifacts, {matched:,} to delete", end="", flush=True)
+
+        start = time.perf_counter()
+        summary = write_plan(output, repos, rules, page_size, report)
+        elapsed = time.perf_counter() - start
+        if interactive:
+            print()
+
+        # Step 3: Show what would be reclaimed
+        print(f"\n✅ Plan written to {output} in {elapsed:.2f}s\n")
+        if summary["repositories"]:
+            print(f"  {'Repo Key':<40} {'Artifacts':>10} {'Reclaim':>12}")
+            print("  " + "-" * 64)
+            for repo_key, (count, size) in sorted(summary["repositories"].items(), key=lambda item: -item[1][1]):
+                print(f"  {repo_key:<40} {count:>10,} {format_size(size):>12}")
+            print()
+        print(f"🔹 {summary['items']:,} artifact(s), {format_size(summary['bytes'])} to reclaim\n")
+        if summary["items"]:
+            print(f"ℹ️  Review the plan, then run: artifactory-cli cleanup run {output}\n")
+        return output
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def cleanup_run_view(path=None, concurrency=None, assume_yes=False, journal=None):
+    """
+    Runs a cleanup plan: deletes its artifacts in parallel with a progress
+    bar, journaling every deletion so an interrupted run can be resumed.
+    """
+    try:
+        from artifactory_cli import controls
+        from artifactory_cli.cleanup import journal_path, load_journal, read_plan, run_plan
+        from artifactory_cli.storage_analytics import format_size
+
+        print("\n🧹 Run Artifact Cleanup\n")
+
+        # Step 1: Load the plan
+        if not path:
+            path = input("Enter the path to a cleanup plan: ").strip()
+        if not path:
+            print("\n❌ A plan path is required.\n")
+            return
+        header, plan_summary = read_plan(path)
+        if header["instance"].rstrip("/") != controls.base_url.rstrip("/"):
+            print(f"\n❌ The plan was made for {header['instance']}, not {controls.base_url}.\n")
+            return
+        journal = journal or journal_path(path)
+        done = len(load_journal(journal))
+        total = plan_summary["items"]
+        print(f"🔹 {total:,} artifact(s), {format_size(plan_summary['bytes'])} in "
+              f"{len(plan_summary['repositories'])} repositories")
+        if done:
+            print(f"🔹 Resuming: {done:,} already deleted according to {journal}")
+        print()
+        if total - done <= 0:
+            print("✅ Nothing left to delete.\n")
+            return True
+
+        # Step 2: Confirm
+        if not assume_yes:
+            confirm = prompt([{
+                "type": "confirm",
+                "name": "confirm_cleanup",
+                "message": f"Delete {total - done:,} artifact(s)?",
+                "default": False,
+            }])
+            if not confirm["confirm_cleanup"]:
+                print("\n❌ Cleanup canceled.\n")
+                return
+
+        # Step 3: Delete in parallel
+        interactive = sys.stdout.isatty()
+        progress = {"done": done, "failed": 0}
+        failures = []
+
+        def report(entry, response):
+            progress["done"] += 1
+            if "error" in response:
+                progress["failed"] += 1
+                if len(failures) < 20:
+                    failures.append((entry, response["error"]))
+                if not interactive:
+                    print(f"  ❌ {entry['repo']}/{entry['path']}: {response['error']}")
+            if interactive and (progress["done"] % 100 == 0 or progress["done"] == total):
+                print_progress(progress["done"], total, progress["failed"])
+
+        summary = run_plan(path, concurrency, journal, report)
+        if interactive:
+            print_progress(progress["done"], total, progress["failed"])
+            print()
+            for entry, error in failures:
+                print(f"  ❌ {entry['repo']}/{entry['path']}: {error}")
+
+        # Step 4: Report totals
+        print("\n🔹 Cleanup Summary:")
+        print("  ----------------------------------------")
+        print(f"  - Deleted:         {summary['deleted']:,}")
+        print(f"  - Already done:    {summary['skipped']:,}")
+        print(f"  - Failed:          {summary['failed']:,}")
+        print(f"  - Reclaimed:       {format_size(summary['bytes'])}")
+        print(f"  - Elapsed:         {summary['elapsed']:.2f}s")
+        print(f"  - Throughput:      {summary['rate']:.1f} artifacts/s\n")
+        if summary["failed"]:
+            print("ℹ️  Run the plan again to retry the failed deletions.\n")
+            return
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def print_fleet_table(results):
+    """
+    Prints one row per instance with the check results and per-check latency.
+    """
+    def value(result, check):
+        entry = result["checks"].get(check)
+        if not entry:
+            return "-"
+        if not entry["ok"]:
+            return "timeout" if entry["error"].startswith("timed out") else "error"
+        if check == "storage":
+            return entry["value"]
+        return str(entry["value"])
+
+    def ms(result, check):
+        entry = result["checks"].get(check)
+        return f"{entry['ms']:.0f}" if entry else "-"
+
+    width = max([len("instance")] + [len(result["name"]) for result in results]) + 2
+    header = (f"   {'instance':<{width}}{'ping':<8}{'version':<12}{'repos':>7}{'binaries':>12}"
+              f"{'ping ms':>10}{'version ms':>12}{'storage ms':>12}")
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        storage = value(result, "storage")
+        repos, binaries = (storage["repositories"], storage["binariesSize"] or "-") if isinstance(storage, dict) \
+            else (storage, "-")
+        print(f"{'✅' if result['ok'] else '❌'} {result['name']:<{width}}{value(result, 'ping'):<8}"
+              f"{value(result, 'version'):<12}{repos:>7}{binaries:>12}"
+              f"{ms(result, 'ping'):>10}{ms(result, 'version'):>12}{ms(result, 'storage'):>12}")
+
+
+def fleet_view(inventory_path=None, checks=None, timeout=None, token=None, username=None, password=None):
+    """
+    Checks every instance of an inventory at once (ping, version and storage
+    info) and prints one consolidated table. Slow instances time out on their
+    own, so the check takes as long as the slowest instance.
+    """
+    try:
+        # Step 1: Load the inventory
+        if not inventory_path:
+            print("\n🌐 Fleet Health Check\n")
+            inventory_path = input("Enter the path to the inventory file (.json, .yaml or .yml): ").strip()
+        if not inventory_path:
+            print("\n❌ An inventory file is required.\n")
+            return
+
+        from artifactory_cli import controls
+        from artifactory_cli.fleet import CHECKS, check_fleet, default_timeout, load_inventory
+
+        if not token and not (username and password):
+            token = controls.token
+        instances = load_inventory(inventory_path, token, username, password)
+        if not instances:
+            print("\n❌ The inventory has no instances.\n")
+            return
+        checks = checks or CHECKS
+        timeout = timeout or default_timeout
+        print(f"\n🔹 Checking {len(instances)} instance(s) ({', '.join(checks)}, timeout {timeout:g}s)...\n")
+
+        # Step 2: Run every check at once
+        start = time.perf_counter()
+        results = check_fleet(instances, checks, timeout)
+        elapsed = time.perf_counter() - start
+
+        # Step 3: Report
+        print_fleet_table(results)
+        for result in results:
+            for check, entry in result["checks"].items():
+                if not entry["ok"]:
+                    print(f"❌ {result['name']} {check}: {entry['error']}")
+
+        healthy = sum(1 for result in results if result["ok"])
+        slowest = max(results, key=lambda result: result["ms"])
+        print(f"\n{'✅' if healthy == len(results) else '❌'} {healthy}/{len(results)} instance(s) healthy in "
+              f"{elapsed:.2f}s (slowest: {slowest['name']}, {slowest['ms']:.0f} ms).\n")
+        return healthy == len(results)
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def update_repository_view(repo_key=None, updates=None):
     """
     Handles the process of updating an existing repository by:
     - Fetching a list of repositories from Artifactory.
@@ -320,64 +1351,77 @@ def update_repository_view():
     - Prompting the user to provide updated values for specific properties.
     - Sending the update request to the Artifactory API.
 
+    A repository key and updates passed in as arguments are not prompted for.
+
     Returns:
-        None
+        bool: True if the repository was updated.
     """
     try:
         print("\n🔄 Update an Existing Repository\n")
 
-        # Step 1: Fetch the list of repositories
-        try:
-            repositories = list_repositories_control()
-        except Exception as e:
-            print(f"\n❌ Error fetching repositories: {e}\n")
-            return
-
-        if not repositories:
-            print("\n❌ No repositories found.\n")
-            return
-
-        # Step 2: Prepare repository options for the menu
-        repo_choices = [
-            f"{repo['key']} ({repo['type']})" for repo in repositories
-        ]
+        if repo_key is None:
+            # Step 1: Fetch the list of repositories
+            try:
+                repositories = load_repositories()
+            except Exception as e:
+                print(f"\n❌ Error fetching repositories: {e}\n")
+                return
 
-        # Step 3: Display the menu to select a repository
-        questions = [
-            {
-                "type": "list",
-                "name": "selected_repo",
-                "message": "Select the repository to update:",
-                "choices": repo_choices,
-            }
-        ]
-        answers = prompt(questions)
+            if not repositories:
+                print("\n❌ No repositories found.\n")
+                return
 
-        # Get the selected repository key
-        repo_key = answers.get("selected_repo").split(" ")[0]
+            # Narrow large listings down with the search index before showing the menu
+            query = input("Filter repositories (leave blank to show all): ").strip()
+            if query:
+                from artifactory_cli.search_index import index_for
+                repositories = index_for(repositories).search(query)
+                if not repositories:
+                    print(f"\n❌ No repositories match '{query}'.\n")
+                    return
+
+            # Step 2: Prepare repository options for the menu
+            repo_choices = [
+                f"{repo.key} ({repo.type})" for repo in repositories
+            ]
+
+            # Step 3: Display the menu to select a repository
+            questions = [
+                {
+                    "type": "list",
+                    "name": "selected_repo",
+                    "message": "Select the repository to update:",
+                    "choices": repo_choices,
+                }
+            ]
+            answers = prompt(questions)
+
+            # Get the selected repository key
+            repo_key = answers.get("selected_repo").split(" ")[0]
         
         if not repo_key:
             print("\n❌ No repository selected.\n")
             return
 
-        # Step 4: Prompt for new repository properties
-        print("\nProvide values for the properties you want to update (leave blank to skip):\n")
-
-        description = input("Enter the new description for the repository: ").strip()
-        notes = input("Enter custom notes for the repository: ").strip()
-        includes_pattern = input("Enter the includes pattern (e.g., '**/*'): ").strip()
-        excludes_pattern = input("Enter the excludes pattern (e.g., '*.tmp'): ").strip()
-
-        # Construct updates payload
-        updates = {}
-        if description:
-            updates["description"] = description
-        if notes:
-            updates["notes"] = notes
-        if includes_pattern:
-            updates["includesPattern"] = includes_pattern
-        if excludes_pattern:
-            updates["excludesPattern"] = excludes_pattern
+        if updates is None:
+            # Step 4: Prompt for new repository properties
+            print("\nProvide values for the properties you want to update (leave blank to skip):\n")
+
+            description = input("Enter the new description for the repository: ").strip()
+            notes = input("Enter custom notes for the repository: ").strip()
+            includes_pattern = input("Enter the includes pattern (e.g., '**/*'): ").strip()
+            excludes_pattern = input("Enter the excludes pattern (e.g., '*.tmp'): ").strip()
+
+            # Construct updates payload
+            updates = {}
+            if description:
+                updates["description"] = description
+            if notes:
+                updates["notes"] = notes
+            if includes_pattern:
+                updates["includesPattern"] = includes_pattern
+            if excludes_pattern:
+                updates["excludesPattern"] = excludes_pattern
 
         if not updates:
             print("\n❌ No updates provided. Please enter at least one property to update.\n")
@@ -390,11 +1434,314 @@ def update_repository_view():
             print(f"\n❌ Error: {response['error']}\n")
         else:
             print(f"\n✅ {response['message']}\n")
+            return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def apply_manifest_view(path=None, dry_run=None, concurrency=None, assume_yes=False):
+    """
+    Applies a JSON/YAML manifest of repositories:
+    - Fetches the current repositories once.
+    - Shows which repositories will be created, updated or left alone.
+    - Runs only the needed create/update calls in parallel.
+    """
+    try:
+        print("\n📜 Apply Repository Manifest\n")
+
+        # Step 1: Load the manifest
+        if not path:
+            path = input("Enter the path to a .json or .yaml manifest: ").strip()
+        if not path:
+            print("\n❌ A manifest path is required.\n")
+            return
+        from artifactory_cli.manifest import load_manifest, plan_apply, apply_plan, load_state
+        specs = load_manifest(path)
+
+        # Step 2: Diff against the current state
+        try:
+            current = list_repositories_control()
+        except Exception as e:
+            print(f"\n❌ Error fetching repositories: {e}\n")
+            return
+        plan = plan_apply(specs, current, load_state())
+
+        icons = {"create": "➕", "update": "🔄", "conflict": "⚠️ ", "noop": "✔️ "}
+        counts = {action: 0 for action in icons}
+        for entry in plan:
+            counts[entry["action"]] += 1
+            if entry["action"] != "noop":
+                print(f"  {icons[entry['action']]} {entry['action']:<8} {entry['key']} ({entry['reason']})")
+        print(f"\n🔹 Plan: {counts['create']} to create, {counts['update']} to update, "
+              f"{counts['noop']} unchanged, {counts['conflict']} conflicts\n")
+
+        if counts["create"] + counts["update"] == 0:
+            print("✅ Nothing to apply.\n")
+            return counts["conflict"] == 0
+
+        # Step 3: Confirm, unless this is a dry run
+        if dry_run is None:
+            dry_run = prompt([{
+                "type": "confirm",
+                "name": "dry_run",
+                "message": "Dry run only (do not apply changes)?",
+                "default": False,
+            }])["dry_run"]
+        if dry_run:
+            print("ℹ️  Dry run, no changes applied.\n")
+            return True
+        if not assume_yes:
+            confirm = prompt([{
+                "type": "confirm",
+                "name": "confirm_apply",
+                "message": f"Apply {counts['create'] + counts['update']} changes?",
+                "default": False,
+            }])
+            if not confirm["confirm_apply"]:
+                print("\n❌ Apply canceled.\n")
+                return
+
+        # Step 4: Apply in parallel and report
+        failures = 0
+        for entry, response in apply_plan(plan, concurrency):
+            if "error" in response:
+                failures += 1
+                print(f"  ❌ {entry['key']}: {response['error']}")
+            else:
+                print(f"  ✅ {response['message']}")
+
+        if failures:
+            print(f"\n❌ {failures} change(s) failed.\n")
+        else:
+            print("\n✅ Manifest applied successfully!\n")
+            return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def fetch_configs_with_progress(keys, concurrency=None):
+    """
+    Fetches repository configurations in parallel, showing a progress bar on a
+    terminal. Returns the fetch_configs result.
+    """
+    from artifactory_cli.repo_configs import fetch_configs
+
+    total = len(keys)
+    interactive = sys.stdout.isatty()
+    progress = {"done": 0, "failed": 0}
+
+    def report(key, result):
+        progress["done"] += 1
+        if isinstance(result, Exception):
+            progress["failed"] += 1
+            if not interactive:
+                print(f"  ❌ {key}: {result}")
+        if interactive:
+            print_progress(progress["done"], total, progress["failed"])
+
+    configs, errors = fetch_configs(keys, concurrency, report)
+    if interactive and total:
+        print()
+        for key, error in sorted(errors.items()):
+            print(f"  ❌ {key}: {error}")
+    return configs, errors
+
+
+def export_configs_view(output=None, repo_type=None, package_type=None, concurrency=None):
+    """
+    Backs up the full configuration of every repository:
+    - Lists the repositories, optionally filtered by type and package type.
+    - Fetches each configuration in parallel.
+    - Writes a snapshot directory or a single .jsonl file.
+    """
+    try:
+        print("\n💾 Export Repository Configurations\n")
+
+        # Step 1: Pick the output
+        if not output:
+            output = input("Enter a snapshot directory or .jsonl file: ").strip()
+        if not output:
+            print("\n❌ An output path is required.\n")
+            return
+        from artifactory_cli.repo_configs import save_snapshot
+
+        # Step 2: List the repositories
+        keys = [repo.key for repo in load_repositories(repo_type, package_type)]
+        print(f"🔹 Fetching {len(keys)} repository configurations...")
+
+        # Step 3: Fetch in parallel and save
+        start = time.perf_counter()
+        configs, errors = fetch_configs_with_progress(keys, concurrency)
+        elapsed = time.perf_counter() - start
+        save_snapshot(configs, output)
+
+        print(f"\n✅ Exported {len(configs)} configurations to {output} in {elapsed:.2f}s "
+              f"({len(configs) / elapsed if elapsed else 0:.1f}/s)\n")
+        if errors:
+            print(f"❌ {len(errors)} configuration(s) could not be fetched.\n")
+            return
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
+
+def format_config_value(value):
+    return "(absent)" if value is None else json.dumps(value)
+
+
+def print_config_diff(diff):
+    """
+    Prints diff_configs output, one line per changed field.
+    """
+    for key in diff["added"]:
+        print(f"  ➕ {key}")
+    for key in diff["removed"]:
+        print(f"  ➖ {key}")
+    for key, changes in diff["changed"].items():
+        print(f"  🔄 {key}")
+        for field, before, after in changes:
+            print(f"      {field}: {format_config_value(before)} -> {format_config_value(after)}")
+
+
+def diff_configs_view(old_path=None, new_path=None, concurrency=None, as_json=False):
+    """
+    Compares two configuration snapshots, or a snapshot and the live
+    repositories when new_path is omitted, field by field.
+    """
+    try:
+        from artifactory_cli.repo_configs import diff_configs, fetch_configs, load_snapshot
+
+        if not old_path:
+            old_path = input("Enter the snapshot to compare: ").strip()
+        if not old_path:
+            print("\n❌ A snapshot path is required.\n")
+            return
+        old = load_snapshot(old_path)
+
+        if new_path:
+            new = load_snapshot(new_path)
+        else:
+            if not as_json:
+                print("🔹 Fetching live repository configurations...")
+            keys = [repo.key for repo in list_repositories_control()]
+            if as_json:
+                new, errors = fetch_configs(keys, concurrency)
+            else:
+                new, errors = fetch_configs_with_progress(keys, concurrency)
+            if errors:
+                print(f"\n❌ {len(errors)} configuration(s) could not be fetched.\n", file=sys.stderr)
+                return
+        diff = diff_configs(old, new)
+
+        if as_json:
+            print(json.dumps(diff, indent=2))
+            return True
+
+        print("\n✅ Configuration Diff\n")
+        print(f"  From: {old_path}")
+        print(f"  To:   {new_path or 'live'}\n")
+        if not (diff["added"] or diff["removed"] or diff["changed"]):
+            print("  - No differences.\n")
+            return True
+        print_config_diff(diff)
+        print(f"\n🔹 {len(diff['added'])} added, {len(diff['removed'])} removed, "
+              f"{len(diff['changed'])} changed\n")
+        return True
 
     except Exception as e:
         print(f"\n❌ Error: {e}\n")
 
 
+def import_configs_view(path=None, dry_run=None, concurrency=None, assume_yes=False):
+    """
+    Restores repository configurations from a snapshot:
+    - Fetches the live configuration of every repository in the snapshot.
+    - Shows which repositories will be created or updated, field by field.
+    - Creates missing repositories and updates only the changed fields, in parallel.
+    """
+    try:
+        print("\n📥 Import Repository Configurations\n")
+
+        # Step 1: Load the snapshot
+        if not path:
+            path = input("Enter a snapshot directory or .jsonl file: ").strip()
+        if not path:
+            print("\n❌ A snapshot path is required.\n")
+            return
+        from artifactory_cli.repo_configs import import_snapshot, load_snapshot, plan_import
+        snapshot = load_snapshot(path)
+
+        # Step 2: Diff against the live configurations
+        existing = {repo.key for repo in list_repositories_control()}
+        keys = [key for key in snapshot if key in existing]
+        print(f"🔹 Fetching {len(keys)} live repository configurations...")
+        live, errors = fetch_configs_with_progress(keys, concurrency)
+        if errors:
+            print(f"\n❌ {len(errors)} configuration(s) could not be fetched.\n")
+            return
+        plan = plan_import(snapshot, live)
+
+        icons = {"create": "➕", "update": "🔄", "conflict": "⚠️ ", "noop": "✔️ "}
+        counts = {action: 0 for action in icons}
+        for entry in plan:
+            counts[entry["action"]] += 1
+            if entry["action"] == "conflict":
+                print(f"  {icons['conflict']} conflict {entry['key']} ({entry['changes']})")
+            elif entry["action"] != "noop":
+                print(f"  {icons[entry['action']]} {entry['action']:<8} {entry['key']}")
+                for field, before, after in entry["changes"]:
+                    if after is not None:
+                        print(f"      {field}: {format_config_value(before)} -> {format_config_value(after)}")
+        print(f"\n🔹 Plan: {counts['create']} to create, {counts['update']} to update, "
+              f"{counts['noop']} unchanged, {counts['conflict']} conflicts\n")
+
+        if counts["create"] + counts["update"] == 0:
+            print("✅ Nothing to import.\n")
+            return counts["conflict"] == 0
+
+        # Step 3: Confirm, unless this is a dry run
+        if dry_run is None:
+            dry_run = prompt([{
+                "type": "confirm",
+                "name": "dry_run",
+                "message": "Dry run only (do not apply changes)?",
+                "default": False,
+            }])["dry_run"]
+        if dry_run:
+            print("ℹ️  Dry run, no changes applied.\n")
+            return True
+        if not assume_yes:
+            confirm = prompt([{
+                "type": "confirm",
+                "name": "confirm_import",
+                "message": f"Apply {counts['create'] + counts['update']} changes?",
+                "default": False,
+            }])
+            if not confirm["confirm_import"]:
+                print("\n❌ Import canceled.\n")
+                return
+
+        # Step 4: Apply in parallel and report
+        def report(entry, response):
+            if "error" in response:
+                print(f"  ❌ {entry['key']}: {response['error']}")
+            else:
+                print(f"  ✅ {response['message']}")
+
+        summary = import_snapshot(plan, concurrency, report)
+        print(f"\n🔹 {summary['created']} created, {summary['updated']} updated, "
+              f"{summary['failed']} failed in {summary['elapsed']:.2f}s\n")
+        if summary["failed"]:
+            return
+        print("✅ Snapshot imported successfully!\n")
+        return True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+
 
 def login_view():
     """
@@ -431,7 +1778,10 @@ def login_view():
 
         if "token" in response:
             token = response["token"]
-            print("\n✅ Login successful! Token generated.\n")
+            if response.get("cached"):
+                print("\n✅ Login successful! Using cached token.\n")
+            else:
+                print("\n✅ Login successful! Token generated.\n")
             return token
         else:
             print(f"\n❌ Login failed: {response['error']}\n")
@@ -0,0 +1,165 @@
+import json
+import time
+from collections import deque
+
+from artifactory_cli import controls, response_cache
+from artifactory_cli.storage_analytics import StorageTable, diff_tables
+
+
+class PingStats:
+    """
+    Rolling ping latency statistics over the last `window` samples, plus
+    totals since the start.
+    """
+
+    def __init__(self, window=300):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+        self.last = None
+
+    def add(self, ms, error=None):
+        """
+        Records one ping: its latency in milliseconds, or the error if it failed.
+        """
+        self.samples.append(None if error else ms)
+        self.count += 1
+        self.errors += 1 if error else 0
+        self.last = {"at": time.time(), "ms": ms, "error": error}
+
+    def summary(self):
+        """
+        Returns min/avg/p95/max latency (ms) of the successful pings in the
+        window, the window's error rate (0..1) and the totals.
+        """
+        latencies = sorted(sample for sample in self.samples if sample is not None)
+        failed = len(self.samples) - len(latencies)
+        result = {
+            "window": len(self.samples),
+            "errorRate": failed / len(self.samples) if self.samples else 0.0,
+            "count": self.count,
+            "errors": self.errors,
+            "min": None, "avg": None, "p95": None, "max": None,
+        }
+        if latencies:
+            result.update({
+                "min": latencies[0],
+                "avg": sum(latencies) / len(latencies),
+                "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                "max": latencies[-1],
+            })
+        return result
+
+
+class StoragePoller:
+    """
+    Polls storage info and reports only the repositories whose usage changed
+    since the previous poll.
+
+    Each poll revalidates the cached response with its ETag, so an unchanged
+    storage summary is answered with 304 and neither downloaded nor diffed.
+    """
+
+    def __init__(self):
+        self.table = None
+        self.payload = None
+        self.polled_at = None
+
+    def poll(self):
+        """
+        Returns:
+            dict: "repositories" and "totalBytes" of the current state, "changes"
+            (diff_tables output, or None on the first poll) and "unchanged"
+            (True when the server reported no change).
+        """
+        url = f"{controls.base_url}/artifactory/api/storageinfo"
+        response_cache.expire(url)
+        payload = controls.get_storage_info_control()
+        now = time.time()
+
+        if payload is self.payload:
+            self.polled_at = now
+            return {"repositories": len(self.table), "totalBytes": sum(self.table.used_bytes),
+                    "changes": None, "unchanged": True}
+
+        table = StorageTable.from_storage_info(payload)
+        changes = diff_tables(self.table, table, now - self.polled_at) if self.table is not None else None
+        self.table, self.payload, self.polled_at = table, payload, now
+        return {"repositories": len(table), "totalBytes": sum(table.used_bytes), "changes": changes,
+                "unchanged": False}
+
+
+def watch(interval=1.0, storage_interval=60.0, window=300, samples_path=None, on_update=None, count=None):
+    """
+    Pings on an interval and polls storage info at a slower cadence until
+    interrupted (or after count pings).
+
+    Ticks are scheduled on a fixed clock, so slow responses do not make the
+    sampling drift; missed ticks are skipped rather than bunched up.
+
+    Args:
+        interval (float): Seconds between pings.
+        storage_interval (float): Seconds between storage polls; 0 disables them.
+        window (int): Number of recent pings the rolling statistics cover.
+        samples_path (str): Append every sample to this JSONL file.
+        on_update (callable): Called as on_update(stats, storage) after every
+            sample, where storage is the latest StoragePoller.poll() result,
+            with "error" and "polledAt" keys added.
+        count (int): Stop after this many pings.
+
+    Returns:
+        PingStats: The collected statistics.
+    """
+    stats = PingStats(window)
+    poller = StoragePoller()
+    storage = None
+    samples = open(samples_path, "a", encoding="utf-8") if samples_path else None
+    next_ping = next_storage = time.monotonic()
+
+    try:
+        while count is None or stats.count < count:
+            now = time.monotonic()
+            if now < next_ping:
+                time.sleep(next_ping - now)
+            next_ping += interval * max(1, int((time.monotonic() - next_ping) // interval) + 1)
+
+            # Step 1: Ping
+            start = time.perf_counter()
+            try:
+                controls.ping_system_control()
+                error = None
+            except Exception as e:
+                error = str(e)
+            ms = (time.perf_counter() - start) * 1000
+            stats.add(ms, error)
+            if samples:
+                samples.write(json.dumps({"at": stats.last["at"], "type": "ping", "ms": round(ms, 3),
+                                          "error": error}) + "\n")
+
+            # Step 2: Storage, when due
+            if storage_interval and time.monotonic() >= next_storage:
+                next_storage = time.monotonic() + storage_interval
+                try:
+                    storage = poller.poll()
+                    storage["error"] = None
+                except Exception as e:
+                    storage = dict(storage or {}, changes=None, unchanged=False, error=str(e))
+                storage["polledAt"] = time.time()
+                if samples:
+                    changed = (storage.get("changes") or {}).get("repositories", [])
+                    samples.write(json.dumps({
+                        "at": storage["polledAt"], "type": "storage", "error": storage["error"],
+                        "totalBytes": storage.get("totalBytes"),
+                        "changes": [{key: change[key] for key in ("repoKey", "usedBytes", "deltaBytes", "deltaFiles")}
+                                    for change in changed],
+                    }) + "\n")
+
+            if samples:
+                samples.flush()
+            if on_update:
+                on_update(stats, storage)
+    finally:
+        if samples:
+            samples.close()
+
+    return stats
@@ -0,0 +1,209 @@
+"""
+Measures latency and throughput of every control function and of the listing
+views against the mock server, at several dataset sizes, and writes the
+results as JSON so runs can be compared.
+
+Listing controls are measured cold (response cache cleared before each call,
+so the full body is transferred and parsed) and cached. Views print to a null
+device, which still includes the cost of formatting every row.
+
+Usage:
+    python benchmarks/bench_controls.py [--sizes 10,1000,100000] [--iterations 20]
+        [--max-seconds 2] [--latency 0.0] [--output results.json]
+        [--compare baseline.json] [--threshold 1.25]
+
+With --compare, every benchmark whose mean latency grew by more than the
+threshold factor relative to the baseline file is reported as a regression
+and the script exits with status 1.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from artifactory_cli import client, controls, response_cache, views
+from mock_server import start_mock_server
+
+
+def cold(func):
+    # Drop cached responses first so the call pays for the full request
+    def call():
+        response_cache.clear()
+        return func()
+    return call
+
+
+def consume(iterator_func):
+    return lambda: sum(1 for _ in iterator_func())
+
+
+def quiet(view):
+    def call():
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            response_cache.clear()
+            return view()
+    return call
+
+
+def user_lifecycle():
+    # One create plus one delete, so the dataset size stays constant
+    controls.create_user_control("bench-user", "bench-user@example.com", "Bench-Passw0rd!")
+    controls.delete_user_control("bench-user")
+
+
+def benchmarks(size):
+    """
+    Returns (name, callable, records per call) for every measured operation.
+    """
+    return [
+        ("ping_system_control", controls.ping_system_control, 1),
+        ("get_system_version_control", cold(controls.get_system_version_control), 1),
+        ("get_storage_info_control", cold(controls.get_storage_info_control), size),
+        ("get_storage_info_control[cached]", controls.get_storage_info_control, size),
+        ("list_users_control", cold(controls.list_users_control), size),
+        ("list_users_control[cached]", controls.list_users_control, size),
+        ("iter_users_control", consume(controls.iter_users_control), size),
+        ("list_repositories_control", cold(controls.list_repositories_control), size),
+        ("list_repositories_control[cached]", controls.list_repositories_control, size),
+        ("iter_repositories_control", consume(controls.iter_repositories_control), size),
+        ("login_control", lambda: controls.login_control("bench", "bench", use_cache=False), 1),
+        ("create_user_control+delete_user_control", user_lifecycle, 2),
+        ("create_repository_control", lambda: controls.create_repository_control("bench-local", "local", "generic"), 1),
+        ("update_repository_control", lambda: controls.update_repository_control("bench-local", {"description": "x"}), 1),
+        ("get_repository_config_control", lambda: controls.get_repository_config_control("bench-local"), 1),
+        ("get_storage_info_view", quiet(views.get_storage_info_view), size),
+        ("storage_analytics_view", quiet(views.storage_analytics_view), size),
+        ("list_users_view", quiet(views.list_users_view), size),
+        ("list_users_view[stream]", quiet(lambda: views.list_users_view(stream=True)), size),
+        ("list_repositories_view", quiet(views.list_repositories_view), size),
+        ("list_repositories_view[stream]", quiet(lambda: views.list_repositories_view(stream=True)), size),
+    ]
+
+
+def measure(func, iterations, max_seconds):
+    """
+    Calls func once to warm up, then up to iterations times or until
+    max_seconds have passed. Returns per-call durations in seconds.
+    """
+    func()
+    durations = []
+    deadline = time.perf_counter() + max_seconds
+    while len(durations) < iterations and (not durations or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summarize(durations, records):
+    ordered = sorted(durations)
+    total = sum(durations)
+    mean = total / len(durations)
+    return {
+        "calls": len(durations),
+        "mean_ms": mean * 1000,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "min_ms": ordered[0] * 1000,
+        "max_ms": ordered[-1] * 1000,
+        "calls_per_s": len(durations) / total if total else 0.0,
+        "records_per_s": records * len(durations) / total if total else 0.0,
+    }
+
+
+def run(sizes, iterations, max_seconds, latency, only=None):
+    results = []
+    for size in sizes:
+        server, base_url = start_mock_server(latency=latency, dataset_size=size)
+        controls.base_url = base_url
+        controls.token = "mock-token"
+        try:
+            for name, func, records in benchmarks(size):
+                if only and not any(pattern in name for pattern in only):
+                    continue
+                stats = summarize(measure(func, iterations, max_seconds), records)
+                results.append({"name": name, "size": size, **stats})
+                print(f"{name:<42}{size:>8}{stats['mean_ms']:>11.2f}{stats['p95_ms']:>11.2f}"
+                      f"{stats['calls_per_s']:>11.1f}{stats['records_per_s']:>14.0f}", file=sys.stderr)
+        finally:
+            client.close_session()
+            server.shutdown()
+            server.server_close()
+    return results
+
+
+def compare(results, baseline_path, threshold):
+    """
+    Returns the benchmarks whose mean latency regressed past threshold.
+    """
+    with open(baseline_path, encoding="utf-8") as handle:
+        baseline = {(entry["name"], entry["size"]): entry for entry in json.load(handle)["results"]}
+
+    regressions = []
+    for entry in results:
+        previous = baseline.get((entry["name"], entry["size"]))
+        if previous and previous["mean_ms"] > 0 and entry["mean_ms"] / previous["mean_ms"] > threshold:
+            regressions.append({"name": entry["name"], "size": entry["size"], "baseline_ms": previous["mean_ms"],
+                                "mean_ms": entry["mean_ms"], "ratio": entry["mean_ms"] / previous["mean_ms"]})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,1000,100000", help="Comma-separated dataset sizes")
+    parser.add_argument("--iterations", type=int, default=20, help="Maximum calls per benchmark")
+    parser.add_argument("--max-seconds", type=float, default=2.0, help="Time budget per benchmark")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server-side latency per request in seconds")
+    parser.add_argument("--only", help="Comma-separated substrings; run only matching benchmarks")
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against an earlier results file")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Allowed mean latency ratio (default: 1.25)")
+    args = parser.parse_args()
+
+    # Keep tokens and caches written by the controls away from the real cache folder
+    os.environ["ARTIFACTORY_CLI_CACHE_DIR"] = tempfile.mkdtemp(prefix="artifactory-cli-bench-")
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    only = args.only.split(",") if args.only else None
+
+    print(f"{'benchmark':<42}{'size':>8}{'mean ms':>11}{'p95 ms':>11}{'calls/s':>11}{'records/s':>14}",
+          file=sys.stderr)
+    results = run(sizes, args.iterations, args.max_seconds, args.latency, only)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "latency": args.latency,
+        "iterations": args.iterations,
+        "results": results,
+    }
+
+    if args.compare:
+        report["regressions"] = compare(results, args.compare, args.threshold)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    for regression in report.get("regressions", []):
+        print(f"REGRESSION {regression['name']} (size {regression['size']}): "
+              f"{regression['baseline_ms']:.2f} ms -> {regression['mean_ms']:.2f} ms "
+              f"({regression['ratio']:.2f}x)", file=sys.stderr)
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Compares the records of artifactory_cli.models with the raw JSON dicts they
+replace: memory held for a users listing and a storage summary, and the time
+to parse, filter and sort them.
+
+Usage:
+    python benchmarks/bench_models.py [--users 100000] [--repositories 5000] [--repeat 5]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from artifactory_cli.models import StorageInfo, User, parse_size
+from mock_server import make_repositories, make_storage_info, make_users
+
+
+def measure_memory(build):
+    # Bytes allocated by build() that are still alive while its result is held
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def best_time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--repositories", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Both sides start from the same response bodies, as the controls do
+    users_body = json.dumps(make_users(args.users))
+    storage_body = json.dumps(make_storage_info(make_repositories(args.repositories)))
+    dict_users = json.loads(users_body)
+    record_users = User.from_list(json.loads(users_body))
+    dict_storage = json.loads(storage_body)
+    record_storage = StorageInfo.from_json(json.loads(storage_body))
+
+    rows = [
+        ("users: memory", measure_memory(lambda: json.loads(users_body)),
+         measure_memory(lambda: User.from_list(json.loads(users_body))), "bytes"),
+        ("storage: memory", measure_memory(lambda: json.loads(storage_body)),
+         measure_memory(lambda: StorageInfo.from_json(json.loads(storage_body))), "bytes"),
+        ("users: parse", best_time(lambda: json.loads(users_body), args.repeat),
+         best_time(lambda: User.from_list(json.loads(users_body)), args.repeat), "s"),
+        ("users: filter by domain", best_time(
+            lambda: [user for user in dict_users
+                     if (user.get("email") or "").rsplit("@", 1)[-1].lower() == "example.com"], args.repeat),
+         best_time(lambda: [user for user in record_users if user.email_domain == "example.com"], args.repeat),
+         "s"),
+        ("users: sort by name", best_time(lambda: sorted(dict_users, key=lambda user: user.get("name", "")),
+                                          args.repeat),
+         best_time(lambda: sorted(record_users, key=lambda user: user.name), args.repeat), "s"),
+        ("storage: sort by bytes", best_time(
+            lambda: sorted(dict_storage["repositoriesSummaryList"],
+                           key=lambda repo: parse_size(repo.get("usedSpaceInBytes", repo.get("usedSpace")))),
+            args.repeat),
+         best_time(lambda: sorted(record_storage.repositories, key=lambda repo: repo.used_bytes), args.repeat),
+         "s"),
+    ]
+
+    print(f"{args.users:,} users, {args.repositories:,} repository summaries\n")
+    print(f"{'benchmark':<26}{'dicts':>14}{'records':>14}{'ratio':>8}")
+    for name, dicts, records, unit in rows:
+        if unit == "bytes":
+            print(f"{name:<26}{dicts / 1024 ** 2:>11.1f} MB{records / 1024 ** 2:>11.1f} MB{records / dicts:>8.2f}")
+        else:
+            print(f"{name:<26}{dicts * 1000:>11.1f} ms{records * 1000:>11.1f} ms{records / dicts:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares the old per-call requests.get path against the pooled session used
+by artifactory_cli.controls, using the local mock server.
+
+Usage:
+    python benchmarks/bench_session.py [--calls 500] [--latency 0.0]
+"""
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from artifactory_cli import client, controls
+from mock_server import start_mock_server
+
+
+def bench_per_call(base_url, calls):
+    url = f"{base_url}/artifactory/api/system/ping"
+    headers = {"Authorization": "Bearer mock-token"}
+    start = time.perf_counter()
+    for _ in range(calls):
+        response = requests.get(url, headers=headers)
+        response.raise_for_status()
+    return time.perf_counter() - start
+
+
+def bench_pooled(calls):
+    client.close_session()
+    start = time.perf_counter()
+    for _ in range(calls):
+        controls.ping_system_control()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.0, help="Server-side latency per request in seconds")
+    args = parser.parse_args()
+
+    server, base_url = start_mock_server(latency=args.latency)
+    controls.base_url = base_url
+    controls.token = "mock-token"
+
+    try:
+        per_call = bench_per_call(base_url, args.calls)
+        pooled = bench_pooled(args.calls)
+    finally:
+        client.close_session()
+        server.shutdown()
+
+    print(f"{'path':<12}{'total (s)':>12}{'per call (ms)':>16}")
+    print(f"{'per-call':<12}{per_call:>12.3f}{per_call / args.calls * 1000:>16.3f}")
+    print(f"{'pooled':<12}{pooled:>12.3f}{pooled / args.calls * 1000:>16.3f}")
+    print(f"speedup: {per_call / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measures the cold start of 'artifactory-cli ping' against the local mock
+server and fails if the median exceeds the budget or if the interactive
+menu dependencies get imported.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--budget 0.4]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import start_mock_server
+
+
+# Modules that must not be loaded by a scripted subcommand
+FORBIDDEN_MODULES = ("InquirerPy", "prompt_toolkit")
+
+
+def run_ping(base_url, extra_args=()):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    command = [sys.executable, *extra_args, "-m", "artifactory_cli.main", "ping", "--url", base_url, "--token", "mock-token"]
+    start = time.perf_counter()
+    result = subprocess.run(command, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise SystemExit(f"ping failed ({result.returncode}):\n{result.stdout}{result.stderr}")
+    return elapsed, result.stderr
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=0.4, help="Maximum median wall time in seconds")
+    args = parser.parse_args()
+
+    server, base_url = start_mock_server()
+    try:
+        _, import_log = run_ping(base_url, ("-X", "importtime"))
+        timings = [run_ping(base_url)[0] for _ in range(args.runs)]
+    finally:
+        server.shutdown()
+
+    loaded = sorted({
+        name for line in import_log.splitlines() if line.startswith("import time:")
+        for name in [line.rsplit("|", 1)[-1].strip()]
+        if name.split(".")[0] in FORBIDDEN_MODULES
+    })
+
+    median = statistics.median(timings)
+    print(f"runs:   {args.runs}")
+    print(f"min:    {min(timings) * 1000:.1f} ms")
+    print(f"median: {median * 1000:.1f} ms")
+    print(f"max:    {max(timings) * 1000:.1f} ms")
+    print(f"budget: {args.budget * 1000:.1f} ms")
+
+    failed = False
+    if loaded:
+        print(f"❌ Interactive-only modules imported: {', '.join(loaded[:5])}")
+        failed = True
+    if median > args.budget:
+        print("❌ Median cold start is over budget.")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("✅ Cold start within budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+"""
+Minimal in-process mock of the Artifactory REST API used by the benchmarks.
+
+Only the endpoints the CLI calls are implemented. Responses are canned and
+served over HTTP/1.1 so clients can keep connections alive. The make_*
+helpers generate listings of any size for the benchmarks.
+"""
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+PACKAGE_TYPES = ("maven", "npm", "pypi", "docker", "generic", "helm", "go", "nuget")
+REPO_TYPES = ("LOCAL", "REMOTE", "VIRTUAL")
+
+
+def make_users(count):
+    """
+    Generates a users listing with count entries.
+    """
+    return [
+        {"name": f"user-{index:06d}", "uri": f"http://localhost/artifactory/api/security/users/user-{index:06d}",
+         "realm": "internal", "email": f"user-{index:06d}@example.com", "admin": index % 50 == 0}
+        for index in range(count)
+    ]
+
+
+def make_repositories(count):
+    """
+    Generates a repositories listing with count entries of mixed types.
+    """
+    repositories = []
+    for index in range(count):
+        package_type = PACKAGE_TYPES[index % len(PACKAGE_TYPES)]
+        repo_type = REPO_TYPES[index % len(REPO_TYPES)]
+        repo = {"key": f"{package_type}-{repo_type.lower()}-{index:06d}", "type": repo_type,
+                "packageType": package_type, "description": f"Benchmark repository {index}",
+                "url": f"http://localhost/artifactory/{package_type}-{index:06d}"}
+        if repo_type == "REMOTE":
+            repo["url"] = f"https://registry.example.com/{package_type}/{index}"
+        repositories.append(repo)
+    return repositories
+
+
+def make_storage_info(repositories):
+    """
+    Generates a storage info payload with one summary row per repository.
+    """
+    rows = []
+    for index, repo in enumerate(repositories):
+        used = (index * 7919) % 50000 * 1024 * 1024
+        rows.append({"repoKey": repo["key"], "repoType": repo["type"], "packageType": repo["packageType"],
+                     "foldersCount": index % 300, "filesCount": index % 5000, "itemsCount": index % 5300,
+                     "usedSpace": f"{used / 1024 ** 3:.2f} GB", "usedSpaceInBytes": used,
+                     "percentage": f"{100 / max(len(repositories), 1):.2f}%"})
+    rows.append({"repoKey": "TOTAL", "repoType": "NA", "foldersCount": 0, "filesCount": 0,
+                 "usedSpace": "0 bytes", "itemsCount": 0})
+    return {
+        "binariesSummary": {"binariesCount": "1,024", "binariesSize": "12.3 GB", "artifactsSize": "15.1 GB",
+                            "optimization": "81.45%", "itemsCount": "2,048", "artifactsCount": "1,500"},
+        "fileStoreSummary": {"storageType": "file-system", "storageDirectory": "/var/opt/jfrog/artifactory/data"},
+        "repositoriesSummaryList": rows,
+    }
+
+
+def make_items(count, repo_key="generic-local", now=None):
+    """
+    Generates count file items of a repository for AQL queries, created over
+    the last two years, a third of them never downloaded.
+    """
+    now = time.time() if now is None else now
+    iso = lambda timestamp: time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(timestamp))
+    items = []
+    for index in range(count):
+        created = now - (index * 7919 % 730) * 86400
+        downloaded = None if index % 3 == 0 else created + (index * 104729 % 365) * 86400
+        items.append({"repo": repo_key, "path": f"com/example/lib-{index % 100:03d}/{index // 100}",
+                      "name": f"lib-{index:07d}.jar", "type": "file", "size": (index * 7877) % (64 * 1024 ** 2),
+                      "created": iso(created), "stats": [{"downloaded": iso(min(downloaded, now)) if downloaded else None}]})
+    return items
+
+
+def iter_generated_files(repo_key, count, shared_ratio=0.3, pool_size=10000):
+    """
+    Generates the deep file list of a repository on the fly. shared_ratio of
+    the files come from a pool of pool_size binaries that every repository
+    draws from, so they are duplicated across repositories; the rest are unique.
+    """
+    shared = int(shared_ratio * 100)
+    for index in range(count):
+        content = f"shared-{index % pool_size}" if index % 100 < shared else f"{repo_key}-{index}"
+        sha1 = hashlib.sha1(content.encode()).hexdigest()
+        yield {"uri": f"/dir-{index // 1000:04d}/file-{index:08d}.bin", "size": int(sha1[:6], 16) * 4,
+               "lastModified": "2025-01-01T00:00:00.000Z", "folder": False, "sha1": sha1, "sha2": ""}
+
+
+def make_repository_config(repo):
+    """
+    Generates the full configuration of a repository from its listing entry.
+    """
+    config = {"key": repo["key"], "rclass": repo["type"].lower(), "packageType": repo["packageType"],
+              "description": repo.get("description", ""), "notes": "", "includesPattern": "**/*",
+              "excludesPattern": "", "repoLayoutRef": "simple-default", "xrayIndex": False,
+              "properties": {"owner": "team-" + str(len(repo["key"]) % 7)}}
+    if repo["type"] == "REMOTE":
+        config.update({"url": repo["url"], "retrievalCachePeriodSecs": 7200, "offline": False})
+    elif repo["type"] == "VIRTUAL":
+        config.update({"repositories": [], "defaultDeploymentRepo": None})
+    return config
+
+
+class MockArtifactoryServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients that stop reading a streamed listing early reset the connection
+        if not isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            super().handle_error(request, client_address)
+
+
+class MockArtifactoryHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def parse_request(self):
+        if not super().parse_request():
+            return False
+
+        # Simulated throttling: reject requests beyond max_in_flight with 429
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            self._counted = True
+            throttled = server.max_in_flight is not None and server.in_flight > server.max_in_flight
+            if throttled:
+                server.throttled_count += 1
+        if throttled:
+            self.close_connection = True
+            body = b'{"errors": [{"status": 429, "message": "Too Many Requests"}]}'
+            self.send_response(429)
+            self.send_header("Retry-After", str(server.retry_after))
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(body)
+            return False
+        return True
+
+    def handle_one_request(self):
+        self._counted = False
+        try:
+            super().handle_one_request()
+        finally:
+            if self._counted:
+                with self.server.lock:
+                    self.server.in_flight -= 1
+
+    def _send(self, status, body=b"", content_type="application/json", etag=None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+        elif isinstance(body, str):
+            body = body.encode()
+
+        self.server.request_count += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if self.command == "GET" and status == 200:
+            etag = etag or '"%s"' % hashlib.sha1(body).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                status, body = 304, b""
+
+        else:
+            etag = None
+
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_dataset(self, name):
+        # Large listings are encoded once and reused until the dataset is replaced
+        dataset = getattr(self.server, name)
+        cached = self.server.encoded.get(name)
+        if cached is None or cached[0] is not dataset or cached[1] != len(dataset):
+            body = json.dumps(dataset).encode()
+            cached = (dataset, len(dataset), body, '"%s"' % hashlib.sha1(body).hexdigest())
+            self.server.encoded[name] = cached
+        self._send(200, cached[2], etag=cached[3])
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+
+        if path == "/artifactory/api/system/ping":
+            self._send(200, "OK", content_type="text/plain")
+        elif path == "/artifactory/api/system/version":
+            self._send(200, {"version": "7.0.0", "revision": "70000000", "addons": ["build", "docker"]})
+        elif path == "/artifactory/api/users":
+            self._send_dataset("users")
+        elif path == "/artifactory/api/repositories":
+            query = parse_qs(urlparse(self.path).query)
+            if "type" not in query and "packageType" not in query:
+                self._send_dataset("repositories")
+                return
+            repositories = self.server.repositories
+            if "type" in query:
+                repositories = [r for r in repositories if r.get("type", "").lower() == query["type"][0]]
+            if "packageType" in query:
+                repositories = [r for r in repositories if r.get("packageType", "").lower() == query["packageType"][0]]
+            self._send(200, repositories)
+        elif path.startswith("/artifactory/api/repositories/"):
+            self._send_repository_config(path[len("/artifactory/api/repositories/"):])
+        elif path == "/artifactory/api/storageinfo":
+            self._send_dataset("storage_info")
+        elif path.startswith("/artifactory/api/storage/") and "list" in parse_qs(urlparse(self.path).query, True):
+            self._send_file_list(path)
+        elif path.startswith("/artifactory/api/storage/"):
+            self._send_artifact_info(path)
+        elif path in self.server.artifacts:
+            self._send_artifact(self.server.artifacts[path]["data"])
+        else:
+            self._send(404, {"errors": [{"status": 404, "message": "Not Found"}]})
+
+    def _repository_config(self, key):
+        # Configs written by PUT/POST win over the ones generated from the listing
+        with self.server.lock:
+            if key in self.server.configs:
+                return self.server.configs[key]
+            if self.server.repo_index[0] is not self.server.repositories:
+                self.server.repo_index = (self.server.repositories,
+                                          {repo["key"]: repo for repo in self.server.repositories})
+            repo = self.server.repo_index[1].get(key)
+        return make_repository_config(repo) if repo else None
+
+    def _send_repository_config(self, key):
+        config = self._repository_config(key)
+        if config is None:
+            self._send(400, {"errors": [{"status": 400, "message": f"Repository {key} not found"}]})
+        else:
+            self._send(200, config)
+
+    def _send_artifact_info(self, path):
+        repo_path = "/artifactory/" + path[len("/artifactory/api/storage/"):]
+        artifact = self.server.artifacts.get(repo_path)
+        if artifact is None:
+            self._send(404, {"errors": [{"status": 404, "message": "Unable to find item"}]})
+            return
+        self._send(200, {
+            "path": repo_path,
+            "size": str(artifact["size"]),
+            "checksums": {key: artifact[key] for key in ("sha1", "sha256", "md5")},
+        })
+
+    def _send_generated_file_list(self, path, files):
+        # Streamed while generated, so lists of millions of files never sit in memory
+        self.server.request_count += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        self.wfile.write(f'{{"uri": "http://localhost{path}", "files": ['.encode())
+        chunk = []
+        for index, entry in enumerate(files):
+            chunk.append(("," if index else "") + json.dumps(entry))
+            if len(chunk) == 1000:
+                self.wfile.write("".join(chunk).encode())
+                chunk = []
+        self.wfile.write(("".join(chunk) + "]}").encode())
+
+    def _send_file_list(self, path):
+        repo_key = path[len("/artifactory/api/storage/"):].strip("/")
+        if repo_key in self.server.file_lists:
+            self._send_generated_file_list(path, iter_generated_files(repo_key, **self.server.file_lists[repo_key]))
+            return
+        folder = "/artifactory/" + path[len("/artifactory/api/storage/"):].rstrip("/") + "/"
+        files = [
+            {"uri": "/" + name[len(folder):], "size": artifact["size"], "lastModified": "2025-01-01T00:00:00.000Z",
+             "folder": False, "sha1": artifact["sha1"], "sha2": artifact["sha256"]}
+            for name, artifact in sorted(self.server.artifacts.items()) if name.startswith(folder)
+        ]
+        # Like Artifactory, a folder below the repository root only exists while it holds files,
+        # and a repository that is not configured has no file list at all
+        if not files and ("/" in repo_key or self._repository_config(repo_key) is None):
+            self._send(404, {"errors": [{"status": 404, "message": "Unable to find item"}]})
+            return
+        self._send(200, {"uri": f"http://localhost{path}", "created": "2025-01-01T00:00:00.000Z", "files": files})
+
+    def _send_artifact(self, data):
+        match = re.match(r"bytes=(\d+)-(\d*)$", self.headers.get("Range", ""))
+        if not match:
+            self._send(200, data, content_type="application/octet-stream")
+            return
+
+        start = int(match.group(1))
+        end = min(int(match.group(2) or len(data) - 1), len(data) - 1)
+        self.server.request_count += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(206)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        self.wfile.write(data[start:end + 1])
+
+    def _send_aql(self, query):
+        # Understands find() on "repo", include(), offset() and limit(); enough for paging tests
+        find = re.search(r"find\((.*?)\)(?:\.|$)", query, re.S)
+        criteria = json.loads(find.group(1) or "{}") if find else {}
+        include = re.findall(r'"([^"]+)"', (re.search(r"\.include\((.*?)\)", query) or [None, ""])[1])
+        offset = int((re.search(r"\.offset\((\d+)\)", query) or [None, 0])[1])
+        limit = re.search(r"\.limit\((\d+)\)", query)
+
+        deleted = self.server.deleted_items
+        items = [item for item in self.server.items if all(item.get(k) == v for k, v in criteria.items()
+                                                            if isinstance(v, str))
+                 and (not deleted or f"/artifactory/{item.get('repo')}/{item.get('path')}/{item.get('name')}"
+                      not in deleted)]
+        total = len(items)
+        items = items[offset:offset + int(limit.group(1)) if limit else None]
+        if include:
+            # stat.* fields come back as a "stats" list, like on a real server
+            fields = [field for field in include if not field.startswith("stat.")]
+            stats = len(fields) < len(include)
+            items = [dict({field: item.get(field) for field in fields}, **({"stats": item.get("stats", [])}
+                                                                          if stats else {})) for item in items]
+        self._send(200, {"results": items,
+                         "range": {"start_pos": offset, "end_pos": offset + len(items), "total": total}})
+
+    def do_POST(self):
+        body = self._read_body()
+        path = self.path.split("?", 1)[0]
+
+        if path == "/artifactory/api/search/aql":
+            self._send_aql(body.decode())
+        elif path == "/access/api/v1/tokens":
+            self._send(200, {"access_token": "mock-token", "expires_in": 18000, "token_type": "Bearer"})
+        elif path == "/access/api/v2/users":
+            self._send(201)
+        elif path.startswith("/artifactory/api/repositories/"):
+            key = path[len("/artifactory/api/repositories/"):]
+            config = self._repository_config(key)
+            if config is None:
+                self._send(400, {"errors": [{"status": 400, "message": f"Repository {key} not found"}]})
+                return
+            with self.server.lock:
+                self.server.configs[key] = dict(config, **json.loads(body or b"{}"))
+            self._send(200)
+        else:
+            self._send(404)
+
+    def do_PUT(self):
+        path = self.path.split("?", 1)[0]
+
+        if path.startswith("/artifactory/api/repositories/"):
+            key = path[len("/artifactory/api/repositories/"):]
+            config = dict(json.loads(self._read_body() or b"{}"), key=key)
+            exists = self._repository_config(key) is not None
+            with self.server.lock:
+                if not exists:
+                    self.server.repositories.append({
+                        "key": key, "type": str(config.get("rclass", "local")).upper(),
+                        "packageType": config.get("packageType", "generic"), "url": config.get("url", ""),
+                        "description": config.get("description", ""),
+                    })
+                self.server.configs[key] = config
+            self._send(200)
+        elif path.startswith("/artifactory/"):
+            if self.headers.get("X-Checksum-Deploy", "").lower() == "true":
+                sha1 = self.headers.get("X-Checksum-Sha1")
+                known = next((a for a in self.server.artifacts.values() if a["sha1"] == sha1), None)
+                if known is None:
+                    self._send(404, {"errors": [{"status": 404, "message": "Checksum deploy failed"}]})
+                    return
+                self.server.artifacts[path] = dict(known)
+            else:
+                body = self._read_body()
+                self.server.artifacts[path] = {
+                    "sha1": hashlib.sha1(body).hexdigest(),
+                    "sha256": hashlib.sha256(body).hexdigest(),
+                    "md5": hashlib.md5(body).hexdigest(),
+                    "size": len(body),
+                    "data": body,
+                }
+            self._send(201, {"path": path})
+        else:
+            self._send(404)
+
+    def do_DELETE(self):
+        path = self.path.split("?", 1)[0]
+        if path.startswith("/access/api/v2/users/"):
+            self._send(204)
+        elif path in self.server.artifacts:
+            del self.server.artifacts[path]
+            self._send(204)
+        elif path not in self.server.deleted_items and path in self._item_paths():
+            with self.server.lock:
+                self.server.deleted_items.add(path)
+            self._send(204)
+        else:
+            self._send(404)
+
+    def _item_paths(self):
+        # Artifact paths of the AQL items, built once per items list
+        with self.server.lock:
+            if self.server.item_paths[0] is not self.server.items:
+                self.server.item_paths = (self.server.items, {
+                    f"/artifactory/{item.get('repo')}/{item.get('path')}/{item.get('name')}"
+                    for item in self.server.items})
+            return self.server.item_paths[1]
+
+
+def start_mock_server(latency=0.0, users=None, repositories=None, storage_info=None, items=None, dataset_size=None,
+                      max_in_flight=None, retry_after=1, file_lists=None):
+    """
+    Starts the mock server on a free localhost port in a background thread.
+
+    Args:
+        latency (float): Seconds to sleep before every response.
+        users (list): Payload for the users listing.
+        repositories (list): Payload for the repositories listing.
+        storage_info (dict): Payload for the storage info endpoint.
+        items (list): Item rows searched by AQL queries.
+        dataset_size (int): Generate users, repositories and storage info of
+            this size for any payload not given explicitly.
+        max_in_flight (int): Answer 429 to requests beyond this many concurrent ones.
+        retry_after (float): Retry-After value sent with those 429 responses.
+        file_lists (dict): {repo_key: iter_generated_files keyword arguments},
+            e.g. {"libs-local": {"count": 100000}}, for generated deep file lists.
+
+    Returns:
+        tuple: (server, base_url). Call server.shutdown() when done.
+    """
+    if dataset_size is not None:
+        users = users if users is not None else make_users(dataset_size)
+        repositories = repositories if repositories is not None else make_repositories(dataset_size)
+        storage_info = storage_info if storage_info is not None else make_storage_info(repositories)
+
+    server = MockArtifactoryServer(("127.0.0.1", 0), MockArtifactoryHandler)
+    server.latency = latency
+    server.artifacts = {}
+    server.configs = {}
+    server.repo_index = (None, {})
+    server.encoded = {}
+    server.request_count = 0
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.max_in_flight = max_in_flight
+    server.retry_after = retry_after
+    server.throttled_count = 0
+    server.users = users or []
+    server.repositories = repositories or []
+    server.storage_info = storage_info or {}
+    server.items = items or []
+    server.deleted_items = set()
+    server.file_lists = file_lists or {}
+    server.item_paths = (None, set())
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    host, port = server.server_address
+    return server, f"http://{host}:{port}"
@@ -10,6 +10,9 @@ setup(
         "requests",
         "InquirerPy"
     ],
+    extras_require={
+        "yaml": ["PyYAML"],
+    },
     entry_points={
         'console_scripts': [
             'artifactory-cli=artifactory_cli.main:main',